@@ -17,6 +17,7 @@ from app.ai import (
     get_claude_provider,
     # Analyzer functions
     ai_filter_and_score,
+    ai_filter_and_score_batch,
     analyze_job,
     generate_cover_letter,
     generate_interview_answer,
@@ -31,6 +32,7 @@ __all__ = [
     'get_claude_provider',
     # Analyzer functions
     'ai_filter_and_score',
+    'ai_filter_and_score_batch',
     'analyze_job',
     'generate_cover_letter',
     'generate_interview_answer',
@@ -11,7 +11,7 @@ from flask import Flask
 from flask_cors import CORS
 
 from app.config import get_config
-from app.database import init_db
+from app.database import close_db, init_db
 
 logger = logging.getLogger(__name__)
 
@@ -59,8 +59,9 @@ def create_app(config_path=None):
     # Store config in app
     app.config["HAMMY_CONFIG"] = config
 
-    # Initialize database
+    # Initialize database; the per-request connection is closed at teardown
     init_db()
+    app.teardown_appcontext(close_db)
 
     # Register blueprints/routes
     # Note: routes.py handles frontend serving
@@ -33,6 +33,7 @@ from .gemini_provider import GeminiProvider, get_gemini_provider
 from .factory import get_provider, get_available_providers, get_provider_info
 from .analyzer import (
     ai_filter_and_score,
+    ai_filter_and_score_batch,
     analyze_job,
     generate_cover_letter,
     generate_interview_answer,
@@ -58,6 +59,7 @@ __all__ = [
     "get_provider_info",
     # Analyzer functions
     "ai_filter_and_score",
+    "ai_filter_and_score_batch",
     "analyze_job",
     "generate_cover_letter",
     "generate_interview_answer",
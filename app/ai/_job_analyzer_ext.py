@@ -0,0 +1,228 @@
+"""
+Job Analyzer hot loops - experience requirement extraction
+
+This module holds the match post-processing behind
+``job_analyzer.extract_experience_requirements``. It is fully type-annotated
+and avoids dynamic features so it can be compiled to a C extension with mypyc:
+
+    mypyc app/ai/_job_analyzer_ext.py
+
+When the compiled extension is present Python imports it in preference to
+this file; otherwise the pure-Python version below is used unchanged.
+"""
+
+import re
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Set, Tuple
+
+# "Python: 3+ years" or "Python - 3 years". Trying the lazy skill group at every
+# letter made this the costliest experience pattern, so collect_experience_requirements
+# runs _scan_skill_colon_years instead, which finds the same matches from the
+# rare ": N years" anchors. The regex stays as the reference definition.
+SKILL_COLON_YEARS_PATTERN: Pattern[str] = re.compile(
+    r"([a-zA-Z0-9\s\.\+\#\/]{1,60}?)[\:\-]\s*(\d+)\+?\s*(?:years?|yrs?)"
+)
+_COLON_YEARS_ANCHOR: Pattern[str] = re.compile(r"[\:\-]\s*(\d+)\+?\s*(?:years?|yrs?)")
+_SKILL_RUN_BEFORE_ANCHOR: Pattern[str] = re.compile(r"[a-zA-Z0-9\s\.\+\#\/]+\Z")
+_MAX_SKILL_RUN = 60
+
+# Patterns to match experience requirements. Lazy skill groups are capped at 60
+# chars (longer skills are discarded anyway) so a long unpunctuated run of text
+# cannot make the scan quadratic.
+EXPERIENCE_PATTERNS: List[Pattern[str]] = [
+    # "3+ years of Python" or "3+ years Python"
+    re.compile(
+        r"(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience\s+(?:with|in)\s+)?([a-zA-Z0-9\s\.\+\#\/\-]{1,60}?)(?:\s+experience|\s+development|\s+programming)?(?:[,\.]|\s+and|\s+or|$)"
+    ),
+    # "3-5 years of Python"
+    re.compile(
+        r"(\d+)\s*[-–]\s*(\d+)\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience\s+(?:with|in)\s+)?([a-zA-Z0-9\s\.\+\#\/\-]{1,60}?)(?:\s+experience|\s+development)?(?:[,\.]|\s+and|\s+or|$)"
+    ),
+    # "experience with Python (3+ years)"
+    re.compile(
+        r"(?:experience\s+(?:with|in)\s+)([a-zA-Z0-9\s\.\+\#\/\-]{1,60}?)\s*\((\d+)\+?\s*(?:years?|yrs?)\)"
+    ),
+    SKILL_COLON_YEARS_PATTERN,
+    # "minimum 3 years of Python"
+    re.compile(
+        r"(?:minimum|min|at\s+least)\s+(\d+)\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience\s+(?:with|in)\s+)?([a-zA-Z0-9\s\.\+\#\/\-]+)"
+    ),
+]
+
+# General experience requirements (years of software/industry/relevant experience)
+GENERAL_EXPERIENCE_PATTERNS: List[Tuple[Pattern[str], str]] = [
+    (
+        re.compile(
+            r"(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:professional\s+)?(?:software|engineering|development)\s+experience"
+        ),
+        "Software Development",
+    ),
+    (
+        re.compile(
+            r"(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:professional\s+)?(?:industry|work)\s+experience"
+        ),
+        "Professional Experience",
+    ),
+    (
+        re.compile(r"(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:relevant|related)\s+experience"),
+        "Relevant Experience",
+    ),
+]
+
+# Common non-skill words captured by the loose skill groups above
+SKIP_WORDS: Set[str] = {
+    "experience",
+    "required",
+    "preferred",
+    "minimum",
+    "years",
+    "the",
+    "and",
+    "or",
+    "with",
+    "in",
+    "of",
+    "for",
+    "a",
+    "an",
+    "role",
+    "position",
+    "job",
+    "work",
+    "working",
+    "related",
+}
+
+
+def _parse_groups(groups: Tuple[Any, ...]) -> Optional[Tuple[str, int, Optional[int]]]:
+    """
+    Normalize the groups of an experience pattern match.
+
+    Args:
+        groups: ``match.groups()`` from one of EXPERIENCE_PATTERNS
+
+    Returns:
+        Tuple of (skill, years_min, years_max), or None if the shape is unknown
+    """
+    skill: str
+    years_min: int
+    years_max: Optional[int] = None
+
+    if len(groups) == 2:
+        if groups[0].isdigit():
+            # Pattern with years first, then skill
+            years_min = int(groups[0])
+            skill = groups[1]
+        else:
+            # Pattern with skill first, then years
+            skill = groups[0]
+            years_min = int(groups[1])
+    elif len(groups) == 3:
+        if groups[0].isdigit() and groups[1].isdigit():
+            # Range pattern: min-max years skill
+            years_min = int(groups[0])
+            years_max = int(groups[1])
+            skill = groups[2]
+        else:
+            # skill (years) pattern
+            skill = groups[0]
+            years_min = int(groups[1])
+    else:
+        return None
+
+    return skill, years_min, years_max
+
+
+def _scan_skill_colon_years(text: str) -> Iterator[Tuple[Tuple[Any, ...], str]]:
+    """
+    Yield (groups, matched text) for SKILL_COLON_YEARS_PATTERN.finditer(text).
+
+    The skill characters exclude ":" and "-", so a match must end its skill run
+    right at a ": N years" anchor and starts at the leftmost point of that run
+    within 60 characters and after the previous match.
+    """
+    previous_end: int = 0
+    for anchor in _COLON_YEARS_ANCHOR.finditer(text):
+        anchor_start: int = anchor.start()
+        skill_run = _SKILL_RUN_BEFORE_ANCHOR.search(
+            text, max(previous_end, anchor_start - _MAX_SKILL_RUN), anchor_start
+        )
+        if skill_run is None:
+            continue
+        start: int = skill_run.start()
+        previous_end = anchor.end()
+        yield (text[start:anchor_start], anchor.group(1)), text[start:previous_end]
+
+
+def collect_experience_requirements(text: str) -> List[Dict[str, Any]]:
+    """
+    Run the experience patterns over lowercased job description text.
+
+    Args:
+        text: Lowercased job description
+
+    Returns:
+        Unsorted list of requirement dicts (skill, years_min, years_max, raw_text)
+    """
+    requirements: List[Dict[str, Any]] = []
+    seen_skills: Set[str] = set()
+
+    # Every pattern needs a "year(s)"/"yr(s)" token; one substring check skips eight scans
+    if "yr" not in text and "year" not in text:
+        return requirements
+
+    matches: Iterator[Tuple[Tuple[Any, ...], str]]
+    for pattern in EXPERIENCE_PATTERNS:
+        if pattern is SKILL_COLON_YEARS_PATTERN:
+            matches = _scan_skill_colon_years(text)
+        else:
+            matches = ((match.groups(), match.group(0)) for match in pattern.finditer(text))
+
+        for groups, matched_text in matches:
+            parsed = _parse_groups(groups)
+            if parsed is None:
+                continue
+            skill, years_min, years_max = parsed
+
+            # Clean up skill name
+            skill = skill.strip().strip(".,;:")
+
+            # Skip if skill is too short or too long
+            skill_len: int = len(skill)
+            if skill_len < 2 or skill_len > 50:
+                continue
+
+            # Skip common non-skill words and duplicates (text is already lowercased)
+            skill_key: str = skill.strip()
+            if skill_key in SKIP_WORDS or skill_key in seen_skills:
+                continue
+            seen_skills.add(skill_key)
+
+            requirements.append(
+                {
+                    "skill": skill.title() if skill_len > 3 else skill.upper(),
+                    "years_min": years_min,
+                    "years_max": years_max,
+                    "raw_text": matched_text.strip()[:100],
+                }
+            )
+
+    # Each general pattern ends in "experience"; without it none can match
+    general_patterns: List[Tuple[Pattern[str], str]] = (
+        GENERAL_EXPERIENCE_PATTERNS if "experience" in text else []
+    )
+    for general_pattern, skill_name in general_patterns:
+        general_match = general_pattern.search(text)
+        if general_match:
+            general_key: str = skill_name.lower()
+            if general_key not in seen_skills:
+                seen_skills.add(general_key)
+                requirements.append(
+                    {
+                        "skill": skill_name,
+                        "years_min": int(general_match.group(1)),
+                        "years_max": None,
+                        "raw_text": general_match.group(0).strip()[:100],
+                    }
+                )
+
+    return requirements
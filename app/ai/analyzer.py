@@ -8,9 +8,12 @@ All AI calls are wrapped with retry logic and rate limiting for production relia
 """
 
 import logging
-from typing import Any, Dict, Optional, Tuple
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from .factory import get_provider
+from .job_analyzer import _fit_skill_mask
 from app.resilience import retry_with_backoff, APIRateLimiters, RetryError
 from app.logging_config import get_logger
 
@@ -24,6 +27,23 @@ AI_RETRYABLE_EXCEPTIONS = (
     Exception,  # Catch API errors generically
 )
 
+# Obvious non-software roles (save API credits)
+_NON_SOFTWARE_TITLE_PATTERNS = [
+    r"\b(mechanical|civil|electrical|chemical|structural|hardware)\s+engineer",
+    r"\b(hvac|plumbing|construction|architect|nurse|physician|dental)",
+    r"\b(sales|account\s+executive|business\s+development|recruiter)",
+    r"\b(game\s+designer|level\s+designer|3d\s+artist|animator)",
+    r"\b(teacher|professor|instructor|tutor)",
+    r"\b(lawyer|attorney|paralegal|legal\s+assistant)",
+    r"\b(accountant|cpa|bookkeeper|auditor)",
+    r"\b(benefits\s+representative|insurance\s+agent)",
+]
+# Any of them rejects the job the same way, so they are searched as one alternation
+_NON_SOFTWARE_TITLE_RE = re.compile("|".join(_NON_SOFTWARE_TITLE_PATTERNS))
+
+# Malformed titles (e.g., "Senior at Cloud Engineer Teradata")
+_MALFORMED_TITLE_RE = re.compile(r"^(senior|junior|mid|lead|staff|principal)\s+at\s+")
+
 
 def quick_pre_filter(job: Dict) -> Optional[Tuple[bool, int, str]]:
     """
@@ -32,8 +52,6 @@ def quick_pre_filter(job: Dict) -> Optional[Tuple[bool, int, str]]:
     Returns:
         None if job should go to AI scoring, or (False, score, reason) to reject.
     """
-    import re
-
     title = (job.get("title") or "").lower().strip()
     company = (job.get("company") or "").lower().strip()
     raw_text = (job.get("raw_text") or "").lower()
@@ -49,32 +67,60 @@ def quick_pre_filter(job: Dict) -> Optional[Tuple[bool, int, str]]:
         return (False, 15, "rejected: placeholder title from cold application")
 
     # Reject obvious non-software roles (save API credits)
-    non_software_patterns = [
-        r"\b(mechanical|civil|electrical|chemical|structural|hardware)\s+engineer",
-        r"\b(hvac|plumbing|construction|architect|nurse|physician|dental)",
-        r"\b(sales|account\s+executive|business\s+development|recruiter)",
-        r"\b(game\s+designer|level\s+designer|3d\s+artist|animator)",
-        r"\b(teacher|professor|instructor|tutor)",
-        r"\b(lawyer|attorney|paralegal|legal\s+assistant)",
-        r"\b(accountant|cpa|bookkeeper|auditor)",
-        r"\b(benefits\s+representative|insurance\s+agent)",
-    ]
-
-    for pattern in non_software_patterns:
-        if re.search(pattern, title):
-            return (False, 5, f"rejected: non-software role detected in title")
+    if _NON_SOFTWARE_TITLE_RE.search(title):
+        return (False, 5, f"rejected: non-software role detected in title")
 
     # Reject obvious aggregator spam
     if "jobs via dice" in title or "via linkedin" in title:
         return (False, 10, "rejected: aggregator placeholder listing")
 
-    # Check for malformed titles (e.g., "Senior at Cloud Engineer Teradata")
-    if re.match(r"^(senior|junior|mid|lead|staff|principal)\s+at\s+", title):
+    # Check for malformed titles
+    if _MALFORMED_TITLE_RE.match(title):
         return (False, 15, "rejected: malformed title structure")
 
     return None  # Proceed to AI scoring
 
 
+@lru_cache(maxsize=8)
+def _exclude_keywords_re(exclude_keywords: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Compile the configured title exclude keywords into one case-insensitive
+    alternation (None if empty).
+
+    Keywords match as whole words, so "VP" does not reject "VPN Engineer" and
+    "intern" does not reject "Internal Tools Engineer".
+    """
+    keywords = sorted({keyword.strip().lower() for keyword in exclude_keywords} - {""})
+    if not keywords:
+        return None
+    return re.compile(
+        "|".join(rf"(?<!\w){re.escape(keyword)}(?!\w)" for keyword in keywords), re.IGNORECASE
+    )
+
+
+def exclude_keyword_filter(
+    job: Dict, exclude_keywords: List[str]
+) -> Optional[Tuple[bool, int, str]]:
+    """
+    Reject jobs whose title contains a configured exclude keyword, without the AI.
+
+    The filter_and_score prompt tells the model to auto-reject these titles; a
+    whole-word test gives the same answer for free.
+
+    Returns:
+        None if job should go to AI scoring, or (False, score, reason) to reject.
+    """
+    pattern = _exclude_keywords_re(tuple(exclude_keywords or ()))
+    if pattern is None:
+        return None
+
+    match = pattern.search(job.get("title") or "")
+    if match:
+        keyword = match.group(0).lower()
+        return (False, 10, f"rejected: title contains excluded keyword '{keyword}'")
+    return None
+
+
 def ai_filter_and_score(job: Dict, resume_text: str) -> Tuple[bool, int, str]:
     """
     AI-based job filtering and baseline scoring.
@@ -91,16 +137,10 @@ def ai_filter_and_score(job: Dict, resume_text: str) -> Tuple[bool, int, str]:
     if pre_filter_result is not None:
         return pre_filter_result
 
-    from app.config import get_config
-
-    config = get_config()
-
-    # Build preferences dict for the new interface
-    preferences = {
-        "location_filter": config.get_location_filter_prompt(),
-        "experience_level": config.experience_level,
-        "exclude_keywords": config.exclude_keywords,
-    }
+    preferences = _filter_preferences()
+    excluded_result = exclude_keyword_filter(job, preferences["exclude_keywords"])
+    if excluded_result is not None:
+        return excluded_result
 
     @retry_with_backoff(
         max_retries=3,
@@ -122,7 +162,146 @@ def ai_filter_and_score(job: Dict, resume_text: str) -> Tuple[bool, int, str]:
         # Return safe defaults on failure
         return (True, 50, f"Scoring failed: {e.last_exception}")
 
-    # Convert dict result to tuple for backwards compatibility
+    return _filter_result_tuple(result)
+
+
+# Jobs scored per AI call by ai_filter_and_score_batch
+FILTER_BATCH_SIZE = 8
+
+
+def ai_filter_and_score_batch(
+    jobs: List[Dict], resume_text: str, batch_size: int = FILTER_BATCH_SIZE
+) -> List[Tuple[bool, int, str]]:
+    """
+    AI-based filtering and baseline scoring for many jobs, several per AI call.
+
+    Jobs rejected by quick_pre_filter or exclude_keyword_filter never reach the
+    AI, and postings with the same company, title and location are scored once
+    and share the result. The rest are grouped by tech stack and sent batch_size
+    at a time, so the rubric and resume are not repeated for every job.
+
+    Args:
+        jobs: Job dictionaries with title, company, location, and raw_text
+        resume_text: Combined text from all user's resumes
+        batch_size: Maximum jobs per AI call
+
+    Returns:
+        List of (should_keep, baseline_score, reason) tuples, one per job in order
+    """
+    results: List[Optional[Tuple[bool, int, str]]] = [None] * len(jobs)
+    if not jobs:
+        return results
+
+    preferences = _filter_preferences()
+    pending = []
+    # The same posting often arrives from several alert sources; score it once
+    first_index: Dict[Tuple[str, str, str], int] = {}
+    duplicate_of: Dict[int, int] = {}
+    for index, job in enumerate(jobs):
+        pre_filter_result = quick_pre_filter(job) or exclude_keyword_filter(
+            job, preferences["exclude_keywords"]
+        )
+        if pre_filter_result is not None:
+            results[index] = pre_filter_result
+            continue
+
+        key = _posting_key(job)
+        if key in first_index:
+            duplicate_of[index] = first_index[key]
+        else:
+            first_index[key] = index
+            pending.append(index)
+
+    if not pending:
+        return results
+
+    for batch_indexes in _group_similar_jobs(jobs, pending, batch_size):
+        batch_jobs = [jobs[index] for index in batch_indexes]
+
+        @retry_with_backoff(
+            max_retries=3,
+            base_delay=2.0,
+            retryable_exceptions=AI_RETRYABLE_EXCEPTIONS,
+            on_retry=lambda e, attempt: logger.warning(
+                f"Retry {attempt}/3 for filter_and_score_batch on {len(batch_jobs)} jobs: {e}"
+            ),
+        )
+        def _call_with_retry():
+            APIRateLimiters.claude.acquire(timeout=30)
+            provider = get_provider()
+            return provider.filter_and_score_batch(batch_jobs, resume_text, preferences)
+
+        try:
+            batch_results = [_filter_result_tuple(result) for result in _call_with_retry()]
+        except RetryError as e:
+            logger.error(f"AI filter_and_score_batch failed after retries: {e}")
+            batch_results = [(True, 50, f"Scoring failed: {e.last_exception}")] * len(batch_jobs)
+
+        for index, result in zip(batch_indexes, batch_results):
+            results[index] = result
+
+    for index, original_index in duplicate_of.items():
+        results[index] = results[original_index]
+
+    return results
+
+
+def _group_similar_jobs(jobs: List[Dict], indexes: List[int], batch_size: int) -> List[List[int]]:
+    """
+    Split job indexes into batches of jobs with similar tech stacks.
+
+    Each batch starts from the earliest job not yet placed and is filled with the
+    remaining jobs whose skill sets overlap it most (Jaccard similarity of the
+    fit skill bitmasks), so a batched prompt compares like with like. Ties keep
+    scan order, and jobs without recognized skills are batched in scan order.
+    """
+    masks = {}
+    for index in indexes:
+        job = jobs[index]
+        description = (job.get("raw_text") or "")[:1500]
+        masks[index] = _fit_skill_mask(f"{job.get('title') or ''}\n{description}".lower())
+
+    def similarity(seed_mask: int, index: int) -> float:
+        union = (seed_mask | masks[index]).bit_count()
+        return (seed_mask & masks[index]).bit_count() / union if union else 0.0
+
+    batches = []
+    remaining = list(indexes)
+    while remaining:
+        seed = remaining.pop(0)
+        if masks[seed]:
+            closest = sorted(remaining, key=lambda index: -similarity(masks[seed], index))
+            members = set(closest[: batch_size - 1])
+        else:
+            members = set(remaining[: batch_size - 1])
+        batches.append([seed] + [index for index in remaining if index in members])
+        remaining = [index for index in remaining if index not in members]
+    return batches
+
+
+def _posting_key(job: Dict) -> Tuple[str, str, str]:
+    """Case- and whitespace-insensitive (company, title, location) identifying a posting."""
+    return tuple(
+        " ".join(str(job.get(field) or "").lower().split())
+        for field in ("company", "title", "location")
+    )
+
+
+def _filter_preferences() -> Dict[str, Any]:
+    """Build the filter_and_score preferences dict from the app config."""
+    from app.config import get_config
+
+    config = get_config()
+
+    return {
+        "location_filter": config.get_location_filter_prompt(),
+        "experience_level": config.experience_level,
+        "exclude_keywords": config.exclude_keywords,
+    }
+
+
+def _filter_result_tuple(result: Dict[str, Any]) -> Tuple[bool, int, str]:
+    """Convert a filter_and_score dict to the (keep, score, reason) tuple callers expect."""
     return (
         result.get("keep", False),
         result.get("baseline_score", 50),
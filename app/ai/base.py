@@ -10,10 +10,16 @@ import json
 import logging
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .prompts import build_filter_and_score_batch_prompt
+from .response_cache import prompt_cache_key, response_cache
 
 logger = logging.getLogger(__name__)
 
+# Response tokens allowed per job in a batched filter_and_score call
+FILTER_BATCH_TOKENS_PER_JOB = 300
+
 
 class AIProvider(ABC):
     """
@@ -95,6 +101,55 @@ class AIProvider(ABC):
         """
         pass
 
+    def filter_and_score_batch(
+        self, jobs: List[Dict[str, Any]], resume_text: str, preferences: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Filter and score several jobs with a single AI call.
+
+        The rubric and resume are sent once for the whole batch. If the reply is not
+        a JSON array with one object per job in order, each job falls back to
+        filter_and_score.
+
+        Args:
+            jobs: Job dictionaries (same fields as filter_and_score's job_data)
+            resume_text: Combined text from all user's resumes
+            preferences: User preferences (same as filter_and_score)
+
+        Returns:
+            list[dict]: One filter_and_score result per job, in the same order
+        """
+        if len(jobs) <= 1:
+            return [self.filter_and_score(job, resume_text, preferences) for job in jobs]
+
+        def is_aligned(results: Any) -> bool:
+            return (
+                isinstance(results, list)
+                and len(results) == len(jobs)
+                and all(
+                    isinstance(result, dict) and result.get("index") == number
+                    for number, result in enumerate(results, start=1)
+                )
+            )
+
+        prompt = build_filter_and_score_batch_prompt(jobs, resume_text, preferences)
+        try:
+            results = self._generate_json(
+                prompt, max_tokens=FILTER_BATCH_TOKENS_PER_JOB * len(jobs), validate=is_aligned
+            )
+        except Exception as e:
+            logger.warning(f"Batch filter error, scoring {len(jobs)} jobs one at a time: {e}")
+            results = None
+
+        if is_aligned(results):
+            return results
+
+        if results is not None:
+            logger.warning(
+                f"Batch filter reply did not match {len(jobs)} jobs, scoring one at a time"
+            )
+        return [self.filter_and_score(job, resume_text, preferences) for job in jobs]
+
     @abstractmethod
     def analyze_job(self, job_data: Dict[str, Any], resume_text: str) -> Dict[str, Any]:
         """
@@ -269,6 +324,43 @@ class AIProvider(ABC):
         """
         pass
 
+    def _generate_json(
+        self,
+        prompt: str,
+        max_tokens: int = 1000,
+        validate: Optional[Callable[[Any], bool]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Call the provider's _generate and parse the JSON reply, reusing the
+        response to an identical earlier request.
+
+        Used for structured results (scoring, analysis, classification, job
+        extraction) where a repeated prompt should get the same answer. Only responses that parse are
+        cached, and each call parses afresh so callers can modify the result.
+
+        Args:
+            prompt: Formatted prompt text
+            max_tokens: Response token limit
+            validate: Optional check on the parsed reply; replies it rejects are
+                returned but not cached, so the next identical request asks again
+
+        Returns:
+            dict: Parsed JSON object
+
+        Raises:
+            ValueError: If no valid JSON can be extracted from a new response
+        """
+        key = prompt_cache_key(self.provider_name, self.model_name, max_tokens, prompt)
+        response = response_cache.get(key)
+        if response is not None:
+            return self._parse_json_response(response)
+
+        response = self._generate(prompt, max_tokens=max_tokens)
+        result = self._parse_json_response(response)
+        if validate is None or validate(result):
+            response_cache.set(key, response)
+        return result
+
     def _parse_json_response(self, text: str) -> Dict[str, Any]:
         """
         Extract JSON from an AI response that might include markdown fences or preamble.
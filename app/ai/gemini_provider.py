@@ -92,9 +92,7 @@ class GeminiProvider(AIProvider):
         prompt = build_filter_and_score_prompt(job_data, resume_text, preferences)
 
         try:
-            response = self._generate(prompt, max_tokens=500)
-            result = self._parse_json_response(response)
-            return result
+            return self._generate_json(prompt, max_tokens=500)
         except Exception as e:
             logger.error(f"AI filter error: {e}")
             return {
@@ -110,8 +108,7 @@ class GeminiProvider(AIProvider):
         prompt = build_analyze_job_prompt(job_data, resume_text)
 
         try:
-            response = self._generate(prompt, max_tokens=1000)
-            return self._parse_json_response(response)
+            return self._generate_json(prompt, max_tokens=1000)
         except Exception as e:
             logger.error(f"Analysis error: {e}")
             return {
@@ -180,8 +177,7 @@ class GeminiProvider(AIProvider):
             if search_result.description:
                 prompt = build_extract_from_page_prompt(search_result.description, company, title)
                 try:
-                    response = self._generate(prompt, max_tokens=1500)
-                    extracted = self._parse_json_response(response)
+                    extracted = self._generate_json(prompt, max_tokens=1500)
 
                     # Merge search result with AI extraction
                     return {
@@ -218,8 +214,7 @@ class GeminiProvider(AIProvider):
         prompt = build_classify_email_prompt(subject, sender, body)
 
         try:
-            response = self._generate(prompt, max_tokens=500)
-            return self._parse_json_response(response)
+            return self._generate_json(prompt, max_tokens=500)
         except Exception as e:
             logger.error(f"Email classification error: {e}")
             return {
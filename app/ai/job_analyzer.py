@@ -10,13 +10,126 @@ This module provides functions to:
 """
 
 import re
+import heapq
 import json
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import pickle
+import threading
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+
+# Compiled with mypyc when built; falls back to the pure-Python module otherwise
+from ._job_analyzer_ext import collect_experience_requirements
+
+try:
+    import orjson
+except ImportError:  # optional: faster parsing of AI responses
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+# ----- Patterns for extract_structured_requirements (compiled once at import) -----
+#
+# Patterns that run on lowercased text are compiled without re.IGNORECASE:
+# lowercasing once is nearly free, while case-insensitive matching is 2-4x
+# slower per pattern in CPython's re. Certification and clearance patterns run
+# on the original text so their names keep the posting's capitalization.
+
+_EXPERIENCE_PATTERNS = [
+    # "5+ years of AWS experience" (skill capped at 60 chars to keep the lazy match linear)
+    (
+        re.compile(
+            r"(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience\s+)?(?:with|in|of)?\s*([A-Za-z0-9\s\.\+\#\/\-]{1,60}?)(?:\s+experience)?(?:[,\.\n]|$)"
+        ),
+        "years_skill",
+    ),
+    # "Bachelor's and 2 years experience"
+    (
+        re.compile(
+            r"(?:bachelor'?s?|master'?s?|phd)\s+(?:degree\s+)?(?:and|with)\s+(\d+)\+?\s*(?:years?|yrs?)"
+        ),
+        "edu_years",
+    ),
+    # "minimum 5 years"
+    (
+        re.compile(
+            r"(?:minimum|at\s+least|min)\s+(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?([A-Za-z0-9\s\.\+\#\/\-]+?)(?:\s+experience)?"
+        ),
+        "min_years",
+    ),
+    # "5-7 years of experience"
+    (
+        re.compile(
+            r"(\d+)\s*[-–]\s*(\d+)\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience\s+)?(?:with|in)?\s*([A-Za-z0-9\s\.\+\#\/\-]+)?"
+        ),
+        "range",
+    ),
+]
+
+_EDUCATION_PATTERNS = [
+    (
+        re.compile(
+            r"(?:bachelor'?s?|bs|ba|b\.s\.|b\.a\.)\s*(?:degree)?\s*(?:in)?\s*([A-Za-z\s]+)?"
+        ),
+        "bachelor",
+    ),
+    (
+        re.compile(
+            r"(?:master'?s?|ms|ma|m\.s\.|m\.a\.|mba)\s*(?:degree)?\s*(?:in)?\s*([A-Za-z\s]+)?"
+        ),
+        "master",
+    ),
+    (re.compile(r"(?:ph\.?d\.?|doctorate)\s*(?:degree)?\s*(?:in)?\s*([A-Za-z\s]+)?"), "phd"),
+    (re.compile(r"(?:associate'?s?|as|aa)\s*(?:degree)?\s*(?:in)?\s*([A-Za-z\s]+)?"), "associate"),
+]
+
+_EDUCATION_FIELD_CLEANUP_RE = re.compile(r"\s*(or|and|with|required|preferred).*")
+
+_CERT_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in [
+        r"(AWS\s+(?:Solutions?\s+Architect|SysOps\s+Administrator|Developer|DevOps\s+Engineer|Cloud\s+Practitioner)(?:\s+(?:Associate|Professional))?)",
+        r"(Azure\s+(?:Administrator|Developer|Solutions?\s+Architect|DevOps\s+Engineer)(?:\s+(?:Associate|Expert))?)",
+        r"(GCP\s+(?:Cloud\s+Architect|Cloud\s+Engineer|Data\s+Engineer))",
+        r"(Certified\s+Kubernetes\s+Administrator|CKA)",
+        r"(Certified\s+Kubernetes\s+(?:Application\s+Developer|Security\s+Specialist)|CKAD|CKS)",
+        r"(CompTIA\s+(?:Security\+|Network\+|A\+|Cloud\+|Linux\+))",
+        r"(Security\+|Sec\+)",
+        r"(CISSP|CISM|CEH|OSCP)",
+        r"(PMP|Scrum\s+Master|CSM|SAFe\s+Agilist)",
+        r"(Terraform\s+(?:Associate|Professional))",
+        r"(CCNA|CCNP|CCIE)",
+    ]
+]
+
+# Words near a certification that mark it as required (searched in text_lower)
+_CERT_REQUIRED_CONTEXT_RE = re.compile(r"required|must have|mandatory")
+
+_CLEARANCE_PATTERNS = [
+    (re.compile(r"(TS/SCI|Top\s+Secret/SCI)", re.IGNORECASE), "TS/SCI"),
+    (re.compile(r"(Top\s+Secret)", re.IGNORECASE), "Top Secret"),
+    (re.compile(r"(Secret\s+clearance)", re.IGNORECASE), "Secret"),
+    (re.compile(r"(Public\s+Trust)", re.IGNORECASE), "Public Trust"),
+]
+
+_REQUIRED_SECTION_RE = re.compile(
+    r"(?:required|must\s+have|minimum|essential)[\s\w]*(?:qualifications?|requirements?|skills?)?:?\s*([\s\S]*?)(?=(?:preferred|nice|bonus|desired|about\s+us|\n\n\n|benefits|$))"
+)
+_PREFERRED_SECTION_RE = re.compile(
+    r"(?:preferred|nice\s+to\s+have|bonus|desired)[\s\w]*(?:qualifications?|requirements?|skills?)?:?\s*([\s\S]*?)(?=(?:about\s+us|\n\n\n|benefits|equal\s+opportunity|$))"
+)
+
+_RESPONSIBILITY_PATTERNS = [
+    re.compile(
+        r"(?:responsibilities|duties|what\s+you(?:'ll)?\s+do)[\s:]*\n((?:[\s]*[-•*]\s*[^\n]+\n?){1,10})"
+    ),
+    re.compile(r"(?:as\s+a\s+\w+,?\s+you\s+will)[\s:]*\n((?:[\s]*[-•*]\s*[^\n]+\n?){1,10})"),
+]
+_BULLET_RE = re.compile(r"[-•*]\s*([^\n]+)")
+
+
 def extract_structured_requirements(job_description: str) -> Dict[str, Any]:
     """
     Extract all structured requirements from a job description.
@@ -33,6 +146,23 @@ def extract_structured_requirements(job_description: str) -> Dict[str, Any]:
     if not job_description:
         return {}
 
+    # Cached as a pickle so every caller gets its own mutable copy
+    return pickle.loads(_structured_requirements_pickle(job_description))
+
+
+# Number of distinct job descriptions whose requirements/red flags are memoized
+_ANALYSIS_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)
+def _structured_requirements_pickle(job_description: str) -> bytes:
+    """
+    Run extract_structured_requirements for a job description, memoized.
+
+    The same job is analyzed against several resumes and re-enriched, so the
+    pickled result is cached per description text. Clear with
+    _structured_requirements_pickle.cache_clear().
+    """
     text = job_description
     text_lower = text.lower()
 
@@ -47,32 +177,11 @@ def extract_structured_requirements(job_description: str) -> Dict[str, Any]:
     }
 
     # ===== EXPERIENCE REQUIREMENTS =====
-    experience_patterns = [
-        # "5+ years of AWS experience"
-        (
-            r"(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience\s+)?(?:with|in|of)?\s*([A-Za-z0-9\s\.\+\#\/\-]+?)(?:\s+experience)?(?:[,\.\n]|$)",
-            "years_skill",
-        ),
-        # "Bachelor's and 2 years experience"
-        (
-            r"(?:bachelor'?s?|master'?s?|phd)\s+(?:degree\s+)?(?:and|with)\s+(\d+)\+?\s*(?:years?|yrs?)",
-            "edu_years",
-        ),
-        # "minimum 5 years"
-        (
-            r"(?:minimum|at\s+least|min)\s+(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?([A-Za-z0-9\s\.\+\#\/\-]+?)(?:\s+experience)?",
-            "min_years",
-        ),
-        # "5-7 years of experience"
-        (
-            r"(\d+)\s*[-–]\s*(\d+)\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience\s+)?(?:with|in)?\s*([A-Za-z0-9\s\.\+\#\/\-]+)?",
-            "range",
-        ),
-    ]
-
+    # Every experience pattern needs a "year(s)"/"yr(s)" token; skip all four scans without one
+    has_years = "yr" in text_lower or "year" in text_lower
     seen_exp = set()
-    for pattern, ptype in experience_patterns:
-        for match in re.finditer(pattern, text_lower, re.IGNORECASE):
+    for pattern, ptype in _EXPERIENCE_PATTERNS if has_years else ():
+        for match in pattern.finditer(text_lower):
             groups = match.groups()
             exp_item = {}
 
@@ -97,34 +206,20 @@ def extract_structured_requirements(job_description: str) -> Dict[str, Any]:
                 }
 
             if exp_item and exp_item.get("skill"):
-                key = f"{exp_item.get('years', 0)}_{exp_item.get('skill', '').lower()[:20]}"
+                # skill is ASCII text from text_lower, so it is already the lowercase name
+                key = f"{exp_item.get('years', 0)}_{skill[:20]}"
                 if key not in seen_exp:
                     seen_exp.add(key)
                     result["experience"].append(exp_item)
 
     # ===== EDUCATION REQUIREMENTS =====
-    education_patterns = [
-        (
-            r"(?:bachelor'?s?|bs|ba|b\.s\.|b\.a\.)\s*(?:degree)?\s*(?:in)?\s*([A-Za-z\s]+)?",
-            "bachelor",
-        ),
-        (
-            r"(?:master'?s?|ms|ma|m\.s\.|m\.a\.|mba)\s*(?:degree)?\s*(?:in)?\s*([A-Za-z\s]+)?",
-            "master",
-        ),
-        (r"(?:ph\.?d\.?|doctorate)\s*(?:degree)?\s*(?:in)?\s*([A-Za-z\s]+)?", "phd"),
-        (r"(?:associate'?s?|as|aa)\s*(?:degree)?\s*(?:in)?\s*([A-Za-z\s]+)?", "associate"),
-    ]
-
     edu_levels = {"phd": 4, "master": 3, "bachelor": 2, "associate": 1}
     seen_edu = set()
 
-    for pattern, level in education_patterns:
-        for match in re.finditer(pattern, text_lower):
+    for pattern, level in _EDUCATION_PATTERNS:
+        for match in pattern.finditer(text_lower):
             field = match.group(1).strip() if match.group(1) else ""
-            field = re.sub(
-                r"\s*(or|and|with|required|preferred).*", "", field, flags=re.IGNORECASE
-            ).strip()
+            field = _EDUCATION_FIELD_CLEANUP_RE.sub("", field).strip()
             if len(field) > 50:
                 field = ""
             edu_key = level
@@ -142,43 +237,26 @@ def extract_structured_requirements(job_description: str) -> Dict[str, Any]:
     result["education"].sort(key=lambda x: x.get("priority", 0), reverse=True)
 
     # ===== CERTIFICATIONS =====
-    cert_patterns = [
-        r"(AWS\s+(?:Solutions?\s+Architect|SysOps\s+Administrator|Developer|DevOps\s+Engineer|Cloud\s+Practitioner)(?:\s+(?:Associate|Professional))?)",
-        r"(Azure\s+(?:Administrator|Developer|Solutions?\s+Architect|DevOps\s+Engineer)(?:\s+(?:Associate|Expert))?)",
-        r"(GCP\s+(?:Cloud\s+Architect|Cloud\s+Engineer|Data\s+Engineer))",
-        r"(Certified\s+Kubernetes\s+Administrator|CKA)",
-        r"(Certified\s+Kubernetes\s+(?:Application\s+Developer|Security\s+Specialist)|CKAD|CKS)",
-        r"(CompTIA\s+(?:Security\+|Network\+|A\+|Cloud\+|Linux\+))",
-        r"(Security\+|Sec\+)",
-        r"(CISSP|CISM|CEH|OSCP)",
-        r"(PMP|Scrum\s+Master|CSM|SAFe\s+Agilist)",
-        r"(Terraform\s+(?:Associate|Professional))",
-        r"(CCNA|CCNP|CCIE)",
-    ]
-
     seen_certs = set()
-    for pattern in cert_patterns:
-        for match in re.finditer(pattern, text, re.IGNORECASE):
+    for pattern in _CERT_PATTERNS:
+        for match in pattern.finditer(text):
             cert = match.group(1).strip()
             cert_lower = cert.lower()
             if cert_lower not in seen_certs:
                 seen_certs.add(cert_lower)
-                # Determine if required or preferred
-                context_start = max(0, match.start() - 100)
-                context = text_lower[context_start : match.end() + 50]
-                is_required = any(w in context for w in ["required", "must have", "mandatory"])
+                # Determine if required or preferred, searching the surrounding
+                # window in place rather than slicing it out
+                is_required = (
+                    _CERT_REQUIRED_CONTEXT_RE.search(
+                        text_lower, max(0, match.start() - 100), match.end() + 50
+                    )
+                    is not None
+                )
                 result["certifications"].append({"name": cert, "required": is_required})
 
     # ===== SECURITY CLEARANCE =====
-    clearance_patterns = [
-        (r"(TS/SCI|Top\s+Secret/SCI)", "TS/SCI"),
-        (r"(Top\s+Secret)", "Top Secret"),
-        (r"(Secret\s+clearance)", "Secret"),
-        (r"(Public\s+Trust)", "Public Trust"),
-    ]
-
-    for pattern, level in clearance_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
+    for pattern, level in _CLEARANCE_PATTERNS:
+        if pattern.search(text):
             context = text_lower
             must_obtain = (
                 "able to obtain" in context or "must obtain" in context or "eligibility" in context
@@ -195,59 +273,45 @@ def extract_structured_requirements(job_description: str) -> Dict[str, Any]:
     all_skills = extract_all_skills_from_text(job_description)
 
     # Try to separate required vs preferred based on context
-    required_section_match = re.search(
-        r"(?:required|must\s+have|minimum|essential)[\s\w]*(?:qualifications?|requirements?|skills?)?:?\s*([\s\S]*?)(?=(?:preferred|nice|bonus|desired|about\s+us|\n\n\n|benefits|$))",
-        text_lower,
-        re.IGNORECASE,
-    )
-    preferred_section_match = re.search(
-        r"(?:preferred|nice\s+to\s+have|bonus|desired)[\s\w]*(?:qualifications?|requirements?|skills?)?:?\s*([\s\S]*?)(?=(?:about\s+us|\n\n\n|benefits|equal\s+opportunity|$))",
-        text_lower,
-        re.IGNORECASE,
-    )
+    required_section_match = _REQUIRED_SECTION_RE.search(text_lower)
+    preferred_section_match = _PREFERRED_SECTION_RE.search(text_lower)
 
+    # Dicts used as ordered sets, so skills listed in several categories are deduped
+    skills_required = {}
+    skills_preferred = {}
+
+    # Sections are spans of the already-scanned description, so skills are
+    # located within them instead of rescanning the section text
     if required_section_match:
-        required_skills = extract_all_skills_from_text(required_section_match.group(1))
-        for skills in required_skills.values():
-            result["skills_required"].extend(
-                [s.title() if len(s) > 3 else s.upper() for s in skills]
-            )
+        for s in _flat_skills_in_span(text_lower, all_skills, *required_section_match.span(1)):
+            skills_required[s.title() if len(s) > 3 else s.upper()] = None
 
     if preferred_section_match:
-        preferred_skills = extract_all_skills_from_text(preferred_section_match.group(1))
-        for skills in preferred_skills.values():
-            s_list = [s.title() if len(s) > 3 else s.upper() for s in skills]
-            result["skills_preferred"].extend(
-                [s for s in s_list if s not in result["skills_required"]]
-            )
+        for s in _flat_skills_in_span(text_lower, all_skills, *preferred_section_match.span(1)):
+            name = s.title() if len(s) > 3 else s.upper()
+            if name not in skills_required:
+                skills_preferred[name] = None
 
     # If no sections found, put all skills as required
-    if not result["skills_required"] and not result["skills_preferred"]:
+    if not skills_required and not skills_preferred:
         for skills in all_skills.values():
-            result["skills_required"].extend(
-                [s.title() if len(s) > 3 else s.upper() for s in skills]
-            )
+            for s in skills:
+                skills_required[s.title() if len(s) > 3 else s.upper()] = None
 
-    # Dedupe
-    result["skills_required"] = list(dict.fromkeys(result["skills_required"]))
-    result["skills_preferred"] = list(dict.fromkeys(result["skills_preferred"]))
+    result["skills_required"] = list(skills_required)
+    result["skills_preferred"] = list(skills_preferred)
 
     # ===== RESPONSIBILITIES (first few bullet points) =====
-    resp_patterns = [
-        r"(?:responsibilities|duties|what\s+you(?:'ll)?\s+do)[\s:]*\n((?:[\s]*[-•*]\s*[^\n]+\n?){1,10})",
-        r"(?:as\s+a\s+\w+,?\s+you\s+will)[\s:]*\n((?:[\s]*[-•*]\s*[^\n]+\n?){1,10})",
-    ]
-
-    for pattern in resp_patterns:
-        match = re.search(pattern, text_lower, re.IGNORECASE)
+    for pattern in _RESPONSIBILITY_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
-            bullets = re.findall(r"[-•*]\s*([^\n]+)", match.group(1))
+            bullets = _BULLET_RE.findall(match.group(1))
             result["responsibilities"] = [
                 b.strip().capitalize() for b in bullets[:8] if len(b) > 10
             ]
             break
 
-    return result
+    return pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
 
 
 def match_requirements_to_resume(requirements: Dict[str, Any], resume_text: str) -> Dict[str, Any]:
@@ -262,26 +326,36 @@ def match_requirements_to_resume(requirements: Dict[str, Any], resume_text: str)
     if not requirements or not resume_text:
         return {"matched": [], "missing": [], "match_summary": {}}
 
-    resume_lower = resume_text.lower()
+    return _match_requirements_to_lowered_resume(requirements, resume_text, resume_text.lower())
+
+
+def _match_requirements_to_lowered_resume(
+    requirements: Dict[str, Any], resume_text: str, resume_lower: str
+) -> Dict[str, Any]:
+    """match_requirements_to_resume for callers that already lowercased the resume."""
     matched = []
     missing = []
 
     # Check experience requirements
     for exp in requirements.get("experience", []):
-        skill_lower = exp.get("skill", "").lower()
+        # Read each field once; these loops run for every job scored
+        skill = exp.get("skill")
+        skill_lower = skill.lower() if skill is not None else ""
         years = exp.get("years", 0)
 
-        # Check if skill is in resume
-        skill_in_resume = any(
-            s in resume_lower
-            for s in [skill_lower, skill_lower.replace(" ", ""), skill_lower.replace("-", " ")]
+        # Check if skill is in resume, scanning the spacing variants only when
+        # they differ from the skill itself
+        skill_in_resume = (
+            skill_lower in resume_lower
+            or (" " in skill_lower and skill_lower.replace(" ", "") in resume_lower)
+            or ("-" in skill_lower and skill_lower.replace("-", " ") in resume_lower)
         )
 
         item = {
             "type": "experience",
-            "description": f"{years}+ years of {exp.get('skill', 'experience')}",
+            "description": f"{years}+ years of {skill if skill is not None else 'experience'}",
             "years": years,
-            "skill": exp.get("skill"),
+            "skill": skill,
         }
 
         if skill_in_resume:
@@ -297,14 +371,14 @@ def match_requirements_to_resume(requirements: Dict[str, Any], resume_text: str)
     }
 
     for edu in requirements.get("education", []):
-        level = edu.get("level", "").lower()
+        level = edu.get("level", "")
+        field = edu.get("field")
         item = {
             "type": "education",
-            "description": f"{edu.get('level', '')} degree"
-            + (f" in {edu.get('field')}" if edu.get("field") else ""),
+            "description": f"{level} degree" + (f" in {field}" if field else ""),
             "level": edu.get("level"),
         }
-        if edu_in_resume.get(level, False):
+        if edu_in_resume.get(level.lower(), False):
             matched.append(item)
         else:
             missing.append(item)
@@ -339,22 +413,31 @@ def match_requirements_to_resume(requirements: Dict[str, Any], resume_text: str)
         clearance_terms = ["clearance", "secret", "ts/sci", "public trust"]
         has_clearance = any(term in resume_lower for term in clearance_terms)
 
+        must_obtain = clearance.get("must_obtain", False)
         item = {
             "type": "clearance",
             "description": f"{clearance.get('level', '')} clearance",
             "level": clearance.get("level"),
-            "must_obtain": clearance.get("must_obtain", False),
+            "must_obtain": must_obtain,
         }
 
-        if has_clearance or clearance.get("must_obtain"):
+        if has_clearance or must_obtain:
             matched.append(item)
         else:
             missing.append(item)
 
-    # Check required skills
-    for skill in requirements.get("skills_required", []):
+    # Check required skills against one skill scan of the resume; known skills then
+    # cost a set lookup (with word boundaries for short ones like "go" or "r")
+    required_skills = requirements.get("skills_required", [])
+    if required_skills:
+        resume_skill_set = set(extract_all_skills_flat(resume_text))
+
+    for skill in required_skills:
         skill_lower = skill.lower()
-        has_skill = skill_lower in resume_lower
+        if skill_lower in _ALL_TECH_SKILLS:
+            has_skill = skill_lower in resume_skill_set
+        else:
+            has_skill = skill_lower in resume_lower
 
         item = {"type": "skill_required", "description": skill}
 
@@ -367,6 +450,12 @@ def match_requirements_to_resume(requirements: Dict[str, Any], resume_text: str)
     total = len(matched) + len(missing)
     match_pct = int((len(matched) / total) * 100) if total > 0 else 0
 
+    matched_by_type = {}
+    count_for_type = matched_by_type.get
+    for m in matched:
+        match_type = m["type"]
+        matched_by_type[match_type] = count_for_type(match_type, 0) + 1
+
     return {
         "matched": matched,
         "missing": missing,
@@ -375,8 +464,8 @@ def match_requirements_to_resume(requirements: Dict[str, Any], resume_text: str)
             "matched_count": len(matched),
             "missing_count": len(missing),
             "match_percentage": match_pct,
-            "experience_match": len([m for m in matched if m["type"] == "experience"]),
-            "skills_match": len([m for m in matched if m["type"] == "skill_required"]),
+            "experience_match": matched_by_type.get("experience", 0),
+            "skills_match": matched_by_type.get("skill_required", 0),
         },
     }
 
@@ -598,33 +687,380 @@ TECH_SKILLS = {
 }
 
 
+# Every skill in TECH_SKILLS, for membership tests
+_ALL_TECH_SKILLS = frozenset(skill for skills in TECH_SKILLS.values() for skill in skills)
+
+# Skills this short ("go", "r", "sql") only count as whole words
+_SHORT_SKILL_MAX_LEN = 3
+
+
+def _build_skill_automaton():
+    """
+    Build an Aho-Corasick automaton over every skill in TECH_SKILLS.
+
+    Each word maps to (category, skill, needs_boundary). Short skills (3 chars
+    or fewer) need word boundaries, same as the regex fallback.
+
+    Returns:
+        ahocorasick.Automaton, or None if pyahocorasick is not installed
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        logger.debug("pyahocorasick not installed; using per-skill scan for skill extraction")
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for category, skills in TECH_SKILLS.items():
+        for skill in skills:
+            automaton.add_word(skill, (category, skill, len(skill) <= _SHORT_SKILL_MAX_LEN))
+    automaton.make_automaton()
+    return automaton
+
+
+_SKILL_AUTOMATON = _build_skill_automaton()
+
+# Skill index -> (skill, needs_boundary) for the Hyperscan database
+_SKILL_ENTRIES = tuple(
+    (skill, len(skill) <= _SHORT_SKILL_MAX_LEN)
+    for skills in TECH_SKILLS.values()
+    for skill in skills
+)
+
+
+def _build_skill_database():
+    """
+    Compile every skill in TECH_SKILLS into a Hyperscan literal database.
+
+    Hyperscan's vectorized multi-literal matcher is the fastest backend for
+    extract_all_skills_from_text and is preferred when installed.
+
+    Returns:
+        hyperscan.Database, or None if python-hyperscan is not installed
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        logger.debug("python-hyperscan not installed; skipping Hyperscan skill scan")
+        return None
+
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=[skill.encode("utf-8") for skill, _ in _SKILL_ENTRIES],
+        ids=list(range(len(_SKILL_ENTRIES))),
+        elements=len(_SKILL_ENTRIES),
+        flags=0,
+        literal=True,
+    )
+    return database
+
+
+_SKILL_DATABASE = _build_skill_database()
+
+# Hyperscan scratch space is not thread-safe, so each thread gets its own
+_hyperscan_local = threading.local()
+
+
+def _build_category_skill_patterns():
+    """
+    Build one alternation regex per TECH_SKILLS category.
+
+    Each pattern is a zero-width lookahead so finditer reports a match at
+    every position, with alternatives ordered longest first. Skills that are
+    prefixes of the matched one (e.g. "node" inside "node.js") are recovered
+    from _SKILL_PREFIXES, so overlapping mentions are never lost. Each prefix
+    entry is (skill, boundary_len), where boundary_len is the skill length for
+    short skills that need word boundaries and 0 otherwise.
+    """
+    patterns = {}
+    prefixes = {}
+    for category, skills in TECH_SKILLS.items():
+        ordered = sorted(skills, key=len, reverse=True)
+        patterns[category] = re.compile(
+            "(?=(" + "|".join(re.escape(skill) for skill in ordered) + "))"
+        )
+        for skill in skills:
+            prefixes[skill] = tuple(
+                (other, len(other) if len(other) <= _SHORT_SKILL_MAX_LEN else 0)
+                for other in ordered
+                if skill.startswith(other)
+            )
+    return patterns, prefixes
+
+
+_CATEGORY_SKILL_PATTERNS, _SKILL_PREFIXES = _build_category_skill_patterns()
+
+# Distinct character sets of each category's skills. A skill can only occur in
+# text containing all of its characters, so categories with no candidate skill
+# are skipped without running their pattern.
+_CATEGORY_SKILL_CHARS = {
+    category: tuple(set(frozenset(skill) for skill in skills))
+    for category, skills in TECH_SKILLS.items()
+}
+
+
+def _is_word_char(ch: str) -> bool:
+    """Return True if ch is a regex word character (alphanumeric or underscore)."""
+    return ch.isalnum() or ch == "_"
+
+
+def _at_word_boundary(text: str, index: int) -> bool:
+    """Return True if a regex word boundary would match before text[index]."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Return True if text[start:end] is bounded by word boundaries on both sides."""
+    return _at_word_boundary(text, start) and _at_word_boundary(text, end)
+
+
+# Number of distinct texts whose skill scans are memoized
+_SKILL_CACHE_SIZE = 512
+
+
 def extract_all_skills_from_text(text: str) -> Dict[str, List[str]]:
     """Extract all tech skills found in text, categorized."""
     if not text:
         return {}
 
-    text_lower = text.lower()
-    found_skills = {}
+    # The cached scan is immutable; hand each caller its own lists
+    return {category: list(skills) for category, skills in _scan_skills(text)}
 
-    for category, skills in TECH_SKILLS.items():
-        category_skills = []
-        for skill in skills:
-            # Check for skill presence (word boundary aware for short skills)
-            if len(skill) <= 3:
+
+def extract_all_skills_flat(text: str) -> Iterator[str]:
+    """Yield all tech skills found in text in TECH_SKILLS order, without categories."""
+    if not text:
+        return
+
+    for _category, skills in _scan_skills(text):
+        yield from skills
+
+
+@lru_cache(maxsize=_SKILL_CACHE_SIZE)
+def _scan_skills(text: str) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """
+    Scan text for TECH_SKILLS, memoized per text.
+
+    The same job description and resume are scanned many times while a job
+    is analyzed, so results are cached as nested tuples. Keying on the
+    original text means cache hits skip lowercasing as well as the scan.
+    Clear with _scan_skills.cache_clear().
+    """
+    # Callers often pass text that is already lowercased; skip the copy then
+    text_lower = text if text.islower() else text.lower()
+
+    if _SKILL_DATABASE is not None:
+        found_skills = _extract_skills_with_hyperscan(text_lower)
+    elif _SKILL_AUTOMATON is not None:
+        found_skills = _extract_skills_with_automaton(text_lower)
+    else:
+        found_skills = _extract_skills_with_patterns(text_lower)
+
+    return tuple((category, tuple(skills)) for category, skills in found_skills.items())
+
+
+def _extract_skills_with_patterns(text_lower: str) -> Dict[str, List[str]]:
+    """Scan text_lower with _CATEGORY_SKILL_PATTERNS (used without pyahocorasick)."""
+    found_skills = {}
+    present = set(text_lower)
+
+    for category, pattern in _CATEGORY_SKILL_PATTERNS.items():
+        if not any(chars <= present for chars in _CATEGORY_SKILL_CHARS[category]):
+            continue
+
+        hits = set()
+        for match in pattern.finditer(text_lower):
+            start = match.start()
+            for skill, boundary_len in _SKILL_PREFIXES[match.group(1)]:
+                if skill in hits:
+                    continue
                 # Use word boundary for short skills like "go", "r", "sql"
-                pattern = r"\b" + re.escape(skill) + r"\b"
-                if re.search(pattern, text_lower):
-                    category_skills.append(skill)
-            else:
-                if skill in text_lower:
-                    category_skills.append(skill)
+                if boundary_len and not _is_whole_word(text_lower, start, start + boundary_len):
+                    continue
+                hits.add(skill)
+
+        if hits:
+            found_skills[category] = [skill for skill in TECH_SKILLS[category] if skill in hits]
 
+    return found_skills
+
+
+def _extract_skills_with_automaton(text_lower: str) -> Dict[str, List[str]]:
+    """Single-pass version of extract_all_skills_from_text using _SKILL_AUTOMATON."""
+    hits = set()
+    for end, (category, skill, needs_boundary) in _SKILL_AUTOMATON.iter(text_lower):
+        if skill in hits:
+            continue
+        if needs_boundary and not _is_whole_word(text_lower, end - len(skill) + 1, end + 1):
+            continue
+        hits.add(skill)
+
+    return _group_skill_hits(hits)
+
+
+def _utf8_word_char_before(data: bytes, index: int) -> bool:
+    """Return True if the character ending at byte index is a word character."""
+    if index <= 0:
+        return False
+    if data[index - 1] < 0x80:
+        return _is_word_char(chr(data[index - 1]))
+    start = index - 1
+    while start > 0 and data[start] & 0xC0 == 0x80:
+        start -= 1
+    return _is_word_char(data[start:index].decode("utf-8", "surrogatepass"))
+
+
+def _utf8_word_char_at(data: bytes, index: int) -> bool:
+    """Return True if the character starting at byte index is a word character."""
+    if index >= len(data):
+        return False
+    if data[index] < 0x80:
+        return _is_word_char(chr(data[index]))
+    end = index + 1
+    while end < len(data) and data[end] & 0xC0 == 0x80:
+        end += 1
+    return _is_word_char(data[index:end].decode("utf-8", "surrogatepass"))
+
+
+def _extract_skills_with_hyperscan(text_lower: str) -> Dict[str, List[str]]:
+    """Single-pass version of extract_all_skills_from_text using _SKILL_DATABASE."""
+    import hyperscan
+
+    scratch = getattr(_hyperscan_local, "scratch", None)
+    if scratch is None:
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(_SKILL_DATABASE)
+
+    data = text_lower.encode("utf-8", "surrogatepass")
+    hits = set()
+
+    def on_match(skill_id, _start, end, _flags, _context):
+        skill, needs_boundary = _SKILL_ENTRIES[skill_id]
+        if skill in hits:
+            return
+        if needs_boundary:
+            start = end - len(skill)
+            if _utf8_word_char_before(data, start) == _utf8_word_char_at(data, start):
+                return
+            if _utf8_word_char_before(data, end) == _utf8_word_char_at(data, end):
+                return
+        hits.add(skill)
+
+    _SKILL_DATABASE.scan(data, match_event_handler=on_match, scratch=scratch)
+
+    return _group_skill_hits(hits)
+
+
+def _group_skill_hits(hits: set) -> Dict[str, List[str]]:
+    """Group found skills by category, in TECH_SKILLS order like the per-skill scan."""
+    if not hits:
+        return {}
+
+    found_skills = {}
+    for category, skills in TECH_SKILLS.items():
+        category_skills = [skill for skill in skills if skill in hits]
         if category_skills:
             found_skills[category] = category_skills
 
     return found_skills
 
 
+# Position of each skill in TECH_SKILLS, for ordering uncategorized skill lists
+_SKILL_ORDER = {
+    skill: index
+    for index, skill in enumerate(skill for skills in TECH_SKILLS.values() for skill in skills)
+}
+
+# Short skills, which need word boundaries and so can gain matches at a span edge
+_SHORT_SKILLS = tuple(skill for skill in _ALL_TECH_SKILLS if len(skill) <= _SHORT_SKILL_MAX_LEN)
+
+
+def _skills_in_span(
+    text_lower: str, all_skills: Dict[str, List[str]], start: int, end: int
+) -> Dict[str, List[str]]:
+    """Return extract_all_skills_from_text(text_lower[start:end]) without rescanning."""
+    return _group_skill_hits(_skill_hits_in_span(text_lower, all_skills, start, end))
+
+
+def _flat_skills_in_span(
+    text_lower: str, all_skills: Dict[str, List[str]], start: int, end: int
+) -> List[str]:
+    """Like _skills_in_span, but as one list in TECH_SKILLS order without categories."""
+    return sorted(
+        _skill_hits_in_span(text_lower, all_skills, start, end), key=_SKILL_ORDER.__getitem__
+    )
+
+
+def _skill_hits_in_span(
+    text_lower: str, all_skills: Dict[str, List[str]], start: int, end: int
+) -> set:
+    """
+    Return the set of skills extract_all_skills_from_text(text_lower[start:end]) finds.
+
+    all_skills must be the scan of the whole of text_lower. Any skill in the span
+    is also in the whole text, except a short skill whose word boundary comes
+    from the span edge itself, so only those candidates are checked.
+
+    Args:
+        text_lower: Lowercased text that all_skills was scanned from
+        all_skills: extract_all_skills_from_text(text_lower)
+        start: Span start offset
+        end: Span end offset
+
+    Returns:
+        Set of skills found in the span
+    """
+    hits = set()
+    for skills in all_skills.values():
+        for skill in skills:
+            if len(skill) > _SHORT_SKILL_MAX_LEN:
+                if text_lower.find(skill, start, end) != -1:
+                    hits.add(skill)
+            elif _whole_word_in_span(text_lower, skill, start, end):
+                hits.add(skill)
+
+    for skill in _SHORT_SKILLS:
+        if skill not in hits and (
+            text_lower.startswith(skill, start) or text_lower.endswith(skill, start, end)
+        ):
+            if _whole_word_in_span(text_lower, skill, start, end):
+                hits.add(skill)
+
+    return hits
+
+
+def _whole_word_in_span(text_lower: str, skill: str, start: int, end: int) -> bool:
+    """Return True if skill occurs as a whole word in text_lower[start:end]."""
+    index = text_lower.find(skill, start, end)
+    while index != -1:
+        skill_end = index + len(skill)
+        if (index > start and _is_word_char(text_lower[index - 1])) != _is_word_char(
+            text_lower[index]
+        ) and _is_word_char(text_lower[skill_end - 1]) != (
+            skill_end < end and _is_word_char(text_lower[skill_end])
+        ):
+            return True
+        index = text_lower.find(skill, index + 1, end)
+    return False
+
+
+# Common section headers for extract_required_skills
+_REQUIRED_SKILLS_SECTION_PATTERNS = [
+    re.compile(
+        r"(?:required|minimum|must have|essential)[\s\w]*(?:qualifications?|requirements?|skills?|experience)?:?\s*([\s\S]*?)(?=(?:preferred|nice to have|bonus|desired|plus|\n\n|$))"
+    ),
+    re.compile(r"what you(?:'ll)? need:?\s*([\s\S]*?)(?=(?:what we|preferred|bonus|\n\n|$))"),
+    re.compile(r"requirements?:?\s*([\s\S]*?)(?=(?:preferred|bonus|benefits|\n\n|$))"),
+]
+
+_PREFERRED_SKILLS_SECTION_PATTERNS = [
+    re.compile(
+        r"(?:preferred|nice to have|bonus|desired|plus)[\s\w]*(?:qualifications?|requirements?|skills?)?:?\s*([\s\S]*?)(?=(?:benefits|about|equal opportunity|\n\n|$))"
+    ),
+]
+
+
 def extract_required_skills(job_description: str) -> Dict[str, Any]:
     """
     Extract required and preferred skills from a job description.
@@ -641,59 +1077,43 @@ def extract_required_skills(job_description: str) -> Dict[str, Any]:
     text_lower = job_description.lower()
 
     # Find all skills in the document
-    all_skills = extract_all_skills_from_text(job_description)
+    all_skills = extract_all_skills_from_text(text_lower)
 
-    # Try to identify required vs preferred sections
-    required_section = ""
-    preferred_section = ""
-
-    # Common section headers
-    required_patterns = [
-        r"(?:required|minimum|must have|essential)[\s\w]*(?:qualifications?|requirements?|skills?|experience)?:?\s*([\s\S]*?)(?=(?:preferred|nice to have|bonus|desired|plus|\n\n|$))",
-        r"what you(?:'ll)? need:?\s*([\s\S]*?)(?=(?:what we|preferred|bonus|\n\n|$))",
-        r"requirements?:?\s*([\s\S]*?)(?=(?:preferred|bonus|benefits|\n\n|$))",
-    ]
+    return _required_skills_from_scan(text_lower, all_skills)
 
-    preferred_patterns = [
-        r"(?:preferred|nice to have|bonus|desired|plus)[\s\w]*(?:qualifications?|requirements?|skills?)?:?\s*([\s\S]*?)(?=(?:benefits|about|equal opportunity|\n\n|$))",
-    ]
 
-    for pattern in required_patterns:
-        match = re.search(pattern, text_lower, re.IGNORECASE)
+def _required_skills_from_scan(text_lower: str, all_skills: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Split an already-scanned job description into required and preferred skills."""
+    # Try to identify required vs preferred sections
+    required_span = None
+    preferred_span = None
+
+    for pattern in _REQUIRED_SKILLS_SECTION_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
-            required_section = match.group(1)
+            required_span = match.span(1)
             break
 
-    for pattern in preferred_patterns:
-        match = re.search(pattern, text_lower, re.IGNORECASE)
+    for pattern in _PREFERRED_SKILLS_SECTION_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
-            preferred_section = match.group(1)
+            preferred_span = match.span(1)
             break
 
-    # Extract skills from each section
-    required_skills_dict = (
-        extract_all_skills_from_text(required_section) if required_section else {}
+    # Locate skills within each section of the already-scanned text; the results
+    # are sorted below, so the uncategorized hit sets are used directly
+    required_skills = (
+        _skill_hits_in_span(text_lower, all_skills, *required_span) if required_span else set()
     )
-    preferred_skills_dict = (
-        extract_all_skills_from_text(preferred_section) if preferred_section else {}
+    preferred_skills = (
+        _skill_hits_in_span(text_lower, all_skills, *preferred_span) - required_skills
+        if preferred_span
+        else set()
     )
 
-    # Flatten and dedupe
-    required_skills = []
-    for skills in required_skills_dict.values():
-        required_skills.extend(skills)
-    required_skills = list(set(required_skills))
-
-    preferred_skills = []
-    for skills in preferred_skills_dict.values():
-        preferred_skills.extend(skills)
-    preferred_skills = list(set(s for s in preferred_skills if s not in required_skills))
-
     # If we couldn't find sections, use all skills as required
     if not required_skills and not preferred_skills:
-        for skills in all_skills.values():
-            required_skills.extend(skills)
-        required_skills = list(set(required_skills))
+        required_skills = {s for skills in all_skills.values() for s in skills}
 
     return {
         "required": sorted(required_skills),
@@ -717,36 +1137,70 @@ def create_tech_stack_overlap(job_description: str, resume_text: str) -> Dict[st
     job_skills = extract_all_skills_from_text(job_description)
     resume_skills = extract_all_skills_from_text(resume_text)
 
-    matched = {}
-    missing = {}
-    extra = {}
+    return _tech_overlap_from_scan(job_skills, resume_skills)
+
+
+def _build_skill_bit_ids():
+    """
+    Assign every (category, skill) pair a bit for the int bitmasks used by
+    _tech_overlap_from_scan.
 
-    all_categories = set(job_skills.keys()) | set(resume_skills.keys())
+    Bits follow TECH_SKILLS category order with skills sorted inside each
+    category, so decoding a mask from the low bit up yields sorted lists.
+
+    Returns:
+        Tuple of ({category: {skill: bit}}, [(category, skill) by bit index])
+    """
+    bit_ids = {}
+    bit_index_to_skill = []
+    for category, skills in TECH_SKILLS.items():
+        bit_ids[category] = {}
+        for skill in sorted(set(skills)):
+            bit_ids[category][skill] = 1 << len(bit_index_to_skill)
+            bit_index_to_skill.append((category, skill))
+    return bit_ids, bit_index_to_skill
+
+
+_SKILL_BIT_IDS, _BIT_INDEX_TO_SKILL = _build_skill_bit_ids()
+
+
+def _skills_to_mask(skills_by_category: Dict[str, List[str]]) -> int:
+    """Encode extract_all_skills_from_text output as an int bitmask of skill ids."""
+    mask = 0
+    for category, skills in skills_by_category.items():
+        bit_ids = _SKILL_BIT_IDS[category]
+        for skill in skills:
+            mask |= bit_ids[skill]
+    return mask
 
-    total_job_skills = 0
-    total_matched = 0
 
-    for category in all_categories:
-        job_cat_skills = set(job_skills.get(category, []))
-        resume_cat_skills = set(resume_skills.get(category, []))
+def _mask_to_skills(mask: int) -> Dict[str, List[str]]:
+    """Decode a skill bitmask into category -> sorted skill lists."""
+    skills_by_category = {}
+    while mask:
+        low_bit = mask & -mask
+        category, skill = _BIT_INDEX_TO_SKILL[low_bit.bit_length() - 1]
+        skills_by_category.setdefault(category, []).append(skill)
+        mask ^= low_bit
+    return skills_by_category
 
-        cat_matched = job_cat_skills & resume_cat_skills
-        cat_missing = job_cat_skills - resume_cat_skills
-        cat_extra = resume_cat_skills - job_cat_skills
 
-        if cat_matched:
-            matched[category] = sorted(list(cat_matched))
-            total_matched += len(cat_matched)
-        if cat_missing:
-            missing[category] = sorted(list(cat_missing))
-        if cat_extra:
-            extra[category] = sorted(list(cat_extra))
+def _tech_overlap_from_scan(
+    job_skills: Dict[str, List[str]], resume_skills: Dict[str, List[str]]
+) -> Dict[str, Any]:
+    """Build the tech stack overlap result from already-scanned skills."""
+    job_mask = _skills_to_mask(job_skills)
+    resume_mask = _skills_to_mask(resume_skills)
 
-        total_job_skills += len(job_cat_skills)
+    matched_mask = job_mask & resume_mask
+    matched = _mask_to_skills(matched_mask)
+    missing = _mask_to_skills(job_mask & ~resume_mask)
+    extra = _mask_to_skills(resume_mask & ~job_mask)
 
     # Calculate match percentage
+    total_job_skills = job_mask.bit_count()
     if total_job_skills > 0:
-        match_percentage = int((total_matched / total_job_skills) * 100)
+        match_percentage = int((matched_mask.bit_count() / total_job_skills) * 100)
     else:
         match_percentage = 0
 
@@ -794,25 +1248,44 @@ def extract_experience_requirements(job_description: str) -> List[Dict[str, Any]
     if not job_description:
         return []
 
-    requirements = []
-    text = job_description.lower()
-
-    # Patterns to match experience requirements
-    patterns = [
-        # "3+ years of Python" or "3+ years Python"
-        r"(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience\s+(?:with|in)\s+)?([a-zA-Z0-9\s\.\+\#\/\-]+?)(?:\s+experience|\s+development|\s+programming)?(?:[,\.]|\s+and|\s+or|$)",
-        # "3-5 years of Python"
-        r"(\d+)\s*[-–]\s*(\d+)\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience\s+(?:with|in)\s+)?([a-zA-Z0-9\s\.\+\#\/\-]+?)(?:\s+experience|\s+development)?(?:[,\.]|\s+and|\s+or|$)",
-        # "experience with Python (3+ years)"
-        r"(?:experience\s+(?:with|in)\s+)([a-zA-Z0-9\s\.\+\#\/\-]+?)\s*\((\d+)\+?\s*(?:years?|yrs?)\)",
-        # "Python: 3+ years" or "Python - 3 years"
-        r"([a-zA-Z0-9\s\.\+\#\/]+?)[\:\-]\s*(\d+)\+?\s*(?:years?|yrs?)",
-        # "minimum 3 years of Python"
-        r"(?:minimum|min|at\s+least)\s+(\d+)\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience\s+(?:with|in)\s+)?([a-zA-Z0-9\s\.\+\#\/\-]+)",
-    ]
+    requirements = collect_experience_requirements(job_description.lower())
+
+    # Top 15 by years required (descending); ties keep match order like a stable sort
+    return heapq.nlargest(15, requirements, key=itemgetter("years_min"))
+
+
+def analyze_job_fit(
+    job_description: str,
+    resume_text: str,
+    job_title: str = "",
+    experience_requirements: List[Dict] = None,
+) -> Dict[str, Any]:
+    """
+    Analyze how well a candidate fits a job based on description and resume.
+
+    Args:
+        job_description: The job description text
+        resume_text: The candidate's resume text
+        job_title: The job title (for context)
+        experience_requirements: Pre-extracted experience requirements
+
+    Returns:
+        Dictionary with:
+        - pros: List of strengths/matches
+        - gaps: List of gaps/missing requirements
+        - match_score: Overall match percentage (0-100)
+    """
+    if not job_description or not resume_text:
+        return {"pros": [], "gaps": [], "match_score": 0}
+
+    return _job_fit_from_lowered(
+        job_description.lower(), resume_text.lower(), experience_requirements
+    )
+
 
-    # Skills to look for (common tech skills)
-    tech_skills = [
+# Key skills analyze_job_fit looks for (plain substring matches)
+_FIT_SKILL_CATEGORIES = {
+    "Languages": [
         "python",
         "javascript",
         "typescript",
@@ -820,321 +1293,176 @@ def extract_experience_requirements(job_description: str) -> List[Dict[str, Any]
         "c++",
         "c#",
         "go",
-        "golang",
         "rust",
         "ruby",
         "php",
         "swift",
         "kotlin",
         "scala",
-        "r",
         "sql",
+    ],
+    "Frontend": [
         "react",
         "angular",
         "vue",
+        "next.js",
+        "nextjs",
+        "redux",
+        "tailwind",
+        "css",
+        "html",
+        "webpack",
+        "vite",
+    ],
+    "Backend": [
         "node",
-        "nodejs",
         "express",
         "django",
         "flask",
         "spring",
+        "fastapi",
         "rails",
         "laravel",
         ".net",
-        "dotnet",
+        "graphql",
+        "rest api",
+    ],
+    "Cloud & DevOps": [
         "aws",
         "azure",
         "gcp",
         "google cloud",
-        "cloud",
         "kubernetes",
-        "k8s",
         "docker",
         "terraform",
         "ansible",
         "jenkins",
         "ci/cd",
-        "devops",
-        "linux",
-        "unix",
-        "windows server",
-        "networking",
+        "github actions",
+    ],
+    "Databases": [
         "postgresql",
         "mysql",
         "mongodb",
         "redis",
         "elasticsearch",
-        "kafka",
-        "machine learning",
-        "ml",
-        "ai",
-        "data science",
-        "deep learning",
-        "security",
-        "cybersecurity",
-        "devsecops",
-        "penetration testing",
+        "dynamodb",
+        "cassandra",
+        "sqlite",
+    ],
+    "Other Skills": [
+        "git",
+        "linux",
         "agile",
         "scrum",
-        "project management",
-        "leadership",
-        "frontend",
-        "backend",
-        "full stack",
-        "fullstack",
-        "full-stack",
-        "mobile",
-        "ios",
-        "android",
-        "react native",
-        "flutter",
-        "api",
-        "rest",
-        "graphql",
         "microservices",
-    ]
+        "api design",
+        "testing",
+        "security",
+        "machine learning",
+        "data science",
+    ],
+}
 
-    seen_skills = set()
+# Flattened in category order, with the display label used in pros/gaps
+_FIT_SKILLS = tuple(skill for skills in _FIT_SKILL_CATEGORIES.values() for skill in skills)
+_FIT_SKILL_LABELS = {
+    skill: skill.title() if len(skill) > 3 else skill.upper() for skill in _FIT_SKILLS
+}
+# One bit per skill in _FIT_SKILLS order, for the matched/missing bitmasks
+_FIT_SKILL_BITS = {skill: 1 << index for index, skill in enumerate(_FIT_SKILLS)}
 
-    # Try each pattern
-    for pattern in patterns:
-        for match in re.finditer(pattern, text):
-            groups = match.groups()
 
-            # Parse based on pattern structure
-            if len(groups) == 2:
-                # Pattern with years first, then skill
-                if groups[0].isdigit():
-                    years_str, skill = groups
-                    years_min = int(years_str)
-                    years_max = None
-                else:
-                    # Pattern with skill first, then years
-                    skill, years_str = groups
-                    years_min = int(years_str)
-                    years_max = None
-            elif len(groups) == 3:
-                # Range pattern: min-max years skill
-                if groups[0].isdigit() and groups[1].isdigit():
-                    years_min = int(groups[0])
-                    years_max = int(groups[1])
-                    skill = groups[2]
-                else:
-                    # skill (years) pattern
-                    skill = groups[0]
-                    years_min = int(groups[1])
-                    years_max = None
-            else:
-                continue
+def _build_fit_skill_automaton():
+    """
+    Build an Aho-Corasick automaton over the skills in _FIT_SKILLS.
 
-            # Clean up skill name
-            skill = skill.strip().strip(".,;:")
+    Returns:
+        ahocorasick.Automaton, or None if pyahocorasick is not installed
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
 
-            # Skip if skill is too short or too long
-            if len(skill) < 2 or len(skill) > 50:
-                continue
+    automaton = ahocorasick.Automaton()
+    for skill in _FIT_SKILLS:
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
 
-            # Skip common non-skill words
-            skip_words = [
-                "experience",
-                "required",
-                "preferred",
-                "minimum",
-                "years",
-                "the",
-                "and",
-                "or",
-                "with",
-                "in",
-                "of",
-                "for",
-                "a",
-                "an",
-                "role",
-                "position",
-                "job",
-                "work",
-                "working",
-                "related",
-            ]
-            if skill.lower() in skip_words:
-                continue
 
-            # Create unique key to avoid duplicates
-            skill_key = skill.lower().strip()
-            if skill_key in seen_skills:
-                continue
-            seen_skills.add(skill_key)
+_FIT_SKILL_AUTOMATON = _build_fit_skill_automaton()
 
-            requirements.append(
-                {
-                    "skill": skill.title() if len(skill) > 3 else skill.upper(),
-                    "years_min": years_min,
-                    "years_max": years_max,
-                    "raw_text": match.group(0).strip()[:100],
-                }
-            )
 
-    # Also look for general experience requirements
-    general_patterns = [
-        (
-            r"(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:professional\s+)?(?:software|engineering|development)\s+experience",
-            "Software Development",
-        ),
-        (
-            r"(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:professional\s+)?(?:industry|work)\s+experience",
-            "Professional Experience",
-        ),
-        (
-            r"(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:relevant|related)\s+experience",
-            "Relevant Experience",
-        ),
-    ]
+def _fit_skill_mask(text_lower: str) -> int:
+    """Return a _FIT_SKILL_BITS bitmask of the skills occurring anywhere in text_lower."""
+    mask = 0
+    if _FIT_SKILL_AUTOMATON is not None:
+        # One pass over the text instead of a substring scan per skill
+        for _end, skill in _FIT_SKILL_AUTOMATON.iter(text_lower):
+            mask |= _FIT_SKILL_BITS[skill]
+        return mask
 
-    for pattern, skill_name in general_patterns:
-        match = re.search(pattern, text)
-        if match:
-            skill_key = skill_name.lower()
-            if skill_key not in seen_skills:
-                seen_skills.add(skill_key)
-                requirements.append(
-                    {
-                        "skill": skill_name,
-                        "years_min": int(match.group(1)),
-                        "years_max": None,
-                        "raw_text": match.group(0).strip()[:100],
-                    }
-                )
+    for skill in _FIT_SKILLS:
+        if skill in text_lower:
+            mask |= _FIT_SKILL_BITS[skill]
+    return mask
 
-    # Sort by years required (descending)
-    requirements.sort(key=lambda x: x["years_min"], reverse=True)
 
-    return requirements[:15]  # Limit to top 15
+def _fit_mask_to_skills(mask: int) -> List[str]:
+    """Decode a _FIT_SKILL_BITS bitmask into skills in _FIT_SKILLS order."""
+    skills = []
+    while mask:
+        low_bit = mask & -mask
+        skills.append(_FIT_SKILLS[low_bit.bit_length() - 1])
+        mask ^= low_bit
+    return skills
 
 
-def analyze_job_fit(
-    job_description: str,
-    resume_text: str,
-    job_title: str = "",
-    experience_requirements: List[Dict] = None,
-) -> Dict[str, Any]:
+def _fit_skill_counts(text_lower: str) -> Dict[str, int]:
     """
-    Analyze how well a candidate fits a job based on description and resume.
+    Count the _FIT_SKILLS occurring in text_lower.
 
-    Args:
-        job_description: The job description text
-        resume_text: The candidate's resume text
-        job_title: The job title (for context)
-        experience_requirements: Pre-extracted experience requirements
+    Counts match text_lower.count(skill): occurrences overlapping an earlier
+    counted one (e.g. "typescriptypescript") are skipped.
 
     Returns:
-        Dictionary with:
-        - pros: List of strengths/matches
-        - gaps: List of gaps/missing requirements
-        - match_score: Overall match percentage (0-100)
+        Dict of skill -> occurrence count, only for skills that occur
     """
-    if not job_description or not resume_text:
-        return {"pros": [], "gaps": [], "match_score": 0}
-
-    job_lower = job_description.lower()
-    resume_lower = resume_text.lower()
-
+    if _FIT_SKILL_AUTOMATON is None:
+        return {skill: text_lower.count(skill) for skill in _FIT_SKILLS if skill in text_lower}
+
+    # The automaton emits every occurrence in order of its end, so one pass
+    # yields the counts without a text_lower.count() scan per skill
+    counts = {}
+    last_end = {}
+    for end, skill in _FIT_SKILL_AUTOMATON.iter(text_lower):
+        if end - len(skill) >= last_end.get(skill, -1):
+            counts[skill] = counts.get(skill, 0) + 1
+            last_end[skill] = end
+    return counts
+
+
+def _job_fit_from_lowered(
+    job_lower: str, resume_lower: str, experience_requirements: Optional[List[Dict]]
+) -> Dict[str, Any]:
+    """Compute pros/gaps/match_score from lowercased job description and resume."""
     pros = []
     gaps = []
 
-    # Key skills to look for
-    skill_categories = {
-        "Languages": [
-            "python",
-            "javascript",
-            "typescript",
-            "java",
-            "c++",
-            "c#",
-            "go",
-            "rust",
-            "ruby",
-            "php",
-            "swift",
-            "kotlin",
-            "scala",
-            "sql",
-        ],
-        "Frontend": [
-            "react",
-            "angular",
-            "vue",
-            "next.js",
-            "nextjs",
-            "redux",
-            "tailwind",
-            "css",
-            "html",
-            "webpack",
-            "vite",
-        ],
-        "Backend": [
-            "node",
-            "express",
-            "django",
-            "flask",
-            "spring",
-            "fastapi",
-            "rails",
-            "laravel",
-            ".net",
-            "graphql",
-            "rest api",
-        ],
-        "Cloud & DevOps": [
-            "aws",
-            "azure",
-            "gcp",
-            "google cloud",
-            "kubernetes",
-            "docker",
-            "terraform",
-            "ansible",
-            "jenkins",
-            "ci/cd",
-            "github actions",
-        ],
-        "Databases": [
-            "postgresql",
-            "mysql",
-            "mongodb",
-            "redis",
-            "elasticsearch",
-            "dynamodb",
-            "cassandra",
-            "sqlite",
-        ],
-        "Other Skills": [
-            "git",
-            "linux",
-            "agile",
-            "scrum",
-            "microservices",
-            "api design",
-            "testing",
-            "security",
-            "machine learning",
-            "data science",
-        ],
-    }
-
-    matched_skills = []
-    missing_skills = []
+    job_skill_counts = _fit_skill_counts(job_lower)
+    job_mask = 0
+    for skill in job_skill_counts:
+        job_mask |= _FIT_SKILL_BITS[skill]
+    resume_mask = _fit_skill_mask(resume_lower) if job_mask else 0
 
-    for category, skills in skill_categories.items():
-        for skill in skills:
-            in_job = skill in job_lower
-            in_resume = skill in resume_lower
-
-            if in_job and in_resume:
-                matched_skills.append(skill.title() if len(skill) > 3 else skill.upper())
-            elif in_job and not in_resume:
-                missing_skills.append(skill.title() if len(skill) > 3 else skill.upper())
+    # matched_skills holds display labels; missing_skills keeps the lowercase
+    # skill so the gaps below can look up its count
+    matched_skills = [
+        _FIT_SKILL_LABELS[skill] for skill in _fit_mask_to_skills(job_mask & resume_mask)
+    ]
+    missing_skills = _fit_mask_to_skills(job_mask & ~resume_mask)
 
     # Build pros list
     if matched_skills:
@@ -1168,11 +1496,10 @@ def analyze_job_fit(
         "junior": ["junior", "jr.", "entry", "associate", "graduate"],
     }
 
+    # The resume is only searched for levels/education the job mentions; short
+    # or generic descriptions then cost a few substring checks of the job text
     for level, keywords in experience_keywords.items():
-        job_has_level = any(kw in job_lower for kw in keywords)
-        resume_has_level = any(kw in resume_lower for kw in keywords)
-
-        if job_has_level and resume_has_level:
+        if any(kw in job_lower for kw in keywords) and any(kw in resume_lower for kw in keywords):
             pros.append(
                 {
                     "type": "experience",
@@ -1183,10 +1510,9 @@ def analyze_job_fit(
 
     # Check for education match
     edu_keywords = ["bachelor", "master", "phd", "degree", "computer science", "engineering"]
-    job_edu = [kw for kw in edu_keywords if kw in job_lower]
-    resume_edu = [kw for kw in edu_keywords if kw in resume_lower]
-
-    if job_edu and resume_edu:
+    if any(kw in job_lower for kw in edu_keywords) and any(
+        kw in resume_lower for kw in edu_keywords
+    ):
         pros.append(
             {
                 "type": "education",
@@ -1198,11 +1524,10 @@ def analyze_job_fit(
     # Build gaps list
     if missing_skills:
         # Prioritize gaps based on frequency in job description
-        skill_freq = {}
-        for skill in missing_skills:
-            skill_freq[skill] = job_lower.count(skill.lower())
-
-        sorted_missing = sorted(missing_skills, key=lambda s: skill_freq.get(s, 0), reverse=True)
+        sorted_missing = [
+            _FIT_SKILL_LABELS[skill]
+            for skill in sorted(missing_skills, key=job_skill_counts.__getitem__, reverse=True)
+        ]
 
         critical_gaps = sorted_missing[:3]
         if critical_gaps:
@@ -1247,7 +1572,8 @@ def analyze_job_fit(
                 )
 
     # Calculate match score
-    total_job_skills = len(set(missing_skills + matched_skills))
+    # Every job skill is either matched or missing, never both
+    total_job_skills = job_mask.bit_count()
     if total_job_skills > 0:
         match_score = int((len(matched_skills) / total_job_skills) * 100)
     else:
@@ -1270,6 +1596,95 @@ def analyze_job_fit(
     }
 
 
+def analyze_job_text(job_description: str, resume_text: str, job_title: str = "") -> Dict[str, Any]:
+    """
+    Run the rule-based job analysis in one pass over each document.
+
+    Equivalent to calling extract_experience_requirements,
+    extract_required_skills, create_tech_stack_overlap and analyze_job_fit
+    separately, but each text is lowercased and skill-scanned only once.
+
+    Args:
+        job_description: The job description text
+        resume_text: The candidate's resume text
+        job_title: The job title (for context)
+
+    Returns:
+        Dictionary with:
+        - experience_requirements: Same as extract_experience_requirements()
+        - skills: Same as extract_required_skills()
+        - tech_stack_overlap: Same as create_tech_stack_overlap()
+        - fit: Same as analyze_job_fit()
+    """
+    job_lower = (job_description or "").lower()
+    resume_lower = (resume_text or "").lower()
+
+    job_skills = extract_all_skills_from_text(job_lower)
+    resume_skills = extract_all_skills_from_text(resume_lower)
+    experience_requirements = extract_experience_requirements(job_lower)
+
+    if job_lower:
+        skills = _required_skills_from_scan(job_lower, job_skills)
+    else:
+        skills = {"required": [], "preferred": [], "all_skills": {}}
+
+    if job_lower and resume_lower:
+        fit = _job_fit_from_lowered(job_lower, resume_lower, experience_requirements)
+    else:
+        fit = {"pros": [], "gaps": [], "match_score": 0}
+
+    return {
+        "experience_requirements": experience_requirements,
+        "skills": skills,
+        "tech_stack_overlap": _tech_overlap_from_scan(job_skills, resume_skills),
+        "fit": fit,
+    }
+
+
+# Braces and whole (possibly unterminated) JSON strings, so braces inside
+# strings are skipped; each alternative is unambiguous, keeping the scan linear
+_JSON_BRACE_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\[\s\S])*"?|[{}]')
+
+
+def _extract_json_blob(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} object in text, or None.
+
+    Replaces a greedy first-"{"-to-last-"}" regex, which backtracks quadratically
+    when a response has many "{" and no closing "}", and which swallowed any
+    trailing text containing a "}" after the object.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+
+    depth = 0
+    for token in _JSON_BRACE_TOKEN_RE.finditer(text, start):
+        brace = text[token.start()]
+        if brace == "{":
+            depth += 1
+        elif brace == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : token.end()]
+    return None
+
+
+def _loads_json(data: str) -> Any:
+    """
+    Parse JSON with orjson when it is installed, else the json module.
+
+    Input orjson rejects but json accepts (NaN, lone surrogate escapes, huge
+    integers) is retried with json so results don't depend on the parser.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def analyze_job_with_ai(
     job_description: str,
     resume_text: str,
@@ -1316,9 +1731,9 @@ Respond ONLY with valid JSON, no other text."""
         # Parse JSON response
         try:
             # Try to extract JSON from response
-            json_match = re.search(r"\{[\s\S]*\}", response)
-            if json_match:
-                result = json.loads(json_match.group())
+            json_blob = _extract_json_blob(response)
+            if json_blob:
+                result = _loads_json(json_blob)
                 return result
         except json.JSONDecodeError:
             logger.warning("Failed to parse AI analysis response as JSON")
@@ -1330,6 +1745,102 @@ Respond ONLY with valid JSON, no other text."""
     return None
 
 
+# Scam indicators: (pattern, reason)
+_SCAM_PATTERNS = [
+    (re.compile(p), reason)
+    for p, reason in [
+        (r"no\s+experience\s+required", "Too good to be true - no experience for technical role"),
+        (r"work\s+from\s+home\s+\$\d+k", "Suspicious work-from-home salary claim"),
+        (r"unlimited\s+earning", "MLM/scam language"),
+        (r"be\s+your\s+own\s+boss", "MLM/scam language"),
+        (r"(?:urgent|immediate)\s+(?:hire|hiring|start)", "Pressure tactics"),
+    ]
+]
+
+# Culture red flags: (pattern, reason, severity)
+_CULTURE_PATTERNS = [
+    (re.compile(p), reason, severity)
+    for p, reason, severity in [
+        (r"not\s+a\s+9[\s-]to[\s-]5", "Expects overtime as standard", "warning"),
+        (r"fast[\s-]paced\s+environment", "May indicate poor work-life balance", "info"),
+        (r"wear\s+many\s+hats", "Underfunded - will do multiple jobs", "info"),
+        (r"like\s+a\s+family", "Boundary issues, unpaid overtime expected", "warning"),
+        (r"50[\s-]60\+?\s+hours?", "Explicitly requires 50-60+ hour weeks", "critical"),
+        (r"60[\s-]80\+?\s+hours?", "Explicitly requires 60-80+ hour weeks", "critical"),
+        (r"most\s+challenging\s+job", "Warning sign for unrealistic expectations", "warning"),
+        (r"hustle", "Hustle culture, likely overwork expected", "warning"),
+        (r"rockstar|ninja|guru", "Cringe culture, unrealistic role expectations", "info"),
+    ]
+]
+
+_RED_FLAG_PATTERNS = [pattern for pattern, _ in _SCAM_PATTERNS] + [
+    pattern for pattern, _, _ in _CULTURE_PATTERNS
+]
+
+# Number in a relative posted date like "2 weeks ago"
+_POSTED_AGO_NUMBER_RE = re.compile(r"(\d+)")
+
+# First dollar amount in a posting: thousands plus an optional 3-digit remainder
+_SALARY_RE = re.compile(r"\$(\d{2,3})[,\s]*(\d{3})?")
+
+# re's \s also matches these ASCII separators; Hyperscan's does not
+_HYPERSCAN_UNSAFE_SPACE_RE = re.compile(r"[\x1c-\x1f]")
+
+
+def _build_red_flag_database():
+    """
+    Compile _RED_FLAG_PATTERNS into one Hyperscan database, so a single scan
+    reports every pattern present (CPython re has no multi-pattern matcher; a
+    combined alternation is slower than the separate searches).
+
+    Returns:
+        hyperscan.Database, or None if python-hyperscan is not installed
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=[pattern.pattern.encode("ascii") for pattern in _RED_FLAG_PATTERNS],
+        ids=list(range(len(_RED_FLAG_PATTERNS))),
+        elements=len(_RED_FLAG_PATTERNS),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_RED_FLAG_PATTERNS),
+    )
+    return database
+
+
+_RED_FLAG_DATABASE = _build_red_flag_database()
+
+
+def _red_flag_patterns_in(text_lower: str) -> set:
+    """Return the _RED_FLAG_PATTERNS that match somewhere in text_lower."""
+    # Hyperscan's \s and \d are ASCII-only, so it is used only where they agree with re
+    if (
+        _RED_FLAG_DATABASE is not None
+        and text_lower.isascii()
+        and not _HYPERSCAN_UNSAFE_SPACE_RE.search(text_lower)
+    ):
+        import hyperscan
+
+        scratch = getattr(_hyperscan_local, "red_flag_scratch", None)
+        if scratch is None:
+            scratch = _hyperscan_local.red_flag_scratch = hyperscan.Scratch(_RED_FLAG_DATABASE)
+
+        found = set()
+        _RED_FLAG_DATABASE.scan(
+            text_lower.encode("ascii"),
+            match_event_handler=lambda pattern_id, _start, _end, _flags, _context: found.add(
+                _RED_FLAG_PATTERNS[pattern_id]
+            ),
+            scratch=scratch,
+        )
+        return found
+
+    return {pattern for pattern in _RED_FLAG_PATTERNS if pattern.search(text_lower)}
+
+
 def detect_red_flags(
     job_description: str,
     job_title: str,
@@ -1345,10 +1856,24 @@ def detect_red_flags(
     - severity: "critical" | "warning" | "info"
     - reason: Detailed explanation
     """
-    red_flags = []
-
     if not job_description:
-        return red_flags
+        return []
+
+    return pickle.loads(
+        _red_flags_pickle(job_description, job_title, company, posted_date, applicant_count)
+    )
+
+
+@lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)
+def _red_flags_pickle(
+    job_description: str,
+    job_title: str,
+    company: str,
+    posted_date: Optional[str],
+    applicant_count: Optional[int],
+) -> bytes:
+    """Run detect_red_flags, memoized like _structured_requirements_pickle."""
+    red_flags = []
 
     text_lower = job_description.lower()
     title_lower = job_title.lower() if job_title else ""
@@ -1361,8 +1886,9 @@ def detect_red_flags(
 
             if isinstance(posted_date, str):
                 # Parse relative dates like "1 month ago", "2 weeks ago"
-                if "month" in posted_date.lower():
-                    months = int(re.search(r"(\d+)", posted_date).group(1))
+                posted_lower = posted_date.lower()
+                if "month" in posted_lower:
+                    months = int(_POSTED_AGO_NUMBER_RE.search(posted_date).group(1))
                     if months >= 1:
                         red_flags.append(
                             {
@@ -1371,8 +1897,8 @@ def detect_red_flags(
                                 "reason": f"Posted {months} month(s) ago - may be filled or have many applicants",
                             }
                         )
-                elif "week" in posted_date.lower():
-                    weeks = int(re.search(r"(\d+)", posted_date).group(1))
+                elif "week" in posted_lower:
+                    weeks = int(_POSTED_AGO_NUMBER_RE.search(posted_date).group(1))
                     if weeks >= 3:
                         red_flags.append(
                             {
@@ -1394,17 +1920,12 @@ def detect_red_flags(
             }
         )
 
-    # === SCAM INDICATORS ===
-    scam_patterns = [
-        (r"no\s+experience\s+required", "Too good to be true - no experience for technical role"),
-        (r"work\s+from\s+home\s+\$\d+k", "Suspicious work-from-home salary claim"),
-        (r"unlimited\s+earning", "MLM/scam language"),
-        (r"be\s+your\s+own\s+boss", "MLM/scam language"),
-        (r"(?:urgent|immediate)\s+(?:hire|hiring|start)", "Pressure tactics"),
-    ]
+    # Every scam/culture pattern found in the text, from one scan when possible
+    found_patterns = _red_flag_patterns_in(text_lower)
 
-    for pattern, reason in scam_patterns:
-        if re.search(pattern, text_lower):
+    # === SCAM INDICATORS ===
+    for pattern, reason in _SCAM_PATTERNS:
+        if pattern in found_patterns:
             red_flags.append(
                 {"flag": "Potential scam indicator", "severity": "critical", "reason": reason}
             )
@@ -1437,30 +1958,19 @@ def detect_red_flags(
         )
 
     # === CULTURE RED FLAGS ===
-    culture_issues = [
-        (r"not\s+a\s+9[\s-]to[\s-]5", "Expects overtime as standard", "warning"),
-        (r"fast[\s-]paced\s+environment", "May indicate poor work-life balance", "info"),
-        (r"wear\s+many\s+hats", "Underfunded - will do multiple jobs", "info"),
-        (r"like\s+a\s+family", "Boundary issues, unpaid overtime expected", "warning"),
-        (r"50[\s-]60\+?\s+hours?", "Explicitly requires 50-60+ hour weeks", "critical"),
-        (r"60[\s-]80\+?\s+hours?", "Explicitly requires 60-80+ hour weeks", "critical"),
-        (r"most\s+challenging\s+job", "Warning sign for unrealistic expectations", "warning"),
-        (r"hustle", "Hustle culture, likely overwork expected", "warning"),
-        (r"rockstar|ninja|guru", "Cringe culture, unrealistic role expectations", "info"),
-    ]
-
-    for pattern, reason, severity in culture_issues:
-        if re.search(pattern, text_lower):
+    for pattern, reason, severity in _CULTURE_PATTERNS:
+        if pattern in found_patterns:
             red_flags.append({"flag": "Culture concern", "severity": severity, "reason": reason})
 
     # === COMPENSATION RED FLAGS ===
     # Low salary for senior role
-    salary_match = re.search(r"\$(\d{2,3})[,\s]*(\d{3})?", job_description)
+    salary_match = _SALARY_RE.search(job_description)
     if salary_match and "senior" in title_lower:
         try:
-            salary = int(salary_match.group(1)) * 1000
-            if salary_match.group(2):
-                salary = int(salary_match.group(1) + salary_match.group(2))
+            thousands, remainder = salary_match.groups()
+            salary = int(thousands) * 1000
+            if remainder:
+                salary += int(remainder)
             if salary < 100000:
                 red_flags.append(
                     {
@@ -1480,7 +1990,19 @@ def detect_red_flags(
             {"flag": "No salary info", "severity": "info", "reason": "Salary not disclosed"}
         )
 
-    return red_flags
+    return pickle.dumps(red_flags, pickle.HIGHEST_PROTOCOL)
+
+
+def _match_resumes(
+    requirements: Dict[str, Any], resume_texts: List[str], matches: Dict[str, Dict[str, Any]]
+) -> None:
+    """
+    Add match_requirements_to_resume results to matches for each resume text
+    not already in it, matching each distinct text once.
+    """
+    for text in dict.fromkeys(resume_texts):
+        if text and text not in matches:
+            matches[text] = match_requirements_to_resume(requirements, text)
 
 
 def analyze_job_comprehensive(
@@ -1538,16 +2060,22 @@ def analyze_job_comprehensive(
         result["recommendation_reason"] = critical_flags[0]["reason"]
         return result
 
+    # Requirements are fixed for this job, so each distinct resume text is
+    # matched once and reused by the resume recommendation below
+    resume_matches = {}
+
     # === 3. MATCH REQUIREMENTS TO RESUME ===
     if resume_text:
-        req_match = match_requirements_to_resume(requirements, resume_text)
+        # Lowercased once here for both the requirement match and the dealbreaker checks
+        resume_lower = resume_text.lower()
+        req_match = _match_requirements_to_lowered_resume(requirements, resume_text, resume_lower)
+        resume_matches[resume_text] = req_match
         result["requirements_match"] = req_match
 
         # Identify key dealbreakers
         dealbreakers = []
 
         # Check experience gaps
-        resume_lower = resume_text.lower()
         for exp in requirements.get("experience", []):
             skill = exp.get("skill", "").lower()
             years = exp.get("years", 0)
@@ -1649,12 +2177,16 @@ def analyze_job_comprehensive(
         best_resume = None
         best_match = 0
 
-        for resume in all_resumes:
-            resume_content = resume.get("content", "") or resume.get("full_text", "")
+        resume_contents = [
+            resume.get("content", "") or resume.get("full_text", "") for resume in all_resumes
+        ]
+        _match_resumes(requirements, resume_contents, resume_matches)
+
+        for resume, resume_content in zip(all_resumes, resume_contents):
             if not resume_content:
                 continue
 
-            resume_match = match_requirements_to_resume(requirements, resume_content)
+            resume_match = resume_matches[resume_content]
             match_pct = resume_match.get("match_summary", {}).get("match_percentage", 0)
 
             if match_pct > best_match:
@@ -1702,7 +2234,6 @@ def quick_pre_filter(job: Dict) -> Optional[Tuple[bool, int, str]]:
     """
     title = (job.get("title") or "").lower()
     company = (job.get("company") or "").lower()
-    description = (job.get("job_description") or job.get("full_description") or "").lower()
 
     # Skip jobs with malformed/garbled titles
     if title:
@@ -1720,42 +2251,5 @@ def quick_pre_filter(job: Dict) -> Optional[Tuple[bool, int, str]]:
     if company in ["unknown", "confidential", "", "n/a"]:
         return (True, 25, "Unknown company")
 
-    # Check for obvious role mismatches in title
-    skip_titles = [
-        "manager",
-        "director",
-        "vp ",
-        "vice president",
-        "chief ",
-        "cto",
-        "ceo",
-        "cfo",
-        "principal",
-        "staff engineer",
-        "distinguished",
-        "fellow",
-        "intern",
-        "internship",
-        "sales",
-        "marketing",
-        "recruiter",
-        "hr ",
-        "human resources",
-        "nurse",
-        "doctor",
-        "physician",
-        "lawyer",
-        "attorney",
-        "driver",
-        "warehouse",
-        "retail",
-        "cashier",
-    ]
-
-    for skip in skip_titles:
-        if skip in title:
-            # These might still be valid, just lower priority
-            return None
-
     # No pre-filter, let AI score it
     return None
@@ -82,9 +82,7 @@ class OpenAIProvider(AIProvider):
         prompt = build_filter_and_score_prompt(job_data, resume_text, preferences)
 
         try:
-            response = self._generate(prompt, max_tokens=500)
-            result = self._parse_json_response(response)
-            return result
+            return self._generate_json(prompt, max_tokens=500)
         except Exception as e:
             logger.error(f"AI filter error: {e}")
             return {
@@ -100,8 +98,7 @@ class OpenAIProvider(AIProvider):
         prompt = build_analyze_job_prompt(job_data, resume_text)
 
         try:
-            response = self._generate(prompt, max_tokens=1000)
-            return self._parse_json_response(response)
+            return self._generate_json(prompt, max_tokens=1000)
         except Exception as e:
             logger.error(f"Analysis error: {e}")
             return {
@@ -168,8 +165,7 @@ class OpenAIProvider(AIProvider):
             if search_result.description:
                 prompt = build_extract_from_page_prompt(search_result.description, company, title)
                 try:
-                    response = self._generate(prompt, max_tokens=1500)
-                    extracted = self._parse_json_response(response)
+                    extracted = self._generate_json(prompt, max_tokens=1500)
 
                     # Merge search result with AI extraction
                     return {
@@ -206,8 +202,7 @@ class OpenAIProvider(AIProvider):
         prompt = build_classify_email_prompt(subject, sender, body)
 
         try:
-            response = self._generate(prompt, max_tokens=500)
-            return self._parse_json_response(response)
+            return self._generate_json(prompt, max_tokens=500)
         except Exception as e:
             logger.error(f"Email classification error: {e}")
             return {
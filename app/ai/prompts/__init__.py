@@ -6,7 +6,7 @@ Using the same prompts ensures consistent output format regardless of which
 AI backend is used.
 """
 
-from .filter_and_score import build_filter_and_score_prompt
+from .filter_and_score import build_filter_and_score_prompt, build_filter_and_score_batch_prompt
 from .analyze_job import build_analyze_job_prompt
 from .cover_letter import build_cover_letter_prompt
 from .interview_answer import build_interview_answer_prompt
@@ -16,6 +16,7 @@ from .extract_jobs import build_extract_jobs_prompt
 
 __all__ = [
     "build_filter_and_score_prompt",
+    "build_filter_and_score_batch_prompt",
     "build_analyze_job_prompt",
     "build_cover_letter_prompt",
     "build_interview_answer_prompt",
@@ -12,6 +12,9 @@ def build_analyze_job_prompt(job_data: Dict[str, Any], resume_text: str) -> str:
     """
     Build the prompt for detailed job analysis.
 
+    The instructions come first and the job last so the prompt prefix shared by
+    every job (instructions plus resume) can be reused by providers' prompt caching.
+
     Args:
         job_data: Job dictionary with title, company, location, raw_text
         resume_text: Combined text from all user's resumes
@@ -21,15 +24,6 @@ def build_analyze_job_prompt(job_data: Dict[str, Any], resume_text: str) -> str:
     """
     return f"""Analyze job fit with strict accuracy. Respond ONLY with valid JSON.
 
-CANDIDATE'S RESUME:
-{resume_text}
-
-JOB LISTING:
-Title: {job_data.get('title', 'Unknown')}
-Company: {job_data.get('company', 'Unknown')}
-Location: {job_data.get('location', 'Unknown')}
-Details: {job_data.get('raw_text', 'No description available')}
-
 CRITICAL INSTRUCTIONS:
 1. ONLY mention job titles/roles the candidate has ACTUALLY held (check resume carefully)
 2. ONLY cite technologies/skills explicitly listed in resume
@@ -51,4 +45,13 @@ Return JSON:
     "recommendation": "2-3 sentence honest assessment",
     "resume_to_use": "backend|cloud|fullstack"
 }}
+
+CANDIDATE'S RESUME:
+{resume_text}
+
+JOB LISTING:
+Title: {job_data.get('title', 'Unknown')}
+Company: {job_data.get('company', 'Unknown')}
+Location: {job_data.get('location', 'Unknown')}
+Details: {job_data.get('raw_text', 'No description available')}
 """
@@ -27,17 +27,10 @@ def build_cover_letter_prompt(
 
     strengths_str = ", ".join(strengths) if strengths else "Not analyzed yet"
 
+    # Rules and resume first, job-specific details last, so the prefix shared by
+    # every letter for this resume can be reused by providers' prompt caching
     return f"""Write a tailored cover letter (3-4 paragraphs, under 350 words).
 
-JOB: {job.get('title', 'Unknown')} at {job.get('company', 'Unknown')}
-Location: {job.get('location', 'Unknown')}
-Details: {job.get('raw_text', job.get('description', 'No description available'))}
-
-CANDIDATE RESUME:
-{resume_text}
-
-VERIFIED STRENGTHS: {strengths_str}
-
 CRITICAL RULES:
 1. ONLY cite experience and skills that are explicitly in the resume
 2. Do NOT invent or extrapolate qualifications
@@ -46,4 +39,13 @@ CRITICAL RULES:
 5. Address specific job requirements where the candidate has matching experience
 6. Be honest about gaps but frame positively
 
+CANDIDATE RESUME:
+{resume_text}
+
+JOB: {job.get('title', 'Unknown')} at {job.get('company', 'Unknown')}
+Location: {job.get('location', 'Unknown')}
+Details: {job.get('raw_text', job.get('description', 'No description available'))}
+
+VERIFIED STRENGTHS: {strengths_str}
+
 Write the cover letter now:"""
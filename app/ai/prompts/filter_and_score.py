@@ -8,37 +8,22 @@ It evaluates location, skill level, and overall fit.
 from typing import Any, Dict, List
 
 
-def build_filter_and_score_prompt(
-    job_data: Dict[str, Any], resume_text: str, preferences: Dict[str, Any]
-) -> str:
+def _build_filter_instructions(preferences: Dict[str, Any]) -> str:
     """
-    Build the prompt for job filtering and baseline scoring.
+    Build the scoring instructions shared by the single-job and batch prompts.
 
     Args:
-        job_data: Job dictionary with title, company, location, raw_text
         preferences: User preferences with location_filter, experience_level, exclude_keywords
 
     Returns:
-        str: Formatted prompt string
+        str: The CRITICAL INSTRUCTIONS section, ending in a blank line
     """
     location_filter = preferences.get("location_filter", "")
-    experience_level = preferences.get("experience_level", {})
     exclude_keywords = preferences.get("exclude_keywords", [])
 
     exclude_str = ", ".join(exclude_keywords) if exclude_keywords else "None"
 
-    return f"""Analyze this job for filtering and baseline scoring. Be STRICT about tech stack matching.
-
-CANDIDATE'S RESUME:
-{resume_text}
-
-JOB:
-Title: {job_data.get('title', 'Unknown')}
-Company: {job_data.get('company', 'Unknown')}
-Location: {job_data.get('location', 'Unknown')}
-Brief Description: {(job_data.get('raw_text') or 'No description available')[:1500]}
-
-CRITICAL INSTRUCTIONS:
+    return f"""CRITICAL INSTRUCTIONS:
 
 1. LOCATION FILTER:
 {location_filter}
@@ -89,7 +74,41 @@ CRITICAL INSTRUCTIONS:
    A score of 50-70 should mean decent match but some gaps.
    A score below 50 should mean significant mismatches.
 
-Return JSON only:
+"""
+
+
+def _format_job_fields(job_data: Dict[str, Any]) -> str:
+    """Format the title, company, location and description lines for one job."""
+    title = job_data.get("title", "Unknown")
+    company = job_data.get("company", "Unknown")
+    location = job_data.get("location", "Unknown")
+    description = (job_data.get("raw_text") or "No description available")[:1500]
+    return f"""Title: {title}
+Company: {company}
+Location: {location}
+Brief Description: {description}"""
+
+
+def build_filter_and_score_prompt(
+    job_data: Dict[str, Any], resume_text: str, preferences: Dict[str, Any]
+) -> str:
+    """
+    Build the prompt for job filtering and baseline scoring.
+
+    Args:
+        job_data: Job dictionary with title, company, location, raw_text
+        preferences: User preferences with location_filter, experience_level, exclude_keywords
+
+    Returns:
+        str: Formatted prompt string
+    """
+    instructions = _build_filter_instructions(preferences)
+
+    # Instructions (fixed for a scan's preferences) and resume come first and the
+    # job last, so every job in a scan shares the prefix providers cache
+    return f"""Analyze this job for filtering and baseline scoring. Be STRICT about tech stack matching.
+
+{instructions}Return JSON only:
 {{
     "keep": <bool>,
     "baseline_score": <1-100>,
@@ -99,4 +118,58 @@ Return JSON only:
     "tech_stack_match": "excellent|good|partial|poor",
     "missing_key_skills": ["skill1", "skill2"]
 }}
+
+CANDIDATE'S RESUME:
+{resume_text}
+
+JOB:
+{_format_job_fields(job_data)}
+"""
+
+
+def build_filter_and_score_batch_prompt(
+    jobs: List[Dict[str, Any]], resume_text: str, preferences: Dict[str, Any]
+) -> str:
+    """
+    Build one filtering and scoring prompt for several jobs.
+
+    The instructions and resume are sent once and the jobs follow as a numbered
+    list; the model answers with a JSON array holding one object per job, in order.
+
+    Args:
+        jobs: Job dictionaries with title, company, location, raw_text
+        resume_text: Combined text from all user's resumes
+        preferences: User preferences with location_filter, experience_level, exclude_keywords
+
+    Returns:
+        str: Formatted prompt string
+    """
+    instructions = _build_filter_instructions(preferences)
+
+    job_blocks = "\n\n".join(
+        f"{number}.\n{_format_job_fields(job_data)}"
+        for number, job_data in enumerate(jobs, start=1)
+    )
+
+    return f"""Analyze each job below for filtering and baseline scoring. Be STRICT about tech stack matching. Score every job on its own, applying these instructions to each.
+
+{instructions}Return JSON only: an array with exactly one object per job, in the same order as the JOBS list:
+[
+    {{
+        "index": <job number from the JOBS list>,
+        "keep": <bool>,
+        "baseline_score": <1-100>,
+        "filter_reason": "kept: good location match" OR "filtered: outside target location",
+        "location_match": "remote|primary_location|secondary_location|excluded",
+        "skill_level_match": "entry_level|good_fit|slightly_senior|too_senior",
+        "tech_stack_match": "excellent|good|partial|poor",
+        "missing_key_skills": ["skill1", "skill2"]
+    }}
+]
+
+CANDIDATE'S RESUME:
+{resume_text}
+
+JOBS ({len(jobs)}):
+{job_blocks}
 """
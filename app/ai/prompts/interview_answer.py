@@ -31,27 +31,29 @@ def build_interview_answer_prompt(
     strengths_str = ", ".join(strengths) if strengths else "Not analyzed"
     gaps_str = ", ".join(gaps) if gaps else "None identified"
 
+    # Rules and resume first, then the job, analysis and question, so the prefix
+    # shared by every answer for this resume can be reused by prompt caching
     return f"""Generate a strong interview answer using ONLY actual resume content.
 
-QUESTION: {question}
+CRITICAL RULES:
+1. ONLY cite projects, roles, metrics from the actual resume
+2. Do NOT invent experience or extrapolate skills
+3. Use specific examples with concrete details
+4. Be honest about gaps but frame positively
+5. Natural, conversational tone (not rehearsed)
+
+CANDIDATE'S RESUME:
+{resume_text}
 
 JOB CONTEXT:
 Title: {job.get('title', 'Unknown')}
 Company: {job.get('company', 'Unknown')}
 Description: {job.get('description', job.get('raw_text', ''))[:500]}
 
-CANDIDATE'S RESUME:
-{resume_text}
-
 VERIFIED ANALYSIS:
 Strengths: {strengths_str}
 Gaps: {gaps_str}
 
-CRITICAL RULES:
-1. ONLY cite projects, roles, metrics from the actual resume
-2. Do NOT invent experience or extrapolate skills
-3. Use specific examples with concrete details
-4. Be honest about gaps but frame positively
-5. Natural, conversational tone (not rehearsed)
+QUESTION: {question}
 
 Generate 2-3 paragraph answer (150-200 words):"""
@@ -0,0 +1,102 @@
+"""
+AI Response Cache - Reuse model responses for byte-identical prompts
+
+Scoring, analysis, email classification and job extraction prompts are pure
+functions of their inputs, and rescans or replayed emails often send the exact
+same prompt again.
+Responses are kept in a bounded in-memory LRU keyed on a hash of the provider,
+model, token limit and prompt text, so a repeat skips the API round trip.
+
+A changed resume or job changes the prompt and therefore the key, so stale
+entries simply age out; nothing needs explicit invalidation.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+def prompt_cache_key(provider: str, model: str, max_tokens: int, prompt: str) -> str:
+    """
+    Build the cache key for a prompt sent to a given model.
+
+    Args:
+        provider: Provider name (e.g., 'claude')
+        model: Model identifier
+        max_tokens: Response token limit (part of the request, so part of the key)
+        prompt: Formatted prompt text
+
+    Returns:
+        str: Hex digest identifying the request
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{provider}\0{model}\0{max_tokens}\0".encode("utf-8"))
+    digest.update(prompt.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of response text with a time-to-live.
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float = DEFAULT_TTL_SECONDS
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            ttl_seconds: Seconds a response stays valid after it was stored
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached response for key, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: str) -> None:
+        """
+        Store a response, evicting the least recently used entry when full.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Shared by all providers; the key includes the provider and model
+response_cache = ResponseCache()
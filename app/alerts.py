@@ -8,16 +8,25 @@ Current implementation logs to file and console.
 Can be extended with email, Slack, or webhook notifications.
 """
 
+import atexit
 import json
 import os
+import queue
+import reprlib
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
-from collections import deque
+from collections import Counter, deque
 import threading
 
 from app.logging_config import get_logger, LOGS_DIR
 
+try:
+    import orjson
+except ImportError:  # optional: faster serialization of error records
+    orjson = None
+
 logger = get_logger(__name__)
 
 
@@ -51,6 +60,12 @@ class ErrorTracker:
         self.alert_window_seconds = alert_window_seconds
 
         self._errors: deque = deque(maxlen=max_history)
+        # time.monotonic() of errors still inside the alert window, oldest first
+        self._error_times: deque = deque(maxlen=max_history)
+        # Breakdowns of the errors in _errors, kept in step with appends and evictions
+        self._by_severity: Counter = Counter()
+        self._by_type: Counter = Counter()
+        self._by_operation: Counter = Counter()
         self._lock = threading.Lock()
         self._alert_handlers: List[callable] = []
         self._error_log_file = LOGS_DIR / "errors.jsonl"
@@ -89,7 +104,11 @@ class ErrorTracker:
         }
 
         with self._lock:
+            if self._errors and len(self._errors) == self._errors.maxlen:
+                self._count_error(self._errors[0], -1)
             self._errors.append(error_record)
+            self._error_times.append(time.monotonic())
+            self._count_error(error_record, 1)
 
         # Persist to log file
         self._persist_error(error_record)
@@ -109,32 +128,29 @@ class ErrorTracker:
         return error_record
 
     def _persist_error(self, error_record: Dict):
-        """Persist error to log file."""
+        """Queue error for the shared log file writer."""
         try:
-            with open(self._error_log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(error_record) + "\n")
+            _start_error_log_writer()
+            _write_queue.put_nowait((self._error_log_file, _dumps_line(error_record)))
         except Exception as e:
             logger.warning(f"Could not persist error to file: {e}")
 
+    def flush(self):
+        """Block until every queued error has been written to its log file."""
+        _write_queue.join()
+
     def _check_alert_condition(self):
         """Check if error rate exceeds threshold and trigger alert."""
         with self._lock:
-            if not self._errors:
-                return
-
-            now = datetime.utcnow()
-            window_start = now.timestamp() - self.alert_window_seconds
-
-            # Count recent errors
-            recent_errors = sum(
-                1
-                for e in self._errors
-                if datetime.fromisoformat(e["timestamp"].replace("Z", "")).timestamp()
-                > window_start
-            )
+            # Times are appended in order, so expired ones are all at the left
+            window_start = time.monotonic() - self.alert_window_seconds
+            while self._error_times and self._error_times[0] <= window_start:
+                self._error_times.popleft()
+            recent_errors = len(self._error_times)
 
-            if recent_errors >= self.alert_threshold:
-                self._trigger_alert(recent_errors)
+        # Outside the lock: handlers call get_recent_errors, which takes it again
+        if recent_errors and recent_errors >= self.alert_threshold:
+            self._trigger_alert(recent_errors)
 
     def _trigger_alert(self, error_count: int):
         """Trigger an alert for high error rate."""
@@ -163,52 +179,102 @@ class ErrorTracker:
         with self._lock:
             return list(self._errors)[-limit:]
 
+    def _count_error(self, error: Dict, delta: int):
+        """Add delta to the breakdown counts for error (caller holds the lock)."""
+        for counter, key in (
+            (self._by_severity, error.get("severity", "unknown")),
+            (self._by_type, error.get("error_type", "unknown")),
+            (self._by_operation, error.get("operation", "unknown")),
+        ):
+            counter[key] += delta
+            if not counter[key]:
+                del counter[key]
+
     def get_error_summary(self) -> Dict:
         """Get a summary of error statistics."""
         with self._lock:
-            if not self._errors:
-                return {
-                    "total": 0,
-                    "by_severity": {},
-                    "by_type": {},
-                    "by_operation": {},
-                }
-
-            by_severity = {}
-            by_type = {}
-            by_operation = {}
-
-            for error in self._errors:
-                severity = error.get("severity", "unknown")
-                error_type = error.get("error_type", "unknown")
-                operation = error.get("operation", "unknown")
-
-                by_severity[severity] = by_severity.get(severity, 0) + 1
-                by_type[error_type] = by_type.get(error_type, 0) + 1
-                by_operation[operation] = by_operation.get(operation, 0) + 1
-
             return {
                 "total": len(self._errors),
-                "by_severity": by_severity,
-                "by_type": by_type,
-                "by_operation": by_operation,
+                "by_severity": dict(self._by_severity),
+                "by_type": dict(self._by_type),
+                "by_operation": dict(self._by_operation),
             }
 
     def clear_errors(self):
         """Clear error history (for testing)."""
         with self._lock:
             self._errors.clear()
+            self._error_times.clear()
+            self._by_severity.clear()
+            self._by_type.clear()
+            self._by_operation.clear()
+
+
+def _dumps_line(record: Dict) -> bytes:
+    """
+    Serialize a record as one UTF-8 JSON line, with orjson when it is installed.
+
+    Records orjson rejects (lone surrogates, integers over 64 bits) fall back to
+    the json module so they are still logged.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
+# Error log lines from every tracker, as (log file, line). One background thread,
+# started on the first error, writes them so callers never wait on disk.
+_write_queue: queue.Queue = queue.Queue()
+_writer_lock = threading.Lock()
+_writer: Optional[threading.Thread] = None
+
+
+def _start_error_log_writer():
+    """Start the shared writer thread if it is not running yet."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(
+                target=_write_error_lines, name="error-log-writer", daemon=True
+            )
+            _writer.start()
+            atexit.register(_write_queue.join)
+
+
+def _write_error_lines():
+    """Append queued lines to their log files, one file open per burst of errors."""
+    while True:
+        batch = [_write_queue.get()]
+        while True:
+            try:
+                batch.append(_write_queue.get_nowait())
+            except queue.Empty:
+                break
 
+        lines_by_file: Dict[Path, List[bytes]] = {}
+        for log_file, line in batch:
+            lines_by_file.setdefault(log_file, []).append(line)
+
+        for log_file, lines in lines_by_file.items():
+            try:
+                with open(log_file, "ab") as f:
+                    f.writelines(lines)
+            except Exception as e:
+                logger.warning(f"Could not persist error to file: {e}")
+
+        for _ in batch:
+            _write_queue.task_done()
 
-# Global error tracker instance
-_error_tracker: Optional[ErrorTracker] = None
+
+# Global error tracker instance, created at import so callers skip a None check
+_error_tracker: ErrorTracker = ErrorTracker()
 
 
 def get_error_tracker() -> ErrorTracker:
     """Get the global error tracker instance."""
-    global _error_tracker
-    if _error_tracker is None:
-        _error_tracker = ErrorTracker()
     return _error_tracker
 
 
@@ -230,8 +296,30 @@ def track_error(
     Returns:
         Error record
     """
-    tracker = get_error_tracker()
-    return tracker.record_error(error, context, severity, operation)
+    return _error_tracker.record_error(error, context, severity, operation)
+
+
+class _ArgsRepr(reprlib.Repr):
+    """
+    Bounded repr for decorator arguments.
+
+    Long strings and containers are abbreviated while being formatted, rather
+    than rendered in full and then cut. reprlib has no bytes handler, so bytes
+    are sliced before repr here.
+    """
+
+    def repr_bytes(self, x, level):
+        if len(x) <= self.maxstring:
+            return repr(x)
+        return repr(x[: self.maxstring]) + "..."
+
+    repr_bytearray = repr_bytes
+
+
+_ARGS_REPR = _ArgsRepr()
+_ARGS_REPR.maxstring = 100
+_ARGS_REPR.maxother = 100
+_ARGS_REPR.maxlist = _ARGS_REPR.maxtuple = _ARGS_REPR.maxset = _ARGS_REPR.maxdict = 5
 
 
 # Decorator for automatic error tracking
@@ -252,7 +340,10 @@ def track_errors(operation: str):
             except Exception as e:
                 track_error(
                     e,
-                    context={"args": str(args)[:200], "kwargs": str(kwargs)[:200]},
+                    context={
+                        "args": _ARGS_REPR.repr(args)[:200],
+                        "kwargs": _ARGS_REPR.repr(kwargs)[:200],
+                    },
                     operation=operation,
                 )
                 raise
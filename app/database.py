@@ -7,14 +7,229 @@ and migrations for the SQLite database.
 
 import sqlite3
 import logging
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
 from pathlib import Path
-from flask import g
+from typing import Dict, Iterable, Optional, Set, Tuple
+from flask import g, has_app_context
+
+from app.database_pool import ReaderPool, WriterPool
 
 logger = logging.getLogger(__name__)
 
 # Database path (relative to app root)
 DB_PATH = Path(__file__).parent.parent / "jobs.db"
 
+# Per-connection settings: fewer fsyncs in WAL mode (NORMAL is still safe
+# against corruption), a 16MB page cache, reads through a 256MB memory map, and
+# temp tables in memory. The WAL file is truncated back to 64MB after a
+# checkpoint instead of keeping its largest size. Foreign keys stay off: existing
+# rows and deletes rely on it. The busy timeout comes from
+# sqlite3.connect(timeout=30.0).
+_CONNECTION_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA cache_size=-16000;
+PRAGMA mmap_size=268435456;
+PRAGMA temp_store=MEMORY;
+PRAGMA journal_size_limit=67108864;
+"""
+
+# Free pages returned to the filesystem at most every 15 minutes, in steps of
+# up to 4000 pages (16MB), so deleted jobs and emails do not leave the file
+# permanently oversized
+_INCREMENTAL_VACUUM_PAGES = 4000
+_INCREMENTAL_VACUUM_INTERVAL = 15 * 60
+_vacuum_lock = threading.Lock()
+_last_vacuum = 0.0
+
+# Indexes for the hot lookups: scan duplicate checks (url, company + title),
+# dashboard filters, enrichment status, and follow-up/job joins. Created after
+# run_migrations() since several columns are added by migrations.
+_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_jobs_url ON jobs(url);
+CREATE INDEX IF NOT EXISTS idx_jobs_company_title ON jobs(company, title);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+CREATE INDEX IF NOT EXISTS idx_jobs_enrichment_status ON jobs(enrichment_status);
+CREATE INDEX IF NOT EXISTS idx_jobs_is_filtered_viewed ON jobs(is_filtered, viewed);
+CREATE INDEX IF NOT EXISTS idx_followups_job_id ON followups(job_id);
+CREATE INDEX IF NOT EXISTS idx_followups_gmail_message_id ON followups(gmail_message_id);
+CREATE INDEX IF NOT EXISTS idx_external_applications_job_id ON external_applications(job_id);
+CREATE INDEX IF NOT EXISTS idx_resume_usage_log_job_id ON resume_usage_log(job_id);
+"""
+
+# Tables created by init_db(), run as a single script. PRAGMA journal_mode is
+# issued separately beforehand because it cannot change inside a transaction.
+_SCHEMA_SQL = """
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    url TEXT,
+    source TEXT,
+    status TEXT DEFAULT 'new',
+    score INTEGER DEFAULT 0,
+    baseline_score INTEGER DEFAULT 0,
+    analysis TEXT,
+    cover_letter TEXT,
+    notes TEXT,
+    raw_text TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    email_date TEXT,
+    is_filtered INTEGER DEFAULT 0,
+    viewed INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS scan_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    last_scan_date TEXT,
+    emails_found INTEGER,
+    created_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS watchlist (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company TEXT NOT NULL,
+    url TEXT,
+    notes TEXT,
+    created_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS followups (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company TEXT,
+    subject TEXT,
+    type TEXT,
+    snippet TEXT,
+    email_date TEXT,
+    job_id TEXT,
+    created_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS external_applications (
+    app_id TEXT PRIMARY KEY,
+    job_id TEXT,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    location TEXT,
+    url TEXT,
+    source TEXT NOT NULL,
+    application_method TEXT,
+    applied_date TEXT NOT NULL,
+    contact_name TEXT,
+    contact_email TEXT,
+    status TEXT DEFAULT 'applied',
+    follow_up_date TEXT,
+    notes TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    is_linked_to_job INTEGER DEFAULT 0,
+    FOREIGN KEY (job_id) REFERENCES jobs(job_id)
+);
+
+CREATE TABLE IF NOT EXISTS resume_variants (
+    resume_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    focus_areas TEXT,
+    target_roles TEXT,
+    file_path TEXT,
+    content TEXT,
+    content_hash TEXT,
+    usage_count INTEGER DEFAULT 0,
+    created_at TEXT,
+    updated_at TEXT,
+    is_active INTEGER DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS resume_usage_log (
+    log_id TEXT PRIMARY KEY,
+    resume_id TEXT,
+    job_id TEXT,
+    recommended_at TEXT,
+    confidence_score REAL,
+    user_selected INTEGER DEFAULT 0,
+    reasoning TEXT,
+    FOREIGN KEY (resume_id) REFERENCES resume_variants(resume_id),
+    FOREIGN KEY (job_id) REFERENCES jobs(job_id)
+);
+
+CREATE TABLE IF NOT EXISTS tracked_companies (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company_name TEXT NOT NULL,
+    career_page_url TEXT,
+    job_alert_email TEXT,
+    notes TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS custom_email_sources (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    sender_email TEXT,
+    sender_pattern TEXT,
+    subject_keywords TEXT,
+    enabled INTEGER DEFAULT 1,
+    is_builtin INTEGER DEFAULT 0,
+    category TEXT DEFAULT 'custom',
+    parser_class TEXT,
+    sample_email TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS deleted_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_url TEXT NOT NULL UNIQUE,
+    title TEXT,
+    company TEXT,
+    deleted_at TEXT,
+    deleted_reason TEXT DEFAULT 'user_deleted'
+);
+
+-- Processed emails table for deduplication
+CREATE TABLE IF NOT EXISTS processed_emails (
+    gmail_message_id TEXT PRIMARY KEY,
+    email_type TEXT,
+    processed_at TEXT,
+    source TEXT
+);
+
+-- Headers and snippets of recently seen emails that were not processed, so
+-- source discovery does not fetch them from Gmail again on every scan
+CREATE TABLE IF NOT EXISTS email_metadata_cache (
+    gmail_message_id TEXT PRIMARY KEY,
+    internal_date TEXT,
+    subject TEXT,
+    from_email TEXT,
+    snippet TEXT,
+    cached_at TEXT
+);
+
+-- Discovered email sources (auto-detected potential job alert senders)
+CREATE TABLE IF NOT EXISTS discovered_email_sources (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sender_email TEXT UNIQUE,
+    sender_name TEXT,
+    email_count INTEGER DEFAULT 1,
+    sample_subjects TEXT,
+    sample_snippet TEXT,
+    sample_email_id TEXT,
+    first_seen TEXT,
+    last_seen TEXT,
+    status TEXT DEFAULT 'pending',
+    created_at TEXT,
+    updated_at TEXT
+);
+
+COMMIT;
+"""
+
 
 def init_db():
     """
@@ -36,211 +251,110 @@ def init_db():
     """
     conn = sqlite3.connect(DB_PATH, timeout=30.0)
 
+    # Must precede the first CREATE TABLE; a database created before this setting
+    # only switches after a one-time manual VACUUM (sqlite3 jobs.db VACUUM)
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+
     # Enable WAL mode for better concurrency
     conn.execute("PRAGMA journal_mode=WAL")
+    _apply_pragmas(conn)
 
-    # Create tables if they don't exist
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS jobs (
-            job_id TEXT PRIMARY KEY,
-            title TEXT,
-            company TEXT,
-            location TEXT,
-            url TEXT,
-            source TEXT,
-            status TEXT DEFAULT 'new',
-            score INTEGER DEFAULT 0,
-            baseline_score INTEGER DEFAULT 0,
-            analysis TEXT,
-            cover_letter TEXT,
-            notes TEXT,
-            raw_text TEXT,
-            created_at TEXT,
-            updated_at TEXT,
-            email_date TEXT,
-            is_filtered INTEGER DEFAULT 0,
-            viewed INTEGER DEFAULT 0
-        )
-    """)
+    # Create tables if they don't exist, in one transaction
+    conn.executescript(_SCHEMA_SQL)
 
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS scan_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            last_scan_date TEXT,
-            emails_found INTEGER,
-            created_at TEXT
-        )
-    """)
+    # Run migrations
+    run_migrations(conn)
 
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS watchlist (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            company TEXT NOT NULL,
-            url TEXT,
-            notes TEXT,
-            created_at TEXT
-        )
-    """)
+    # executescript commits the migrations first
+    conn.executescript(_INDEX_SQL)
 
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS followups (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            company TEXT,
-            subject TEXT,
-            type TEXT,
-            snippet TEXT,
-            email_date TEXT,
-            job_id TEXT,
-            created_at TEXT
-        )
-    """)
+    # The schema may have just changed, so let the planner analyze every table
+    try:
+        conn.execute("PRAGMA optimize=0x10002")
+    except sqlite3.Error as e:
+        logger.warning(f"PRAGMA optimize failed: {e}")
+    conn.close()
 
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS external_applications (
-            app_id TEXT PRIMARY KEY,
-            job_id TEXT,
-            title TEXT NOT NULL,
-            company TEXT NOT NULL,
-            location TEXT,
-            url TEXT,
-            source TEXT NOT NULL,
-            application_method TEXT,
-            applied_date TEXT NOT NULL,
-            contact_name TEXT,
-            contact_email TEXT,
-            status TEXT DEFAULT 'applied',
-            follow_up_date TEXT,
-            notes TEXT,
-            created_at TEXT,
-            updated_at TEXT,
-            is_linked_to_job INTEGER DEFAULT 0,
-            FOREIGN KEY (job_id) REFERENCES jobs(job_id)
-        )
-    """)
+    # Seed built-in email sources
+    seed_builtin_sources()
 
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS resume_variants (
-            resume_id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            focus_areas TEXT,
-            target_roles TEXT,
-            file_path TEXT,
-            content TEXT,
-            content_hash TEXT,
-            usage_count INTEGER DEFAULT 0,
-            created_at TEXT,
-            updated_at TEXT,
-            is_active INTEGER DEFAULT 1
-        )
-    """)
 
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS resume_usage_log (
-            log_id TEXT PRIMARY KEY,
-            resume_id TEXT,
-            job_id TEXT,
-            recommended_at TEXT,
-            confidence_score REAL,
-            user_selected INTEGER DEFAULT 0,
-            reasoning TEXT,
-            FOREIGN KEY (resume_id) REFERENCES resume_variants(resume_id),
-            FOREIGN KEY (job_id) REFERENCES jobs(job_id)
-        )
-    """)
+def _apply_pragmas(conn):
+    """Apply _CONNECTION_PRAGMAS to a newly opened connection."""
+    conn.executescript(_CONNECTION_PRAGMAS)
 
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS tracked_companies (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            company_name TEXT NOT NULL,
-            career_page_url TEXT,
-            job_alert_email TEXT,
-            notes TEXT,
-            created_at TEXT,
-            updated_at TEXT
-        )
-    """)
 
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS custom_email_sources (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            sender_email TEXT,
-            sender_pattern TEXT,
-            subject_keywords TEXT,
-            enabled INTEGER DEFAULT 1,
-            is_builtin INTEGER DEFAULT 0,
-            category TEXT DEFAULT 'custom',
-            parser_class TEXT,
-            sample_email TEXT,
-            created_at TEXT,
-            updated_at TEXT
-        )
-    """)
+def run_migrations(conn):
+    """
+    Run database migrations that have not been applied yet.
 
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS deleted_jobs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_url TEXT NOT NULL UNIQUE,
-            title TEXT,
-            company TEXT,
-            deleted_at TEXT,
-            deleted_reason TEXT DEFAULT 'user_deleted'
-        )
-    """)
+    PRAGMA user_version records the schema version reached, so an up-to-date
+    database costs a single PRAGMA read. Each pending step in MIGRATIONS runs
+    in its own transaction together with its user_version bump, so a step that
+    fails is rolled back and retried whole on the next startup.
 
-    # Processed emails table for deduplication
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS processed_emails (
-            gmail_message_id TEXT PRIMARY KEY,
-            email_type TEXT,
-            processed_at TEXT,
-            source TEXT
-        )
-    """)
+    Args:
+        conn: SQLite connection
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return
+
+    for target in sorted(MIGRATIONS):
+        if target <= version:
+            continue
+        conn.execute("BEGIN")
+        try:
+            MIGRATIONS[target](conn)
+            conn.execute(f"PRAGMA user_version = {target}")
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+        logger.info(f"Database migrated to schema version {target}")
 
-    # Discovered email sources (auto-detected potential job alert senders)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS discovered_email_sources (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            sender_email TEXT UNIQUE,
-            sender_name TEXT,
-            email_count INTEGER DEFAULT 1,
-            sample_subjects TEXT,
-            sample_snippet TEXT,
-            sample_email_id TEXT,
-            first_seen TEXT,
-            last_seen TEXT,
-            status TEXT DEFAULT 'pending',
-            created_at TEXT,
-            updated_at TEXT
-        )
-    """)
 
-    # Run migrations
-    run_migrations(conn)
+def _table_columns(conn, table: str) -> set:
+    """Return the column names of table."""
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
 
-    conn.commit()
-    conn.close()
 
-    # Seed built-in email sources
-    seed_builtin_sources()
+def _migrate_unique_builtin_sources(conn):
+    """
+    Make built-in email source names unique so seeding can upsert them.
 
+    Any duplicate built-in rows keep the oldest one.
 
-def run_migrations(conn):
+    Args:
+        conn: SQLite connection
+    """
+    conn.execute("""
+        DELETE FROM custom_email_sources
+        WHERE is_builtin = 1 AND id NOT IN (
+            SELECT MIN(id) FROM custom_email_sources WHERE is_builtin = 1 GROUP BY name
+        )
+    """)
+    conn.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_builtin_source_name "
+        "ON custom_email_sources(name) WHERE is_builtin = 1"
+    )
+
+
+def _migrate_legacy_columns(conn):
     """
-    Run database migrations to add new columns as needed.
+    Bring a database from before schema versioning up to version 1.
 
-    Uses PRAGMA table_info() to check for missing columns and adds them
-    with ALTER TABLE.
+    Databases of that era may have any subset of these columns, so each one is
+    checked with PRAGMA table_info() and added with ALTER TABLE if missing.
 
     Args:
         conn: SQLite connection
     """
-    # Get current columns in jobs table
-    jobs_columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)").fetchall()}
+    jobs_columns = _table_columns(conn, "jobs")
+    followups_columns = _table_columns(conn, "followups")
+    email_sources_columns = _table_columns(conn, "custom_email_sources")
 
     # Migration: Add job_id column to followups if it doesn't exist
-    followups_columns = {row[1] for row in conn.execute("PRAGMA table_info(followups)").fetchall()}
     if "job_id" not in followups_columns:
         logger.info("Migrating database: adding 'job_id' column to followups...")
         conn.execute("ALTER TABLE followups ADD COLUMN job_id TEXT")
@@ -264,9 +378,6 @@ def run_migrations(conn):
         conn.execute("ALTER TABLE jobs ADD COLUMN resume_match_score REAL")
 
     # Migration: Add email sources columns
-    email_sources_columns = {
-        row[1] for row in conn.execute("PRAGMA table_info(custom_email_sources)").fetchall()
-    }
     if "is_builtin" not in email_sources_columns:
         logger.info("Migrating database: adding email sources columns...")
         conn.execute("ALTER TABLE custom_email_sources ADD COLUMN is_builtin INTEGER DEFAULT 0")
@@ -296,9 +407,6 @@ def run_migrations(conn):
         conn.execute("ALTER TABLE jobs ADD COLUMN applied_date TEXT")
 
     # Migration: Add post_scan_action column to email sources
-    email_sources_columns = {
-        row[1] for row in conn.execute("PRAGMA table_info(custom_email_sources)").fetchall()
-    }
     if "post_scan_action" not in email_sources_columns:
         logger.info("Migrating database: adding 'post_scan_action' to custom_email_sources...")
         conn.execute(
@@ -311,7 +419,6 @@ def run_migrations(conn):
         conn.execute("ALTER TABLE jobs ADD COLUMN enrichment_status TEXT DEFAULT 'pending'")
 
     # Migration: Add expanded followup columns for enhanced tracking
-    followups_columns = {row[1] for row in conn.execute("PRAGMA table_info(followups)").fetchall()}
     if "gmail_message_id" not in followups_columns:
         logger.info("Migrating database: adding expanded followup columns...")
         conn.execute("ALTER TABLE followups ADD COLUMN gmail_message_id TEXT")
@@ -397,12 +504,53 @@ def run_migrations(conn):
         pass  # Table already exists
 
 
+# Schema migrations keyed by the version they bring the database to. Add new
+# changes as the next number; never edit a step that has shipped.
+MIGRATIONS = {
+    1: _migrate_legacy_columns,
+    2: _migrate_unique_builtin_sources,
+}
+SCHEMA_VERSION = max(MIGRATIONS)
+
+
+class _RequestConnection(sqlite3.Connection):
+    """
+    Connection shared by every get_db() call within one Flask app context.
+
+    Callers written for a private connection call close() when done. That is a
+    no-op here: a helper closing its "own" connection must not end the work of
+    the caller that is still using it. close_db() closes the connection for
+    real at app context teardown, discarding anything left uncommitted.
+    """
+
+    def close(self):
+        pass
+
+
+def get_standalone_db():
+    """
+    Open a new database connection with Row factory, owned by the caller.
+
+    Use outside Flask (background jobs, scripts); the caller must close it.
+
+    Returns:
+        sqlite3.Connection: Database connection with Row factory enabled
+    """
+    conn = sqlite3.connect(DB_PATH, timeout=30.0)
+    conn.row_factory = sqlite3.Row
+    _apply_pragmas(conn)
+    return conn
+
+
 def get_db():
     """
-    Create and return a database connection with Row factory.
+    Return a database connection with Row factory.
 
-    Establishes a SQLite connection with a 30-second timeout to handle
-    concurrent access. The Row factory allows dict-like access to rows.
+    Inside a Flask app context the connection is opened once, cached on g and
+    shared by all callers; close() on it does nothing and close_db() closes it
+    at teardown. Outside an app context this returns a new
+    connection (see get_standalone_db). The 30-second timeout handles concurrent
+    access, and the Row factory allows dict-like access to rows.
 
     Returns:
         sqlite3.Connection: Database connection with Row factory enabled
@@ -412,16 +560,87 @@ def get_db():
         >>> job = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (id,)).fetchone()
         >>> print(job['title'])  # Access by column name
     """
-    conn = sqlite3.connect(DB_PATH, timeout=30.0)
-    conn.row_factory = sqlite3.Row
-    return conn
+    if not has_app_context():
+        return get_standalone_db()
+
+    db = g.get("db")
+    if db is None:
+        db = sqlite3.connect(DB_PATH, timeout=30.0, factory=_RequestConnection)
+        _apply_pragmas(db)
+        g.db = db
+    # Some routes swap in a dict row factory; give each caller the default back
+    db.row_factory = sqlite3.Row
+    return db
+
+
+_pool_lock = threading.Lock()
+_writer_pool: Optional[WriterPool] = None
+_reader_pool: Optional[ReaderPool] = None
+
+
+def _get_pools() -> Tuple[WriterPool, ReaderPool]:
+    """Return the writer and reader pools for DB_PATH, replacing them if it changed."""
+    global _writer_pool, _reader_pool
+    with _pool_lock:
+        if _writer_pool is None or _writer_pool.db_path != DB_PATH:
+            if _writer_pool is not None:
+                _writer_pool.close()
+                _reader_pool.close()
+            _writer_pool = WriterPool(DB_PATH, on_connect=_apply_pragmas)
+            _reader_pool = ReaderPool(DB_PATH, on_connect=_apply_pragmas)
+        return _writer_pool, _reader_pool
+
+
+def writer_connection():
+    """
+    Context manager yielding the shared writer connection in a BEGIN IMMEDIATE
+    transaction, committed on exit.
+
+    Examples:
+        >>> with writer_connection() as conn:
+        ...     conn.execute("UPDATE jobs SET viewed = 1 WHERE job_id = ?", (job_id,))
+    """
+    return _get_pools()[0].connection()
+
+
+def reader_connection():
+    """Context manager yielding a pooled read-only connection with Row factory."""
+    return _get_pools()[1].connection()
 
 
 def close_db(e=None):
-    """Close database connection if it exists in flask g."""
+    """Close the connection cached in flask g by get_db(), if any (app context teardown)."""
     db = g.pop("db", None)
     if db is not None:
-        db.close()
+        # Refresh planner statistics for tables whose size changed a lot; cheap otherwise
+        try:
+            db.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.warning(f"PRAGMA optimize failed: {e}")
+        _maybe_incremental_vacuum(db)
+        sqlite3.Connection.close(db)
+
+
+def _maybe_incremental_vacuum(conn):
+    """Run PRAGMA incremental_vacuum if the last run was long enough ago."""
+    global _last_vacuum
+
+    # executescript steps the pragma to completion (execute frees only one
+    # page), but it also commits, so never run it over uncommitted work
+    if conn.in_transaction:
+        return
+
+    now = time.monotonic()
+    with _vacuum_lock:
+        if now - _last_vacuum < _INCREMENTAL_VACUUM_INTERVAL:
+            return
+        _last_vacuum = now
+
+    # A no-op unless the database uses auto_vacuum=INCREMENTAL
+    try:
+        conn.executescript(f"PRAGMA incremental_vacuum({_INCREMENTAL_VACUUM_PAGES});")
+    except sqlite3.Error as e:
+        logger.warning(f"PRAGMA incremental_vacuum failed: {e}")
 
 
 def create_job_from_confirmation(
@@ -453,16 +672,12 @@ def create_job_from_confirmation(
     Returns:
         job_id: The generated unique job ID
     """
-    import uuid
-    from datetime import datetime
-
     job_id = str(uuid.uuid4())[:16]
     now = datetime.now().isoformat()
     email_date = email_date or now
     applied_date = applied_date or email_date
 
-    conn = get_db()
-    try:
+    with writer_connection() as conn:
         conn.execute(
             """
             INSERT INTO jobs (
@@ -484,10 +699,7 @@ def create_job_from_confirmation(
                 now,
             ),
         )
-        conn.commit()
-        logger.info(f"Created job from confirmation: {title} at {company} (id: {job_id})")
-    finally:
-        conn.close()
+    logger.info(f"Created job from confirmation: {title} at {company} (id: {job_id})")
 
     return job_id
 
@@ -502,14 +714,45 @@ def is_email_processed(gmail_message_id: str) -> bool:
     Returns:
         True if email was already processed, False otherwise
     """
-    conn = get_db()
-    try:
-        result = conn.execute(
-            "SELECT 1 FROM processed_emails WHERE gmail_message_id = ?", (gmail_message_id,)
-        ).fetchone()
-        return result is not None
-    finally:
-        conn.close()
+    with reader_connection() as conn:
+        return bool(
+            conn.execute(
+                "SELECT EXISTS(SELECT 1 FROM processed_emails WHERE gmail_message_id = ?)",
+                (gmail_message_id,),
+            ).fetchone()[0]
+        )
+
+
+# Message IDs per IN (...) lookup, well under SQLite's bound-parameter limit
+_PROCESSED_LOOKUP_CHUNK = 500
+
+
+def filter_unprocessed(gmail_message_ids: Iterable[str]) -> Set[str]:
+    """
+    Return the message IDs that have not been processed yet.
+
+    Args:
+        gmail_message_ids: Gmail message IDs, e.g. one page of search results
+
+    Returns:
+        Set of the given IDs missing from processed_emails
+    """
+    pending = list(dict.fromkeys(gmail_message_ids))
+    unprocessed = set(pending)
+    if not pending:
+        return unprocessed
+
+    with reader_connection() as conn:
+        for start in range(0, len(pending), _PROCESSED_LOOKUP_CHUNK):
+            chunk = pending[start : start + _PROCESSED_LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                "SELECT gmail_message_id FROM processed_emails "
+                f"WHERE gmail_message_id IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            unprocessed.difference_update(row[0] for row in rows)
+    return unprocessed
 
 
 def mark_email_processed(
@@ -523,21 +766,89 @@ def mark_email_processed(
         email_type: Type of email (job_alert, confirmation, interview, etc.)
         source: Source that processed the email
     """
-    from datetime import datetime
+    mark_emails_processed([(gmail_message_id, email_type, source)])
 
-    conn = get_db()
-    try:
-        conn.execute(
+
+def mark_emails_processed(rows: Iterable[Tuple[str, str, str]]) -> None:
+    """
+    Mark several emails as processed in one transaction.
+
+    Args:
+        rows: (gmail_message_id, email_type, source) tuples
+    """
+    processed_at = datetime.now().isoformat()
+    params = [(msg_id, email_type, processed_at, source) for msg_id, email_type, source in rows]
+    if not params:
+        return
+
+    with writer_connection() as conn:
+        conn.executemany(
             """
             INSERT OR IGNORE INTO processed_emails
             (gmail_message_id, email_type, processed_at, source)
             VALUES (?, ?, ?, ?)
         """,
-            (gmail_message_id, email_type, datetime.now().isoformat(), source),
+            params,
+        )
+
+
+# Days a cached email's metadata is kept; scans look back days, not weeks
+EMAIL_METADATA_CACHE_DAYS = 14
+
+
+def get_cached_email_metadata(gmail_message_ids: Iterable[str]) -> Dict[str, sqlite3.Row]:
+    """
+    Look up cached email metadata.
+
+    Args:
+        gmail_message_ids: Gmail message IDs
+
+    Returns:
+        Dictionary of message ID to row (internal_date, subject, from_email, snippet)
+    """
+    pending = list(dict.fromkeys(gmail_message_ids))
+    cached = {}
+    if not pending:
+        return cached
+
+    with reader_connection() as conn:
+        for start in range(0, len(pending), _PROCESSED_LOOKUP_CHUNK):
+            chunk = pending[start : start + _PROCESSED_LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                "SELECT gmail_message_id, internal_date, subject, from_email, snippet "
+                f"FROM email_metadata_cache WHERE gmail_message_id IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            cached.update((row["gmail_message_id"], row) for row in rows)
+    return cached
+
+
+def cache_email_metadata(rows: Iterable[Tuple[str, str, str, str, str]]) -> None:
+    """
+    Store email metadata and drop entries older than EMAIL_METADATA_CACHE_DAYS.
+
+    Args:
+        rows: (gmail_message_id, internal_date, subject, from_email, snippet) tuples
+    """
+    now = datetime.now()
+    params = [row + (now.isoformat(),) for row in rows]
+    if not params:
+        return
+
+    with writer_connection() as conn:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO email_metadata_cache
+            (gmail_message_id, internal_date, subject, from_email, snippet, cached_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            params,
+        )
+        conn.execute(
+            "DELETE FROM email_metadata_cache WHERE cached_at < ?",
+            ((now - timedelta(days=EMAIL_METADATA_CACHE_DAYS)).isoformat(),),
         )
-        conn.commit()
-    finally:
-        conn.close()
 
 
 # Built-in email sources with their parser configurations
@@ -613,49 +924,29 @@ def seed_builtin_sources():
     Seed the database with built-in email sources.
 
     This function is called on app startup to ensure all built-in sources
-    are in the database. It only inserts sources that don't already exist.
+    are in the database. Existing built-in sources keep their id, enabled flag
+    and created_at; their parser settings are refreshed.
 
     Built-in sources have is_builtin=1 and cannot be deleted by users.
     """
-    from datetime import datetime
-
-    conn = sqlite3.connect(DB_PATH, timeout=30.0)
     now = datetime.utcnow().isoformat()
 
-    for source in BUILTIN_EMAIL_SOURCES:
-        # Check if source already exists by name
-        existing = conn.execute(
-            "SELECT id FROM custom_email_sources WHERE name = ? AND is_builtin = 1",
-            (source["name"],),
-        ).fetchone()
-
-        if existing:
-            # Update existing source in case parser changed
-            conn.execute(
-                """
-                UPDATE custom_email_sources
-                SET sender_pattern = ?, subject_keywords = ?, category = ?,
-                    parser_class = ?, updated_at = ?
-                WHERE id = ?
-            """,
-                (
-                    source["sender_pattern"],
-                    source["subject_keywords"],
-                    source["category"],
-                    source["parser_class"],
-                    now,
-                    existing[0],
-                ),
-            )
-        else:
-            # Insert new built-in source
-            conn.execute(
-                """
-                INSERT INTO custom_email_sources
-                (name, sender_pattern, subject_keywords, category, parser_class,
-                 is_builtin, enabled, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, 1, 1, ?, ?)
-            """,
+    with writer_connection() as conn:
+        # One upsert per source; the conflict target is uq_builtin_source_name
+        conn.executemany(
+            """
+            INSERT INTO custom_email_sources
+            (name, sender_pattern, subject_keywords, category, parser_class,
+             is_builtin, enabled, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, 1, 1, ?, ?)
+            ON CONFLICT(name) WHERE is_builtin = 1 DO UPDATE SET
+                sender_pattern = excluded.sender_pattern,
+                subject_keywords = excluded.subject_keywords,
+                category = excluded.category,
+                parser_class = excluded.parser_class,
+                updated_at = excluded.updated_at
+        """,
+            [
                 (
                     source["name"],
                     source["sender_pattern"],
@@ -664,27 +955,31 @@ def seed_builtin_sources():
                     source["parser_class"],
                     now,
                     now,
-                ),
-            )
+                )
+                for source in BUILTIN_EMAIL_SOURCES
+            ],
+        )
 
-    conn.commit()
-    conn.close()
     logger.info(f"Seeded {len(BUILTIN_EMAIL_SOURCES)} built-in email sources")
 
 
+# Sender-domain keywords and the parser they select, checked in order
+_DOMAIN_PARSERS = (
+    ("linkedin", "linkedin"),
+    ("indeed", "indeed"),
+    ("greenhouse", "greenhouse"),
+    ("lever", "greenhouse"),
+    ("wellfound", "wellfound"),
+    ("angel", "wellfound"),
+)
+
+
 def detect_parser_type(sender_email: str) -> str:
     """Guess the best parser for a sender based on domain patterns."""
-    domain = sender_email.split("@")[-1].lower()
-
-    if "linkedin" in domain:
-        return "linkedin"
-    if "indeed" in domain:
-        return "indeed"
-    if "greenhouse" in domain:
-        return "greenhouse"
-    if "lever" in domain:
-        return "greenhouse"
-    if "wellfound" in domain or "angel" in domain:
-        return "wellfound"
+    domain = sender_email.rpartition("@")[2].lower()
+
+    for keyword, parser_type in _DOMAIN_PARSERS:
+        if keyword in domain:
+            return parser_type
 
     return "generic"
@@ -0,0 +1,149 @@
+"""
+Database Pool - Shared writer and reader connections for SQLite
+
+SQLite in WAL mode allows one writer alongside any number of readers. The
+background email scanner and Flask requests used to open ad-hoc connections,
+so concurrent writers could wait on each other until the busy timeout.
+
+WriterPool serializes writes through one long-lived connection. Each write
+runs in BEGIN IMMEDIATE, so it takes the write lock up front instead of failing
+when a read transaction is upgraded. ReaderPool hands out a bounded set of
+read-only connections that are reused instead of reopened.
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+DEFAULT_READERS = 8
+
+
+def _connect(
+    db_path, on_connect: Optional[Callable[[sqlite3.Connection], None]]
+) -> sqlite3.Connection:
+    """Open a pooled connection usable from any thread (the pool serializes use)."""
+    conn = sqlite3.connect(db_path, timeout=30.0, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    if on_connect is not None:
+        on_connect(conn)
+    return conn
+
+
+class WriterPool:
+    """
+    The single writer connection, used by one thread at a time.
+    """
+
+    def __init__(self, db_path, on_connect: Optional[Callable[[sqlite3.Connection], None]] = None):
+        """
+        Initialize writer pool.
+
+        Args:
+            db_path: Path to the SQLite database
+            on_connect: Called with the connection once, after it is opened
+        """
+        self.db_path = db_path
+        self._on_connect = on_connect
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Yield the writer connection inside a BEGIN IMMEDIATE transaction.
+
+        The transaction commits when the block exits normally and rolls back if
+        it raises.
+        """
+        with self._lock:
+            if self._conn is None:
+                self._conn = _connect(self.db_path, self._on_connect)
+            conn = self._conn
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def close(self):
+        """Close the writer connection; it is reopened on next use."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class ReaderPool:
+    """
+    Up to max_readers read-only connections, reused across callers.
+    """
+
+    def __init__(
+        self,
+        db_path,
+        on_connect: Optional[Callable[[sqlite3.Connection], None]] = None,
+        max_readers: int = DEFAULT_READERS,
+    ):
+        """
+        Initialize reader pool.
+
+        Args:
+            db_path: Path to the SQLite database
+            on_connect: Called with each connection once, after it is opened
+            max_readers: Connections opened at most; callers wait when all are busy
+        """
+        self.db_path = db_path
+        self.max_readers = max_readers
+        self._on_connect = on_connect
+        self._lock = threading.Lock()
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._opened = 0
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield an idle reader connection, opening one if the pool has room."""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_open = self._opened < self.max_readers
+            if can_open:
+                self._opened += 1
+        if not can_open:
+            return self._idle.get()
+
+        try:
+            conn = _connect(self.db_path, self._on_connect)
+            conn.execute("PRAGMA query_only=1")
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+            raise
+        return conn
+
+    def close(self):
+        """Close the idle reader connections."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._opened -= 1
@@ -19,6 +19,8 @@ from .client import (
     GmailClient,
     get_gmail_client,
     get_gmail_service,
+    get_messages_batch,
+    execute_concurrently,
     get_email_body,
     SCOPES,
     CREDENTIALS_FILE,
@@ -42,6 +44,8 @@ __all__ = [
     "GmailClient",
     "get_gmail_client",
     "get_gmail_service",
+    "get_messages_batch",
+    "execute_concurrently",
     "get_email_body",
     "SCOPES",
     "CREDENTIALS_FILE",
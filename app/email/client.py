@@ -6,11 +6,15 @@ This module handles OAuth2 authentication flow and Gmail API service creation.
 
 import base64
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 
@@ -25,6 +29,25 @@ APP_DIR = Path(__file__).parent.parent.parent
 CREDENTIALS_FILE = APP_DIR / "credentials.json"
 TOKEN_FILE = APP_DIR / "token.json"
 
+# Credentials loaded or refreshed this process, by token file, so a new
+# GmailClient does not re-read token.json while they are still usable
+_creds_cache: Dict[Path, Credentials] = {}
+
+# Requests per batched HTTP call; the API accepts 100 but throttles batches over 50
+MAX_BATCH_REQUESTS = 50
+
+# Requests in flight at once from execute_concurrently(), kept low for the
+# per-user rate limit
+MAX_CONCURRENT_REQUESTS = 5
+
+# Per-thread HTTP connection used by execute_concurrently() workers
+_thread_http = threading.local()
+
+# Worker pool for execute_concurrently(), created on first use and kept so each
+# worker's HTTP connection in _thread_http is reused across scans
+_executor_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
 
 class GmailClient:
     """
@@ -49,6 +72,7 @@ class GmailClient:
         self.token_file = token_file or TOKEN_FILE
         self._service = None
         self._creds = None
+        self._lock = threading.Lock()
 
     def get_service(self):
         """
@@ -64,16 +88,19 @@ class GmailClient:
         if self._service is not None:
             return self._service
 
-        self._authenticate()
-        self._service = build("gmail", "v1", credentials=self._creds)
+        # Threads racing on first use would each read the token and build a service
+        with self._lock:
+            if self._service is None:
+                self._authenticate()
+                self._service = build("gmail", "v1", credentials=self._creds)
         return self._service
 
     def _authenticate(self):
         """Handle OAuth2 authentication flow."""
-        creds = None
+        creds = _creds_cache.get(self.token_file)
 
         # Load existing credentials
-        if self.token_file.exists():
+        if creds is None and self.token_file.exists():
             creds = Credentials.from_authorized_user_file(str(self.token_file), SCOPES)
 
         # Refresh or get new credentials
@@ -83,6 +110,7 @@ class GmailClient:
                     creds.refresh(Request())
                 except Exception as e:
                     logger.error(f"Failed to refresh Gmail credentials: {e}")
+                    _creds_cache.pop(self.token_file, None)
                     if self.token_file.exists():
                         self.token_file.unlink()
                     raise
@@ -94,10 +122,11 @@ class GmailClient:
                 flow = InstalledAppFlow.from_client_secrets_file(str(self.credentials_file), SCOPES)
                 creds = flow.run_local_server(port=0)
 
-            # Save credentials
+            # Save credentials (only when refreshed or newly authorized)
             with open(self.token_file, "w") as f:
                 f.write(creds.to_json())
 
+        _creds_cache[self.token_file] = creds
         self._creds = creds
 
     def get_message(self, msg_id: str, format: str = "full") -> dict:
@@ -114,6 +143,19 @@ class GmailClient:
         service = self.get_service()
         return service.users().messages().get(userId="me", id=msg_id, format=format).execute()
 
+    def get_messages(self, msg_ids: Iterable[str], format: str = "full") -> Dict[str, dict]:
+        """
+        Get several email messages with batched requests.
+
+        Args:
+            msg_ids: Gmail message IDs
+            format: Response format ('full', 'metadata', 'minimal', 'raw')
+
+        Returns:
+            Dictionary of message ID to message; failed requests are left out
+        """
+        return get_messages_batch(self.get_service(), msg_ids, format)
+
     def search_messages(self, query: str, max_results: int = 100) -> list:
         """
         Search for messages matching a query.
@@ -199,9 +241,88 @@ class GmailClient:
         return created["id"]
 
 
+def get_messages_batch(service, msg_ids: Iterable[str], format: str = "full") -> Dict[str, dict]:
+    """
+    Fetch several messages with one HTTP round trip per MAX_BATCH_REQUESTS IDs.
+
+    Args:
+        service: Authenticated Gmail API service
+        msg_ids: Gmail message IDs
+        format: Response format ('full', 'metadata', 'minimal', 'raw')
+
+    Returns:
+        Dictionary of message ID to message; failed requests are logged and left out
+    """
+    messages: Dict[str, dict] = {}
+
+    def collect(request_id, response, exception):
+        if exception is not None:
+            logger.warning(f"Batched fetch of message {request_id} failed: {exception}")
+            return
+        messages[request_id] = response
+
+    pending = list(dict.fromkeys(msg_ids))
+    for start in range(0, len(pending), MAX_BATCH_REQUESTS):
+        batch = service.new_batch_http_request(callback=collect)
+        for msg_id in pending[start : start + MAX_BATCH_REQUESTS]:
+            batch.add(
+                service.users().messages().get(userId="me", id=msg_id, format=format),
+                request_id=msg_id,
+            )
+        batch.execute()
+    return messages
+
+
+def execute_concurrently(requests: List) -> List[Tuple[Optional[dict], Optional[Exception]]]:
+    """
+    Execute independent API requests (e.g. one messages.list per query) in parallel.
+
+    The service's shared httplib2 connection is not thread-safe, so each worker
+    thread sends through its own AuthorizedHttp with the same credentials.
+
+    Args:
+        requests: Unexecuted googleapiclient HttpRequest objects
+
+    Returns:
+        (response, None) or (None, exception) for each request, in order
+    """
+
+    def execute(request):
+        try:
+            credentials = getattr(request.http, "credentials", None)
+            if credentials is None:
+                return request.execute(), None
+            http = getattr(_thread_http, "http", None)
+            if http is None or http.credentials is not credentials:
+                http = AuthorizedHttp(credentials, http=httplib2.Http())
+                _thread_http.http = http
+            return request.execute(http=http), None
+        except Exception as e:
+            return None, e
+
+    if len(requests) <= 1:
+        return [execute(request) for request in requests]
+
+    return list(_get_executor().map(execute, requests))
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared execute_concurrently() worker pool, starting it if needed."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="gmail-request"
+            )
+        return _executor
+
+
 def get_email_body(payload: dict) -> str:
     """
-    Recursively extract HTML body from Gmail message payload.
+    Extract the HTML body from a Gmail message payload.
+
+    A single-part message returns its own body. Otherwise the MIME tree is
+    walked depth-first in part order and the first text/html part is returned.
 
     Args:
         payload: Gmail message payload dictionary
@@ -209,30 +330,45 @@ def get_email_body(payload: dict) -> str:
     Returns:
         Decoded HTML body as string
     """
-    body = ""
-    if "body" in payload and payload["body"].get("data"):
-        body = base64.urlsafe_b64decode(payload["body"]["data"]).decode("utf-8")
-    elif "parts" in payload:
-        for part in payload["parts"]:
-            if part["mimeType"] == "text/html" and "data" in part.get("body", {}):
-                body = base64.urlsafe_b64decode(part["body"]["data"]).decode("utf-8")
-                break
-            elif "parts" in part:
-                body = get_email_body(part)
-                if body:
-                    break
-    return body
+    data = payload.get("body", {}).get("data")
+    if data:
+        return _decode_body_data(data)
+
+    # Explicit stack of sibling iterators instead of one Python frame per nested multipart
+    stack = [iter(payload.get("parts", ()))]
+    while stack:
+        part = next(stack[-1], None)
+        if part is None:
+            stack.pop()
+            continue
+
+        data = part.get("body", {}).get("data")
+        if part.get("mimeType") == "text/html" and data:
+            return _decode_body_data(data)
+        if "parts" in part:
+            if data:
+                return _decode_body_data(data)
+            stack.append(iter(part["parts"]))
+    return ""
+
+
+def _decode_body_data(data: str) -> str:
+    """Decode base64url body data; bad bytes are replaced rather than aborting the scan."""
+    return base64.urlsafe_b64decode(data).decode("utf-8", "replace")
 
 
 # Singleton client instance
 _client: Optional[GmailClient] = None
+_client_lock = threading.Lock()
 
 
 def get_gmail_client() -> GmailClient:
     """Get singleton Gmail client instance."""
     global _client
     if _client is None:
-        _client = GmailClient()
+        with _client_lock:
+            if _client is None:
+                _client = GmailClient()
     return _client
 
 
@@ -8,12 +8,18 @@ Phase 3: Discovery — detect potential new job alert sources for user review
 
 import html as html_mod
 import re
-import sqlite3
 import logging
+import threading
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
-
-from .client import get_gmail_service, get_gmail_client, get_email_body
+from typing import Optional, List, Dict, Tuple
+
+from .client import (
+    get_gmail_service,
+    get_gmail_client,
+    get_email_body,
+    get_messages_batch,
+    execute_concurrently,
+)
 from app.parsers import (
     parse_linkedin_jobs,
     parse_indeed_jobs,
@@ -25,11 +31,13 @@ from app.parsers import (
     parse_email,
 )
 from app.database import (
-    DB_PATH,
-    get_db,
+    reader_connection,
+    writer_connection,
     create_job_from_confirmation,
-    is_email_processed,
-    mark_email_processed,
+    filter_unprocessed,
+    mark_emails_processed,
+    get_cached_email_metadata,
+    cache_email_metadata,
 )
 
 logger = logging.getLogger(__name__)
@@ -69,6 +77,84 @@ def _get_headers(message: dict) -> Dict[str, str]:
     return headers
 
 
+def _ms_to_iso(internal_ms: int) -> str:
+    """Format a Gmail internalDate (epoch milliseconds) as a local ISO timestamp."""
+    return datetime.fromtimestamp(internal_ms / 1000).isoformat()
+
+
+def _metadata_cache_row(msg_id: str, message: dict) -> tuple:
+    """Return the email_metadata_cache row for a Gmail message."""
+    hdrs = _get_headers(message)
+    return (
+        msg_id,
+        str(message.get("internalDate", 0)),
+        hdrs.get("subject", ""),
+        hdrs.get("from", ""),
+        message.get("snippet", ""),
+    )
+
+
+def _message_from_metadata_cache(row) -> dict:
+    """Rebuild the parts of a Gmail metadata message that discovery reads."""
+    return {
+        "internalDate": row["internal_date"],
+        "snippet": row["snippet"],
+        "payload": {
+            "headers": [
+                {"name": "Subject", "value": row["subject"]},
+                {"name": "From", "value": row["from_email"]},
+            ]
+        },
+    }
+
+
+class _ScanMessageCache:
+    """
+    Full Gmail messages and decoded bodies fetched during one scan.
+
+    Job alert queries and follow-up queries overlap (a follow-up skipped in
+    Phase 1 is picked up again by Phase 2), so each message is fetched and its
+    body decoded at most once per scan.
+    """
+
+    def __init__(self, service):
+        self.service = service
+        self._messages: Dict[str, dict] = {}
+        self._bodies: Dict[str, str] = {}
+
+    def prefetch(self, msg_ids) -> None:
+        """
+        Fetch the messages not fetched yet with batched requests.
+
+        Messages whose batched request failed are fetched one by one in get().
+        """
+        missing = [msg_id for msg_id in msg_ids if msg_id not in self._messages]
+        if not missing:
+            return
+        try:
+            self._messages.update(get_messages_batch(self.service, missing))
+        except Exception as e:
+            logger.warning(f"Batched message fetch failed, fetching individually: {e}")
+
+    def get(self, msg_id: str) -> dict:
+        """Return the full message, fetching it on first use."""
+        message = self._messages.get(msg_id)
+        if message is None:
+            message = (
+                self.service.users().messages().get(userId="me", id=msg_id, format="full").execute()
+            )
+            self._messages[msg_id] = message
+        return message
+
+    def body(self, msg_id: str) -> str:
+        """Return the decoded HTML body of a message, decoding it on first use."""
+        body = self._bodies.get(msg_id)
+        if body is None:
+            body = get_email_body(self.get(msg_id).get("payload", {}))
+            self._bodies[msg_id] = body
+        return body
+
+
 # ---------------------------------------------------------------------------
 # Helper: normalise sender
 # ---------------------------------------------------------------------------
@@ -124,6 +210,53 @@ def _matches_any_source(sender: str, sources: list) -> bool:
 # ---------------------------------------------------------------------------
 
 
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile literal keywords into one alternation, searched in a single pass."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# Subject keywords of follow-up emails that land in a job alert query (Phase 1)
+_ALERT_FOLLOWUP_SUBJECT_KEYWORDS = (
+    "interview",
+    "next steps",
+    "unfortunately",
+    "offer",
+    "congratulations",
+    "declined",
+    "application update",
+)
+_ALERT_FOLLOWUP_SUBJECT_RE = _keyword_pattern(_ALERT_FOLLOWUP_SUBJECT_KEYWORDS)
+
+# Strong job alert signals override follow-up detection
+_JOB_ALERT_SIGNALS = (
+    "new jobs for you",
+    "job alert",
+    "jobs matching",
+    "we found",
+    "recommended jobs",
+    "jobs you might like",
+    "new opportunities",
+)
+_JOB_ALERT_SIGNAL_RE = _keyword_pattern(_JOB_ALERT_SIGNALS)
+
+_FOLLOWUP_SIGNALS = (
+    "thank you for applying",
+    "received your application",
+    "application confirmed",
+    "interview",
+    "phone screen",
+    "next steps",
+    "unfortunately",
+    "not selected",
+    "other candidates",
+    "offer",
+    "congratulations",
+    "assessment",
+    "coding challenge",
+)
+_FOLLOWUP_SIGNAL_RE = _keyword_pattern(_FOLLOWUP_SIGNALS)
+
+
 def looks_like_followup(subject: str, snippet: str) -> bool:
     """
     Return True if this email looks like a follow-up (confirmation, interview, etc.)
@@ -131,40 +264,10 @@ def looks_like_followup(subject: str, snippet: str) -> bool:
     """
     text = (subject + " " + snippet).lower()
 
-    # Strong job alert signals override follow-up detection
-    job_alert_signals = [
-        "new jobs for you",
-        "job alert",
-        "jobs matching",
-        "we found",
-        "recommended jobs",
-        "jobs you might like",
-        "new opportunities",
-    ]
-    for signal in job_alert_signals:
-        if signal in text:
-            return False
-
-    followup_signals = [
-        "thank you for applying",
-        "received your application",
-        "application confirmed",
-        "interview",
-        "phone screen",
-        "next steps",
-        "unfortunately",
-        "not selected",
-        "other candidates",
-        "offer",
-        "congratulations",
-        "assessment",
-        "coding challenge",
-    ]
-    for signal in followup_signals:
-        if signal in text:
-            return True
+    if _JOB_ALERT_SIGNAL_RE.search(text):
+        return False
 
-    return False
+    return _FOLLOWUP_SIGNAL_RE.search(text) is not None
 
 
 # ---------------------------------------------------------------------------
@@ -172,41 +275,64 @@ def looks_like_followup(subject: str, snippet: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
+# Enabled sources from the last load, tagged with the table version they were
+# read at. The version is built from every row's id, enabled flag, scan action
+# and updated_at, so any edit changes it; MAX(updated_at) alone is not enough
+# because writers mix local and UTC timestamps.
+_sources_lock = threading.Lock()
+_sources_cache: Optional[Tuple[tuple, List[Dict]]] = None
+_source_parsers: Dict[tuple, object] = {}
+
+_SOURCES_VERSION_SQL = """
+    SELECT COUNT(*),
+           group_concat(
+               id || ':' || IFNULL(enabled, '') || ':' || IFNULL(post_scan_action, '')
+               || ':' || IFNULL(updated_at, ''),
+               ','
+           )
+    FROM (SELECT * FROM custom_email_sources ORDER BY id)
+"""
+
+
 def _load_email_sources():
     """
     Load enabled email sources from the database.
 
+    The list is reused across scans until custom_email_sources changes.
+
     Returns:
         List of source configurations with parser info
     """
-    conn = sqlite3.connect(DB_PATH)
-
-    # Check if table exists
-    table_check = conn.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='custom_email_sources'"
-    ).fetchone()
-
-    if not table_check:
-        logger.error("custom_email_sources table does not exist! Database not initialized?")
-        conn.close()
-        return []
-
-    sources = conn.execute("""
-        SELECT id, name, sender_email, sender_pattern, subject_keywords,
-               is_builtin, category, parser_class, post_scan_action
-        FROM custom_email_sources
-        WHERE enabled = 1
-        ORDER BY is_builtin DESC, name
-    """).fetchall()
+    global _sources_cache
+
+    with reader_connection() as conn:
+        # Check if table exists
+        table_check = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='custom_email_sources'"
+        ).fetchone()
+
+        if not table_check:
+            logger.error("custom_email_sources table does not exist! Database not initialized?")
+            return []
+
+        version = tuple(conn.execute(_SOURCES_VERSION_SQL).fetchone())
+        with _sources_lock:
+            if _sources_cache is not None and _sources_cache[0] == version:
+                return [dict(source) for source in _sources_cache[1]]
+
+        sources = conn.execute("""
+            SELECT id, name, sender_email, sender_pattern, subject_keywords,
+                   is_builtin, category, parser_class, post_scan_action
+            FROM custom_email_sources
+            WHERE enabled = 1
+            ORDER BY is_builtin DESC, name
+        """).fetchall()
 
     # Log warning if no sources found
     if not sources:
-        all_sources = conn.execute("SELECT COUNT(*) FROM custom_email_sources").fetchone()[0]
-        logger.warning(f"No enabled email sources found! Total sources in DB: {all_sources}")
+        logger.warning(f"No enabled email sources found! Total sources in DB: {version[0]}")
         logger.warning("Make sure to run database initialization to seed built-in sources.")
 
-    conn.close()
-
     result = [
         {
             "id": s[0],
@@ -222,8 +348,28 @@ def _load_email_sources():
         for s in sources
     ]
 
+    with _sources_lock:
+        _sources_cache = (version, result)
+        _source_parsers.clear()
+
     logger.info(f"Loaded {len(result)} enabled email sources from database")
-    return result
+    return [dict(source) for source in result]
+
+
+def _get_source_parser(source: dict):
+    """
+    Return the parser for an email source, resolving its parser class once.
+
+    Parsers are stateless, so one instance is shared until the sources reload.
+    """
+    key = (source.get("name"), source.get("parser_class"))
+    with _sources_lock:
+        parser = _source_parsers.get(key)
+    if parser is None:
+        parser = get_parser_for_source(source)
+        with _sources_lock:
+            _source_parsers[key] = parser
+    return parser
 
 
 # ---------------------------------------------------------------------------
@@ -281,11 +427,10 @@ def _build_query_for_source(source: dict, after_date: str) -> Optional[str]:
 
 def _get_after_date(days_back: int) -> str:
     """Determine the after_date for Gmail queries based on scan history."""
-    conn = sqlite3.connect(DB_PATH)
-    last_scan = conn.execute(
-        "SELECT last_scan_date FROM scan_history ORDER BY created_at DESC LIMIT 1"
-    ).fetchone()
-    conn.close()
+    with reader_connection() as conn:
+        last_scan = conn.execute(
+            "SELECT last_scan_date FROM scan_history ORDER BY created_at DESC LIMIT 1"
+        ).fetchone()
 
     if last_scan and last_scan[0]:
         try:
@@ -314,12 +459,20 @@ def _get_after_date(days_back: int) -> str:
 # ===================================================================
 
 
-def _phase1_job_alerts(service, after_date: str, email_sources: list) -> Dict:
+def _phase1_job_alerts(
+    service,
+    after_date: str,
+    email_sources: list,
+    message_cache: Optional[_ScanMessageCache] = None,
+) -> Dict:
     """
     Phase 1: Fetch job alert emails from known sources, parse into jobs.
 
     Returns dict with keys: jobs, total_emails, cleaned_emails, processed_ids
     """
+    if message_cache is None:
+        message_cache = _ScanMessageCache(service)
+
     # Log all loaded sources for debugging
     logger.info(f"Phase 1: Processing {len(email_sources)} email sources")
     for src in email_sources:
@@ -331,7 +484,7 @@ def _phase1_job_alerts(service, after_date: str, email_sources: list) -> Dict:
     for source in email_sources:
         query = _build_query_for_source(source, after_date)
         if query:
-            parser = get_parser_for_source(source)
+            parser = _get_source_parser(source)
             source_queries.append({"query": query, "source": source, "parser": parser})
             logger.info(f"  Query for '{source['name']}': {query}")
         else:
@@ -346,7 +499,16 @@ def _phase1_job_alerts(service, after_date: str, email_sources: list) -> Dict:
     gmail_client = get_gmail_client()
     _hammy_label_id = None
 
-    for sq in source_queries:
+    # The searches are independent, so run them concurrently; results are still
+    # processed in source order
+    listed = execute_concurrently(
+        [
+            service.users().messages().list(userId="me", q=sq["query"], maxResults=100)
+            for sq in source_queries
+        ]
+    )
+
+    for sq, (results, list_error) in zip(source_queries, listed):
         query = sq["query"]
         source_config = sq["source"]
         parser = sq["parser"]
@@ -354,33 +516,32 @@ def _phase1_job_alerts(service, after_date: str, email_sources: list) -> Dict:
         post_scan_action = source_config.get("post_scan_action", "none")
 
         try:
-            results = (
-                service.users().messages().list(userId="me", q=query, maxResults=100).execute()
-            )
+            if list_error is not None:
+                raise list_error
             messages = results.get("messages", [])
             total_emails += len(messages)
             logger.info(f"  [{source_name}] Found {len(messages)} emails matching query")
 
             source_jobs = 0
             skipped_processed = 0
+            processed_rows = []
+            unprocessed = filter_unprocessed(msg_info["id"] for msg_info in messages)
+            message_cache.prefetch(
+                msg_info["id"]
+                for msg_info in messages
+                if msg_info["id"] in unprocessed and msg_info["id"] not in processed_msg_ids
+            )
             for msg_info in messages:
                 msg_id = msg_info["id"]
 
-                if is_email_processed(msg_id):
+                if msg_id in processed_msg_ids or msg_id not in unprocessed:
                     skipped_processed += 1
                     continue
 
                 try:
-                    message = (
-                        service.users()
-                        .messages()
-                        .get(userId="me", id=msg_id, format="full")
-                        .execute()
-                    )
-                    email_date = datetime.fromtimestamp(
-                        int(message.get("internalDate", 0)) / 1000
-                    ).isoformat()
-                    html = get_email_body(message.get("payload", {}))
+                    message = message_cache.get(msg_id)
+                    internal_ms = int(message.get("internalDate", 0))
+                    html = message_cache.body(msg_id)
 
                     if not html:
                         continue
@@ -389,23 +550,12 @@ def _phase1_job_alerts(service, after_date: str, email_sources: list) -> Dict:
                     subject = (hdrs.get("subject") or "").lower()
 
                     # Skip follow-up emails that landed in a job alert query
-                    is_followup = any(
-                        kw in subject
-                        for kw in [
-                            "interview",
-                            "next steps",
-                            "unfortunately",
-                            "offer",
-                            "congratulations",
-                            "declined",
-                            "application update",
-                        ]
-                    )
+                    is_followup = _ALERT_FOLLOWUP_SUBJECT_RE.search(subject) is not None
                     if is_followup:
                         logger.debug(f"Follow-up detected (skipped): {subject[:60]}...")
                         continue
 
-                    jobs = parser.parse(html, email_date)
+                    jobs = parser.parse(html, _ms_to_iso(internal_ms))
 
                     for job in jobs:
                         if job["job_id"] not in seen_job_ids:
@@ -413,8 +563,8 @@ def _phase1_job_alerts(service, after_date: str, email_sources: list) -> Dict:
                             all_jobs.append(job)
                             source_jobs += 1
 
-                    # Mark processed
-                    mark_email_processed(msg_id, "job_alert", source_name)
+                    # Mark processed (written in one batch after this source's emails)
+                    processed_rows.append((msg_id, "job_alert", source_name))
                     processed_msg_ids.add(msg_id)
 
                     # Post-scan cleanup (only for job alerts)
@@ -438,6 +588,8 @@ def _phase1_job_alerts(service, after_date: str, email_sources: list) -> Dict:
                     logger.error(f"Error parsing email {msg_id} for {source_name}: {e}")
                     continue
 
+            mark_emails_processed(processed_rows)
+
             # Summary for this source
             logger.info(
                 f"  [{source_name}] Result: {source_jobs} jobs extracted, {skipped_processed} already processed"
@@ -461,13 +613,20 @@ def _phase1_job_alerts(service, after_date: str, email_sources: list) -> Dict:
 
 
 def _phase2_followups(
-    service, after_date: str, email_sources: list, already_processed: set
+    service,
+    after_date: str,
+    email_sources: list,
+    already_processed: set,
+    message_cache: Optional[_ScanMessageCache] = None,
 ) -> Dict:
     """
     Phase 2: Broader Gmail queries for confirmation, interview, rejection emails.
 
     Returns dict with keys: followups, jobs_created
     """
+    if message_cache is None:
+        message_cache = _ScanMessageCache(service)
+
     followup_queries = [
         # Application confirmations
         f'(subject:"thank you for applying" OR subject:"received your application" '
@@ -498,20 +657,49 @@ def _phase2_followups(
     seen_message_ids = set(already_processed)
     jobs_created = 0
 
-    for folder in ["INBOX", "[Gmail]/Spam"]:
+    with reader_connection() as conn:
+        job_matcher = _AppliedJobMatcher(conn)
+
+    folders = ["INBOX", "[Gmail]/Spam"]
+
+    # Run every folder x query search concurrently, then process them in order
+    list_results = execute_concurrently(
+        [
+            service.users()
+            .messages()
+            .list(
+                userId="me",
+                q=(f"in:spam {query}" if folder == "[Gmail]/Spam" else f"category:primary {query}"),
+                maxResults=50,
+            )
+            for folder in folders
+            for query in followup_queries
+        ]
+    )
+
+    # The searches overlap heavily; look up every listed ID in one pass
+    unprocessed = filter_unprocessed(
+        msg_info["id"]
+        for results, list_error in list_results
+        if list_error is None
+        for msg_info in results.get("messages", [])
+        if msg_info["id"] not in seen_message_ids
+    )
+
+    listed = iter(list_results)
+    for folder in folders:
         for query in followup_queries:
+            results, list_error = next(listed)
             try:
-                search_query = (
-                    f"in:spam {query}" if folder == "[Gmail]/Spam" else f"category:primary {query}"
-                )
-
-                results = (
-                    service.users()
-                    .messages()
-                    .list(userId="me", q=search_query, maxResults=50)
-                    .execute()
-                )
+                if list_error is not None:
+                    raise list_error
                 messages = results.get("messages", [])
+                processed_rows = []
+                message_cache.prefetch(
+                    msg_info["id"]
+                    for msg_info in messages
+                    if msg_info["id"] in unprocessed and msg_info["id"] not in seen_message_ids
+                )
 
                 for msg_info in messages:
                     msg_id = msg_info["id"]
@@ -520,16 +708,11 @@ def _phase2_followups(
                         continue
                     seen_message_ids.add(msg_id)
 
-                    if is_email_processed(msg_id):
+                    if msg_id not in unprocessed:
                         continue
 
                     try:
-                        message = (
-                            service.users()
-                            .messages()
-                            .get(userId="me", id=msg_id, format="full")
-                            .execute()
-                        )
+                        message = message_cache.get(msg_id)
 
                         hdrs = _get_headers(message)
                         subject = hdrs.get("subject", "")
@@ -538,25 +721,21 @@ def _phase2_followups(
 
                         # Skip if this is from a known job alert source
                         if _matches_any_source(sender, email_sources):
-                            mark_email_processed(msg_id, "skipped", "job_alert_source")
+                            processed_rows.append((msg_id, "skipped", "job_alert_source"))
                             continue
 
                         snippet = message.get("snippet", "")
-                        email_date = datetime.fromtimestamp(
-                            int(message.get("internalDate", 0)) / 1000
-                        ).isoformat()
+                        email_date = _ms_to_iso(int(message.get("internalDate", 0)))
 
                         # Get full body text for better classification
-                        body_html = get_email_body(message.get("payload", {}))
+                        body_html = message_cache.body(msg_id)
                         body_text = _html_to_text(body_html) if body_html else ""
 
                         email_type = classify_followup_email(subject, snippet, body_text)
                         company = extract_company_from_email(from_email, subject)
                         role = extract_role_from_subject(subject)
 
-                        conn = get_db()
-                        job_id = fuzzy_match_company(company, conn)
-                        conn.close()
+                        job_id = job_matcher.match(company)
 
                         # Cold application: create job from confirmation
                         if job_id is None and email_type == "received" and company != "Unknown":
@@ -572,10 +751,11 @@ def _phase2_followups(
                                 raw_text=raw,
                                 sender_email=from_email,
                             )
+                            job_matcher.add(job_id, company)
                             jobs_created += 1
                             logger.info(f"Created job from cold application: {title} at {company}")
 
-                        mark_email_processed(msg_id, email_type, "followup_scan")
+                        processed_rows.append((msg_id, email_type, "followup_scan"))
 
                         followups.append(
                             {
@@ -601,6 +781,8 @@ def _phase2_followups(
                         logger.error(f"Error parsing follow-up email {msg_id}: {e}")
                         continue
 
+                mark_emails_processed(processed_rows)
+
             except Exception as e:
                 logger.error(f"Follow-up query failed - {query[:60]}...: {e}")
                 continue
@@ -636,34 +818,57 @@ def _phase3_discover_sources(
     ]
 
     # Load dismissed senders so we skip them
-    conn = get_db()
     try:
-        dismissed = conn.execute(
-            "SELECT sender_email FROM discovered_email_sources WHERE status = 'dismissed'"
-        ).fetchall()
-        dismissed_senders = {row[0].lower() for row in dismissed}
-
-        existing = conn.execute("SELECT sender_email FROM custom_email_sources").fetchall()
-        existing_senders = {row[0].lower() for row in existing if row[0]}
+        with reader_connection() as conn:
+            dismissed = conn.execute(
+                "SELECT sender_email FROM discovered_email_sources WHERE status = 'dismissed'"
+            ).fetchall()
+            dismissed_senders = {row[0].lower() for row in dismissed}
+
+            existing = conn.execute("SELECT sender_email FROM custom_email_sources").fetchall()
+            existing_senders = {row[0].lower() for row in existing if row[0]}
     except Exception:
         dismissed_senders = set()
         existing_senders = set()
-    finally:
-        conn.close()
 
     discovered_sources = {}
     seen_ids = set(already_processed)
 
-    for query in discovery_queries:
+    listed = execute_concurrently(
+        [
+            service.users()
+            .messages()
+            .list(userId="me", q=f"category:primary {query}", maxResults=30)
+            for query in discovery_queries
+        ]
+    )
+
+    for query, (results, list_error) in zip(discovery_queries, listed):
         try:
-            primary_query = f"category:primary {query}"
-            results = (
-                service.users()
-                .messages()
-                .list(userId="me", q=primary_query, maxResults=30)
-                .execute()
-            )
+            if list_error is not None:
+                raise list_error
             messages = results.get("messages", [])
+            unprocessed = filter_unprocessed(msg_info["id"] for msg_info in messages)
+            candidates = [
+                msg_info["id"]
+                for msg_info in messages
+                if msg_info["id"] in unprocessed and msg_info["id"] not in seen_ids
+            ]
+
+            # Discovery never marks emails processed, so reuse what earlier scans fetched
+            cached = get_cached_email_metadata(candidates)
+            try:
+                metadata = get_messages_batch(
+                    service,
+                    (msg_id for msg_id in candidates if msg_id not in cached),
+                    format="metadata",
+                )
+            except Exception as e:
+                logger.warning(f"Batched metadata fetch failed, fetching individually: {e}")
+                metadata = {}
+            cache_email_metadata(
+                _metadata_cache_row(msg_id, message) for msg_id, message in metadata.items()
+            )
 
             for msg_info in messages:
                 msg_id = msg_info["id"]
@@ -672,16 +877,20 @@ def _phase3_discover_sources(
                     continue
                 seen_ids.add(msg_id)
 
-                if is_email_processed(msg_id):
+                if msg_id not in unprocessed:
                     continue
 
                 try:
-                    message = (
-                        service.users()
-                        .messages()
-                        .get(userId="me", id=msg_id, format="metadata")
-                        .execute()
-                    )
+                    message = metadata.get(msg_id)
+                    if message is None and msg_id in cached:
+                        message = _message_from_metadata_cache(cached[msg_id])
+                    if message is None:
+                        message = (
+                            service.users()
+                            .messages()
+                            .get(userId="me", id=msg_id, format="metadata")
+                            .execute()
+                        )
 
                     hdrs = _get_headers(message)
                     subject = hdrs.get("subject", "")
@@ -701,10 +910,6 @@ def _phase3_discover_sources(
                     if looks_like_followup(subject, snippet):
                         continue
 
-                    email_date = datetime.fromtimestamp(
-                        int(message.get("internalDate", 0)) / 1000
-                    ).isoformat()
-
                     if sender not in discovered_sources:
                         discovered_sources[sender] = {
                             "sender_email": sender,
@@ -713,7 +918,7 @@ def _phase3_discover_sources(
                             "sample_subjects": [],
                             "sample_email_id": msg_id,
                             "sample_snippet": snippet[:200],
-                            "first_seen": email_date,
+                            "first_seen": _ms_to_iso(int(message.get("internalDate", 0))),
                         }
 
                     discovered_sources[sender]["count"] += 1
@@ -739,52 +944,49 @@ def _store_discovered_sources(discovered: dict):
     """Persist discovered sources to the database."""
     import json
 
-    conn = get_db()
     now = datetime.now().isoformat()
     try:
-        for sender, info in discovered.items():
-            existing = conn.execute(
-                "SELECT id, email_count FROM discovered_email_sources WHERE sender_email = ?",
-                (sender,),
-            ).fetchone()
-
-            if existing:
-                conn.execute(
-                    """UPDATE discovered_email_sources
-                       SET email_count = ?, last_seen = ?, updated_at = ?
-                       WHERE id = ?""",
-                    (
-                        (existing["email_count"] or 0) + info["count"],
-                        now,
-                        now,
-                        existing["id"],
-                    ),
-                )
-            else:
-                conn.execute(
-                    """INSERT INTO discovered_email_sources
-                       (sender_email, sender_name, email_count, sample_subjects,
-                        sample_snippet, sample_email_id, first_seen, last_seen,
-                        status, created_at, updated_at)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'pending', ?, ?)""",
-                    (
-                        sender,
-                        info.get("sender_name"),
-                        info["count"],
-                        json.dumps(info.get("sample_subjects", [])),
-                        info.get("sample_snippet", ""),
-                        info.get("sample_email_id"),
-                        info.get("first_seen", now),
-                        now,
-                        now,
-                        now,
-                    ),
-                )
-        conn.commit()
+        with writer_connection() as conn:
+            for sender, info in discovered.items():
+                existing = conn.execute(
+                    "SELECT id, email_count FROM discovered_email_sources WHERE sender_email = ?",
+                    (sender,),
+                ).fetchone()
+
+                if existing:
+                    conn.execute(
+                        """UPDATE discovered_email_sources
+                           SET email_count = ?, last_seen = ?, updated_at = ?
+                           WHERE id = ?""",
+                        (
+                            (existing["email_count"] or 0) + info["count"],
+                            now,
+                            now,
+                            existing["id"],
+                        ),
+                    )
+                else:
+                    conn.execute(
+                        """INSERT INTO discovered_email_sources
+                           (sender_email, sender_name, email_count, sample_subjects,
+                            sample_snippet, sample_email_id, first_seen, last_seen,
+                            status, created_at, updated_at)
+                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'pending', ?, ?)""",
+                        (
+                            sender,
+                            info.get("sender_name"),
+                            info["count"],
+                            json.dumps(info.get("sample_subjects", [])),
+                            info.get("sample_snippet", ""),
+                            info.get("sample_email_id"),
+                            info.get("first_seen", now),
+                            now,
+                            now,
+                            now,
+                        ),
+                    )
     except Exception as e:
         logger.error(f"Failed to store discovered sources: {e}")
-    finally:
-        conn.close()
 
 
 # ===================================================================
@@ -821,12 +1023,14 @@ def scan_emails(days_back: int = 7) -> Dict:
     email_sources = _load_email_sources()
     logger.info(f"Loaded {len(email_sources)} email sources to scan")
 
+    message_cache = _ScanMessageCache(service)
+
     # ---- Phase 1: Job Alerts ----
-    p1 = _phase1_job_alerts(service, after_date, email_sources)
+    p1 = _phase1_job_alerts(service, after_date, email_sources, message_cache)
     logger.info(f"Phase 1 complete: {len(p1['jobs'])} jobs from {p1['total_emails']} emails")
 
     # ---- Phase 2: Follow-Ups ----
-    p2 = _phase2_followups(service, after_date, email_sources, p1["processed_ids"])
+    p2 = _phase2_followups(service, after_date, email_sources, p1["processed_ids"], message_cache)
     logger.info(
         f"Phase 2 complete: {len(p2['followups'])} follow-ups, "
         f"{p2['jobs_created']} cold-application jobs created"
@@ -838,13 +1042,11 @@ def scan_emails(days_back: int = 7) -> Dict:
 
     # Save scan timestamp
     current_scan_time = datetime.now().isoformat()
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute(
-        "INSERT INTO scan_history (last_scan_date, emails_found, created_at) VALUES (?, ?, ?)",
-        (current_scan_time, p1["total_emails"], current_scan_time),
-    )
-    conn.commit()
-    conn.close()
+    with writer_connection() as conn:
+        conn.execute(
+            "INSERT INTO scan_history (last_scan_date, emails_found, created_at) VALUES (?, ?, ?)",
+            (current_scan_time, p1["total_emails"], current_scan_time),
+        )
 
     logger.info(
         f"Scan complete: {p1['total_emails']} emails, "
@@ -888,28 +1090,11 @@ def scan_followup_emails(days_back: int = 30) -> List[Dict]:
 # ===================================================================
 
 
-def classify_followup_email(subject: str, snippet: str, body: str = "") -> str:
-    """
-    Classify follow-up email type based on subject, snippet, and body.
-
-    The body parameter is important because Gmail snippets are only ~160 chars
-    and may not contain the key phrases (e.g., a rejection phrase buried in
-    the middle of the email).
-
-    Classification priority: rejection > offer > assessment > interview > message > received > update
-    Rejection is checked first because its patterns are the most specific and
-    unambiguous. Interview patterns like "next steps" can appear as polite
-    farewells in rejection emails.
-
-    Returns:
-        Email type: 'rejection', 'offer', 'assessment', 'interview', 'message', 'received', or 'update'
-    """
-    text = (subject + " " + snippet + " " + body).lower()
-
-    # --- Rejection (checked first — most specific/unambiguous patterns) ---
-    if any(
-        word in text
-        for word in [
+# Follow-up keywords by email type, in classification priority order
+_FOLLOWUP_TYPE_KEYWORDS = (
+    (
+        "rejection",
+        (
             "unfortunately",
             "not moving forward",
             "won't be moving forward",
@@ -947,14 +1132,11 @@ def classify_followup_email(subject: str, snippet: str, body: str = "") -> str:
             "we're unable to",
             "not a fit at this time",
             "not a match at this time",
-        ]
-    ):
-        return "rejection"
-
-    # --- Offer ---
-    if any(
-        word in text
-        for word in [
+        ),
+    ),
+    (
+        "offer",
+        (
             "job offer",
             "offer letter",
             "offer of employment",
@@ -967,28 +1149,22 @@ def classify_followup_email(subject: str, snippet: str, body: str = "") -> str:
             "compensation package",
             "welcome to the team",
             "congratulations on your new",
-        ]
-    ):
-        return "offer"
-
-    # --- Assessment ---
-    if any(
-        word in text
-        for word in [
+        ),
+    ),
+    (
+        "assessment",
+        (
             "assessment",
             "coding challenge",
             "take-home",
             "technical exercise",
             "complete the",
             "test project",
-        ]
-    ):
-        return "assessment"
-
-    # --- Interview ---
-    if any(
-        word in text
-        for word in [
+        ),
+    ),
+    (
+        "interview",
+        (
             "interview",
             "phone screen",
             "video call",
@@ -1000,14 +1176,11 @@ def classify_followup_email(subject: str, snippet: str, body: str = "") -> str:
             "move to next steps",
             "speak with",
             "chat with",
-        ]
-    ):
-        return "interview"
-
-    # --- Employer Message (Indeed, LinkedIn messages, recruiter outreach) ---
-    if any(
-        word in text
-        for word in [
+        ),
+    ),
+    (
+        "message",
+        (
             "new message from",
             "you've received a new message",
             "you have received a new message",
@@ -1021,14 +1194,11 @@ def classify_followup_email(subject: str, snippet: str, body: str = "") -> str:
             "viewed your profile",
             "view message",
             "reply to this message",
-        ]
-    ):
-        return "message"
-
-    # --- Received / confirmation ---
-    if any(
-        word in text
-        for word in [
+        ),
+    ),
+    (
+        "received",
+        (
             "received your application",
             "we received your application",
             "we have received your application",
@@ -1064,48 +1234,99 @@ def classify_followup_email(subject: str, snippet: str, body: str = "") -> str:
             "your application was sent",
             "your application to",
             "thank you for your interest in the",
-        ]
-    ):
-        return "received"
+        ),
+    ),
+)
 
-    return "update"
 
+def _build_followup_automaton():
+    """
+    Build an Aho-Corasick automaton over every keyword in _FOLLOWUP_TYPE_KEYWORDS.
+
+    Each word maps to the priority (index) of its email type.
 
-def extract_company_from_email(from_email: str, subject: str) -> str:
+    Returns:
+        ahocorasick.Automaton, or None if pyahocorasick is not installed
     """
-    Extract company name from email sender or subject.
+    try:
+        import ahocorasick
+    except ImportError:
+        logger.debug("pyahocorasick not installed; using per-keyword scan for follow-up types")
+        return None
 
-    Priority:
-    1. Display name in sender (e.g., "Prop Firm Match Global <noreply@ats.com>")
-    2. Domain name (if not generic/ATS)
-    3. Subject line patterns (at/with/from Company)
+    automaton = ahocorasick.Automaton()
+    for priority, (_email_type, keywords) in enumerate(_FOLLOWUP_TYPE_KEYWORDS):
+        for keyword in keywords:
+            automaton.add_word(keyword, priority)
+    automaton.make_automaton()
+    return automaton
 
-    Handles compound domain names (e.g., 'risetechnical' -> 'Rise Technical')
-    and common ATS domains.
+
+_FOLLOWUP_AUTOMATON = _build_followup_automaton()
+
+
+def classify_followup_email(subject: str, snippet: str, body: str = "") -> str:
     """
-    KNOWN_SUFFIXES = [
-        "technical",
-        "solutions",
-        "systems",
-        "software",
-        "technologies",
-        "consulting",
-        "digital",
-        "labs",
-        "group",
-        "inc",
-        "corp",
-        "llc",
-        "services",
-        "partners",
-        "global",
-        "media",
-        "studio",
-        "works",
-        "tech",
-    ]
+    Classify follow-up email type based on subject, snippet, and body.
+
+    The body parameter is important because Gmail snippets are only ~160 chars
+    and may not contain the key phrases (e.g., a rejection phrase buried in
+    the middle of the email).
+
+    Classification priority: rejection > offer > assessment > interview > message > received > update
+    Rejection is checked first because its patterns are the most specific and
+    unambiguous. Interview patterns like "next steps" can appear as polite
+    farewells in rejection emails.
+
+    Returns:
+        Email type: 'rejection', 'offer', 'assessment', 'interview', 'message', 'received', or 'update'
+    """
+    text = (subject + " " + snippet + " " + body).lower()
+
+    if _FOLLOWUP_AUTOMATON is not None:
+        # One pass over the text finds every keyword; the highest-priority type wins
+        best = len(_FOLLOWUP_TYPE_KEYWORDS)
+        for _end, priority in _FOLLOWUP_AUTOMATON.iter(text):
+            if priority < best:
+                best = priority
+                if best == 0:
+                    break
+        if best < len(_FOLLOWUP_TYPE_KEYWORDS):
+            return _FOLLOWUP_TYPE_KEYWORDS[best][0]
+        return "update"
+
+    for email_type, keywords in _FOLLOWUP_TYPE_KEYWORDS:
+        if any(keyword in text for keyword in keywords):
+            return email_type
+
+    return "update"
+
 
-    GENERIC_DOMAINS = [
+# Company-name suffixes split off compound domains ('risetechnical' -> 'Rise Technical')
+_COMPANY_SUFFIXES = (
+    "technical",
+    "solutions",
+    "systems",
+    "software",
+    "technologies",
+    "consulting",
+    "digital",
+    "labs",
+    "group",
+    "inc",
+    "corp",
+    "llc",
+    "services",
+    "partners",
+    "global",
+    "media",
+    "studio",
+    "works",
+    "tech",
+)
+
+_GENERIC_EMAIL_DOMAINS = frozenset(
+    [
         "gmail",
         "outlook",
         "yahoo",
@@ -1116,9 +1337,11 @@ def extract_company_from_email(from_email: str, subject: str) -> str:
         "protonmail",
         "aol",
     ]
+)
 
-    # ATS domains — check all parts of the domain, not just the first
-    ATS_DOMAINS = [
+# ATS domains — check all parts of the domain, not just the first
+_ATS_DOMAINS = frozenset(
+    [
         "greenhouse",
         "lever",
         "workday",
@@ -1136,42 +1359,14 @@ def extract_company_from_email(from_email: str, subject: str) -> str:
         "jobvite",
         "recruitee",
     ]
+)
 
-    # Noreply-style usernames that indicate ATS (domain might look like a company)
-    ATS_USERNAMES = ["noreply", "no-reply", "donotreply", "do-not-reply", "notifications"]
-
-    def _is_ats_domain(full_domain: str) -> bool:
-        """Check if any part of the domain matches an ATS provider."""
-        parts = full_domain.lower().split(".")
-        return any(part in ATS_DOMAINS for part in parts)
-
-    def _is_noreply(email_addr: str) -> bool:
-        """Check if the email username looks like a noreply address."""
-        username = email_addr.split("@")[0].lower()
-        return any(nr in username for nr in ATS_USERNAMES)
-
-    # Step 1: Try to extract from display name (most reliable for ATS emails)
-    display_name = extract_sender_name(from_email)
-    if display_name:
-        # Clean up display name — remove common noise
-        cleaned = re.sub(
-            r"\s*[-–—]\s*(FZCO|LLC|Inc|Corp|Ltd|Careers|Recruiting|Talent|HR|Team)\s*\.?\s*$",
-            "",
-            display_name,
-            flags=re.IGNORECASE,
-        ).strip()
-        # Only use display name if it looks like a company (not a person's name or generic)
-        if cleaned and len(cleaned) > 2 and not cleaned.lower().startswith("noreply"):
-            # Check if the email is from an ATS — if so, display name IS the company
-            raw_email = normalize_sender(from_email)
-            if _is_ats_domain(raw_email.split("@")[1]) if "@" in raw_email else False:
-                return cleaned[:50]
-            # If noreply sender, display name is likely the company
-            if _is_noreply(raw_email):
-                return cleaned[:50]
+# Noreply-style usernames that indicate ATS (domain might look like a company)
+_ATS_USERNAMES = ("noreply", "no-reply", "donotreply", "do-not-reply", "notifications")
 
-    # Common email-sending subdomain prefixes (not company names)
-    EMAIL_SUBDOMAIN_PREFIXES = {
+# Common email-sending subdomain prefixes (not company names)
+_EMAIL_SUBDOMAIN_PREFIXES = frozenset(
+    [
         "e",
         "em",
         "email",
@@ -1207,7 +1402,66 @@ def extract_company_from_email(from_email: str, subject: str) -> str:
         "no-reply",
         "messages",
         "msg",
-    }
+    ]
+)
+
+# Trailing legal-form / department noise in a sender display name
+_DISPLAY_NAME_NOISE = re.compile(
+    r"\s*[-–—]\s*(FZCO|LLC|Inc|Corp|Ltd|Careers|Recruiting|Talent|HR|Team)\s*\.?\s*$",
+    re.IGNORECASE,
+)
+
+# Subject line patterns (at/with/from/for Company)
+_SUBJECT_COMPANY_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in [
+        r"at\s+([A-Z][A-Za-z0-9\s&.,-]+)",
+        r"with\s+([A-Z][A-Za-z0-9\s&.,-]+)",
+        r"from\s+([A-Z][A-Za-z0-9\s&.,-]+)",
+        r"for[:\s]+([A-Z][A-Za-z0-9\s&.,-]+)",
+    ]
+)
+_COMPANY_TEAM_SUFFIX = re.compile(r"\s+(team|recruiting|talent|careers|hiring)$", re.IGNORECASE)
+
+
+def _is_ats_domain(full_domain: str) -> bool:
+    """Check if any part of the domain matches an ATS provider."""
+    parts = full_domain.lower().split(".")
+    return any(part in _ATS_DOMAINS for part in parts)
+
+
+def _is_noreply_address(email_addr: str) -> bool:
+    """Check if the email username looks like a noreply address."""
+    username = email_addr.split("@")[0].lower()
+    return any(nr in username for nr in _ATS_USERNAMES)
+
+
+def extract_company_from_email(from_email: str, subject: str) -> str:
+    """
+    Extract company name from email sender or subject.
+
+    Priority:
+    1. Display name in sender (e.g., "Prop Firm Match Global <noreply@ats.com>")
+    2. Domain name (if not generic/ATS)
+    3. Subject line patterns (at/with/from Company)
+
+    Handles compound domain names (e.g., 'risetechnical' -> 'Rise Technical')
+    and common ATS domains.
+    """
+    # Step 1: Try to extract from display name (most reliable for ATS emails)
+    display_name = extract_sender_name(from_email)
+    if display_name:
+        # Clean up display name — remove common noise
+        cleaned = _DISPLAY_NAME_NOISE.sub("", display_name).strip()
+        # Only use display name if it looks like a company (not a person's name or generic)
+        if cleaned and len(cleaned) > 2 and not cleaned.lower().startswith("noreply"):
+            # Check if the email is from an ATS — if so, display name IS the company
+            raw_email = normalize_sender(from_email)
+            if _is_ats_domain(raw_email.split("@")[1]) if "@" in raw_email else False:
+                return cleaned[:50]
+            # If noreply sender, display name is likely the company
+            if _is_noreply_address(raw_email):
+                return cleaned[:50]
 
     # Step 2: Try domain extraction
     raw_email = normalize_sender(from_email) if "<" in from_email else from_email
@@ -1217,16 +1471,16 @@ def extract_company_from_email(from_email: str, subject: str) -> str:
         first_part = domain_parts[0]
 
         # Skip email-sending subdomain prefixes (e.g. "e" in e.supercheapauto.com.au)
-        if first_part.replace("-", "") in EMAIL_SUBDOMAIN_PREFIXES and len(domain_parts) > 2:
+        if first_part.replace("-", "") in _EMAIL_SUBDOMAIN_PREFIXES and len(domain_parts) > 2:
             first_part = domain_parts[1]
 
-        if first_part in GENERIC_DOMAINS:
+        if first_part in _GENERIC_EMAIL_DOMAINS:
             pass  # Fall through to subject
         elif _is_ats_domain(full_domain):
             pass  # Fall through to subject (or already handled by display name)
         else:
             company = first_part.replace("-", " ").replace("_", " ")
-            for suffix in KNOWN_SUFFIXES:
+            for suffix in _COMPANY_SUFFIXES:
                 if company.lower().endswith(suffix) and len(company) > len(suffix):
                     prefix = company[: len(company) - len(suffix)]
                     company = f"{prefix} {suffix}"
@@ -1234,20 +1488,11 @@ def extract_company_from_email(from_email: str, subject: str) -> str:
             return company.title()
 
     # Step 3: Try subject line patterns
-    patterns = [
-        r"at\s+([A-Z][A-Za-z0-9\s&.,-]+)",
-        r"with\s+([A-Z][A-Za-z0-9\s&.,-]+)",
-        r"from\s+([A-Z][A-Za-z0-9\s&.,-]+)",
-        r"for[:\s]+([A-Z][A-Za-z0-9\s&.,-]+)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, subject)
+    for pattern in _SUBJECT_COMPANY_PATTERNS:
+        match = pattern.search(subject)
         if match:
             company = match.group(1).strip()
-            company = re.sub(
-                r"\s+(team|recruiting|talent|careers|hiring)$", "", company, flags=re.IGNORECASE
-            )
+            company = _COMPANY_TEAM_SUFFIX.sub("", company)
             return company[:50]
 
     # Step 4: Last resort — use display name even if not from ATS
@@ -1257,17 +1502,9 @@ def extract_company_from_email(from_email: str, subject: str) -> str:
     return "Unknown"
 
 
-def extract_role_from_subject(subject: str) -> Optional[str]:
-    """
-    Extract job role/title from email subject line.
-
-    Args:
-        subject: Email subject line
-
-    Returns:
-        Extracted role/title or None if not found
-    """
-    patterns = [
+_ROLE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
         # "application for Senior Engineer at Company"
         r"application for[:\s]+(?:the\s+)?(.+?)(?:\s+at\s+|\s+with\s+|\s*$)",
         # "applied for the DevOps Engineer role"
@@ -1285,13 +1522,27 @@ def extract_role_from_subject(subject: str) -> Optional[str]:
         # "role: Software Engineer" or "position: DevOps"
         r"(?:role|position)[:\s]+(.+?)(?:\s+at\s+|\s*$)",
     ]
+)
+_ROLE_LEADING_PUNCT = re.compile(r"^\s*[-:]\s*")
+_ROLE_TRAILING_PUNCT = re.compile(r"\s*[-:]\s*$")
+
+
+def extract_role_from_subject(subject: str) -> Optional[str]:
+    """
+    Extract job role/title from email subject line.
+
+    Args:
+        subject: Email subject line
 
-    for pattern in patterns:
-        match = re.search(pattern, subject, re.IGNORECASE)
+    Returns:
+        Extracted role/title or None if not found
+    """
+    for pattern in _ROLE_PATTERNS:
+        match = pattern.search(subject)
         if match:
             role = match.group(1).strip()
-            role = re.sub(r"^\s*[-:]\s*", "", role)
-            role = re.sub(r"\s*[-:]\s*$", "", role)
+            role = _ROLE_LEADING_PUNCT.sub("", role)
+            role = _ROLE_TRAILING_PUNCT.sub("", role)
             # Filter out bad matches: prepositions, too short, or just a company name
             if role.lower().startswith(("to ", "at ", "with ", "from ")):
                 continue
@@ -1301,37 +1552,67 @@ def extract_role_from_subject(subject: str) -> Optional[str]:
     return None
 
 
-def fuzzy_match_company(email_company: str, conn) -> Optional[str]:
-    """Find matching job in database by fuzzy company name matching."""
-    result = conn.execute(
-        "SELECT job_id FROM jobs WHERE LOWER(company) = ? AND status IN ('applied', 'interviewing')",
-        (email_company.lower(),),
-    ).fetchone()
+# Company aliases: a job saved under one name matches emails using the other
+_COMPANY_ALIASES = {
+    "meta": "facebook",
+    "google": "alphabet",
+    "aws": "amazon",
+}
 
-    if result:
-        return result[0]
 
-    applied_jobs = conn.execute(
-        "SELECT job_id, company FROM jobs WHERE status IN ('applied', 'interviewing')"
-    ).fetchall()
+class _AppliedJobMatcher:
+    """
+    Matches email company names to applied/interviewing jobs.
 
-    for job in applied_jobs:
-        job_id, job_company = job[0], job[1].lower()
+    The jobs are loaded once, and results are memoized per company name, so a
+    follow-up scan runs no query per email.
+    """
+
+    def __init__(self, conn):
+        rows = conn.execute(
+            "SELECT job_id, company FROM jobs WHERE status IN ('applied', 'interviewing')"
+        ).fetchall()
+        self._jobs: List[tuple] = []
+        self._exact: Dict[str, str] = {}
+        self._matches: Dict[str, Optional[str]] = {}
+        for job_id, company in rows:
+            self.add(job_id, company)
+
+    def add(self, job_id: str, company: Optional[str]) -> None:
+        """Add a job created during the scan so later emails can match it."""
+        if not company:
+            return
+        job_company = company.lower()
+        self._jobs.append((job_id, job_company))
+        self._exact.setdefault(job_company, job_id)
+        self._matches.clear()
+
+    def match(self, email_company: str) -> Optional[str]:
+        """Return the matching job_id, or None."""
         email_comp_lower = email_company.lower()
+        if email_comp_lower in self._matches:
+            return self._matches[email_comp_lower]
+
+        job_id = self._exact.get(email_comp_lower)
+        if job_id is None:
+            job_id = self._match_loosely(email_comp_lower)
+        self._matches[email_comp_lower] = job_id
+        return job_id
+
+    def _match_loosely(self, email_comp_lower: str) -> Optional[str]:
+        for job_id, job_company in self._jobs:
+            if job_company in email_comp_lower or email_comp_lower in job_company:
+                return job_id
 
-        if job_company in email_comp_lower or email_comp_lower in job_company:
-            return job_id
+            for key, value in _COMPANY_ALIASES.items():
+                if (key in job_company and value in email_comp_lower) or (
+                    value in job_company and key in email_comp_lower
+                ):
+                    return job_id
 
-        company_map = {
-            "meta": "facebook",
-            "google": "alphabet",
-            "aws": "amazon",
-        }
+        return None
 
-        for key, value in company_map.items():
-            if (key in job_company and value in email_comp_lower) or (
-                value in job_company and key in email_comp_lower
-            ):
-                return job_id
 
-    return None
+def fuzzy_match_company(email_company: str, conn) -> Optional[str]:
+    """Find matching job in database by fuzzy company name matching."""
+    return _AppliedJobMatcher(conn).match(email_company)
@@ -14,10 +14,7 @@ from typing import Dict, Any, Optional
 from app.database import DB_PATH, get_db
 from app.ai import get_provider
 from app.ai.job_analyzer import (
-    extract_experience_requirements,
-    analyze_job_fit,
-    extract_required_skills,
-    create_tech_stack_overlap,
+    analyze_job_text,
     extract_structured_requirements,
     match_requirements_to_resume,
     analyze_job_comprehensive,
@@ -328,15 +325,18 @@ def enrich_job_data(
                 resume_text = get_combined_resume_text()
 
                 if resume_text:
+                    # Experience requirements, skills, tech overlap and fit in one pass
+                    text_analysis = analyze_job_text(description, resume_text, job_title=title)
+
                     # Extract experience requirements
-                    exp_requirements = extract_experience_requirements(description)
+                    exp_requirements = text_analysis["experience_requirements"]
                     if exp_requirements:
                         update_values["experience_requirements"] = json.dumps(exp_requirements)
                         enriched_fields.append("experience_requirements")
                         result["experience_requirements"] = exp_requirements
 
                     # Extract required and preferred skills
-                    skills_data = extract_required_skills(description)
+                    skills_data = text_analysis["skills"]
                     if skills_data.get("required"):
                         update_values["required_skills"] = json.dumps(skills_data["required"])
                         enriched_fields.append("required_skills")
@@ -347,19 +347,14 @@ def enrich_job_data(
                         result["preferred_skills"] = skills_data["preferred"]
 
                     # Create tech stack overlap visualization data
-                    tech_overlap = create_tech_stack_overlap(description, resume_text)
+                    tech_overlap = text_analysis["tech_stack_overlap"]
                     if tech_overlap:
                         update_values["tech_stack_overlap"] = json.dumps(tech_overlap)
                         enriched_fields.append("tech_stack_overlap")
                         result["tech_stack_overlap"] = tech_overlap
 
                     # Analyze job fit (pros/gaps)
-                    fit_analysis = analyze_job_fit(
-                        job_description=description,
-                        resume_text=resume_text,
-                        job_title=title,
-                        experience_requirements=exp_requirements,
-                    )
+                    fit_analysis = text_analysis["fit"]
 
                     if fit_analysis.get("pros"):
                         update_values["fit_pros"] = json.dumps(fit_analysis["pros"])
@@ -149,11 +149,8 @@ class GenericAIParser(BaseParser):
         prompt = build_extract_jobs_prompt(content, self._source_name)
 
         try:
-            # Generate response
-            response = provider._generate(prompt, max_tokens=2000)
-
-            # Parse the JSON response
-            result = provider._parse_json_response(response)
+            # Generate and parse the JSON response (a replayed email reuses the cached reply)
+            result = provider._generate_json(prompt, max_tokens=2000)
 
             jobs = result.get("jobs", [])
             total = result.get("total_found", len(jobs))
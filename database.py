@@ -10,8 +10,9 @@ from app.database import (
     DB_PATH,
     init_db,
     get_db,
+    get_standalone_db,
     close_db,
     run_migrations,
 )
 
-__all__ = ['DB_PATH', 'init_db', 'get_db', 'close_db', 'run_migrations']
+__all__ = ['DB_PATH', 'init_db', 'get_db', 'get_standalone_db', 'close_db', 'run_migrations']
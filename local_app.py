@@ -34,7 +34,7 @@ load_dotenv()
 # Configuration
 from config_loader import get_config
 from constants import APP_DIR, DB_PATH, CREDENTIALS_FILE
-from database import init_db
+from database import close_db, init_db
 from resume_manager import migrate_file_resumes_to_db
 from backup_manager import backup_on_startup
 from routes import register_routes
@@ -64,8 +64,9 @@ if not os.getenv("ANTHROPIC_API_KEY"):
 app = Flask(__name__, static_folder='dist/assets', static_url_path='/assets')
 CORS(app)
 
-# Initialize database
+# Initialize database; the per-request connection is closed at teardown
 init_db()
+app.teardown_appcontext(close_db)
 
 # Register all routes
 app = register_routes(app)
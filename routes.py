@@ -20,6 +20,7 @@ import anthropic
 # Import business logic from other modules
 from ai_analyzer import (
     ai_filter_and_score,
+    ai_filter_and_score_batch,
     analyze_job,
     generate_cover_letter,
     calculate_weighted_score,
@@ -62,6 +63,19 @@ def write_log(log_file: Path, message: str, data: dict = None):
             f.write(f"  Data: {json.dumps(data, indent=2, default=str)}\n")
 
 
+def _scan_duplicate_keys(job: dict) -> set:
+    """
+    Keys matched by the duplicate query (same job_id, url, or company and title).
+
+    Scans score new jobs before inserting them, so these keys catch repeats within
+    the same scan. NULL never compares equal in SQL, so missing values are left out.
+    """
+    keys = {("job_id", job["job_id"]), ("url", job["url"])}
+    if job["company"] is not None and job["title"] is not None:
+        keys.add(("role", (job["company"], job["title"])))
+    return {key for key in keys if key[1] is not None}
+
+
 # Load config
 CONFIG = get_config()
 
@@ -1114,6 +1128,9 @@ def register_routes(app):
         duplicate_count = 0
 
         try:
+            # Collect new jobs first so they can be scored several per AI call
+            candidates = []
+            seen = set()
             for job in jobs:
                 # Check duplicates
                 existing = conn.execute(
@@ -1125,7 +1142,8 @@ def register_routes(app):
                 """,
                     (job["job_id"], job["url"], job["company"], job["title"]),
                 ).fetchone()
-                if existing:
+                keys = _scan_duplicate_keys(job)
+                if existing or not seen.isdisjoint(keys):
                     duplicate_count += 1
                     continue
 
@@ -1136,9 +1154,13 @@ def register_routes(app):
                 if deleted_check:
                     continue
 
-                # Quick rule-based AI filter (location + seniority)
-                keep, baseline_score, reason = ai_filter_and_score(job, resume_text)
+                seen.update(keys)
+                candidates.append(job)
 
+            # Quick rule-based AI filter (location + seniority)
+            scores = ai_filter_and_score_batch(candidates, resume_text)
+
+            for job, (keep, baseline_score, reason) in zip(candidates, scores):
                 if keep:
                     conn.execute(
                         """
@@ -1393,6 +1415,9 @@ def register_routes(app):
             conn = get_db()
             new_job_ids = []
 
+            # Collect new jobs first so they can be scored several per AI call
+            candidates = []
+            seen = set()
             for job in jobs:
                 # Check if already exists
                 existing = conn.execute(
@@ -1401,7 +1426,8 @@ def register_routes(app):
                     (job["job_id"], job["url"], job["company"], job["title"]),
                 ).fetchone()
 
-                if existing:
+                keys = _scan_duplicate_keys(job)
+                if existing or not seen.isdisjoint(keys):
                     results["jobs_skipped"] += 1
                     write_log(log_file, f"  SKIP (exists): {job['title'][:40]}")
                     continue
@@ -1414,9 +1440,13 @@ def register_routes(app):
                     write_log(log_file, f"  SKIP (deleted): {job['title'][:40]}")
                     continue
 
-                # Quick filter check (location/seniority)
-                keep, baseline_score, reason = ai_filter_and_score(job, resume_text)
+                seen.update(keys)
+                candidates.append(job)
+
+            # Quick filter check (location/seniority)
+            scores = ai_filter_and_score_batch(candidates, resume_text)
 
+            for job, (keep, baseline_score, reason) in zip(candidates, scores):
                 if not keep:
                     results["jobs_filtered"] += 1
                     write_log(log_file, f"  FILTERED: {job['title'][:40]} - {reason[:50]}")
@@ -2535,6 +2565,7 @@ def register_routes(app):
         from app.email.scanner import (
             _html_to_text,
             _get_headers,
+            _ms_to_iso,
             normalize_sender,
             extract_sender_name,
             classify_followup_email,
@@ -2542,9 +2573,10 @@ def register_routes(app):
             extract_role_from_subject,
             _matches_any_source,
             _load_email_sources,
+            _ScanMessageCache,
         )
-        from app.email.client import get_gmail_service, get_email_body
-        from app.database import is_email_processed
+        from app.email.client import get_gmail_service
+        from app.database import filter_unprocessed
 
         data = request.get_json() or {}
         count = min(data.get("count", 40), 100)
@@ -2599,6 +2631,11 @@ def register_routes(app):
         log(f"Fetched {len(all_msg_ids)} message IDs from Gmail")
         log("")
 
+        # Fetch the messages in batched requests and check which are already processed
+        message_cache = _ScanMessageCache(service)
+        message_cache.prefetch(msg_info["id"] for msg_info in all_msg_ids)
+        unprocessed = filter_unprocessed(msg_info["id"] for msg_info in all_msg_ids)
+
         # Load resume for scoring context
         resume_text = get_combined_resume_text()
 
@@ -2613,9 +2650,7 @@ def register_routes(app):
             }
 
             try:
-                message = (
-                    service.users().messages().get(userId="me", id=msg_id, format="full").execute()
-                )
+                message = message_cache.get(msg_id)
 
                 hdrs = _get_headers(message)
                 subject = hdrs.get("subject", "(no subject)")
@@ -2623,9 +2658,7 @@ def register_routes(app):
                 sender = normalize_sender(from_raw)
                 display_name = extract_sender_name(from_raw)
                 snippet = message.get("snippet", "")
-                email_date = datetime.fromtimestamp(
-                    int(message.get("internalDate", 0)) / 1000
-                ).isoformat()
+                email_date = _ms_to_iso(int(message.get("internalDate", 0)))
 
                 log(f"From:     {from_raw}")
                 log(f"Sender:   {sender}")
@@ -2647,7 +2680,7 @@ def register_routes(app):
                 )
 
                 # Check if already processed
-                already = is_email_processed(msg_id)
+                already = msg_id not in unprocessed
                 log(f"Already processed: {already}")
                 email_result["already_processed"] = already
 
@@ -2668,7 +2701,7 @@ def register_routes(app):
                 email_result["matched_source"] = matched_source_name
 
                 # Get full body
-                body_html = get_email_body(message.get("payload", {}))
+                body_html = message_cache.body(msg_id)
                 body_text = _html_to_text(body_html) if body_html else ""
                 body_len = len(body_text)
                 log(f"Body length: {body_len} chars")
@@ -2966,6 +2999,8 @@ def register_routes(app):
 
         Route: GET /api/discovered-sources/<id>/preview
         """
+        from app.email.scanner import _get_headers
+
         conn = get_db()
         try:
             discovered = conn.execute(
@@ -2985,17 +3020,10 @@ def register_routes(app):
                 .execute()
             )
 
-            headers = message.get("payload", {}).get("headers", [])
-            subject = ""
-            from_addr = ""
-            date = ""
-            for h in headers:
-                if h["name"].lower() == "subject":
-                    subject = h["value"]
-                elif h["name"].lower() == "from":
-                    from_addr = h["value"]
-                elif h["name"].lower() == "date":
-                    date = h["value"]
+            hdrs = _get_headers(message)
+            subject = hdrs.get("subject", "")
+            from_addr = hdrs.get("from", "")
+            date = hdrs.get("date", "")
 
             body = get_email_body(message.get("payload", {}))
 
@@ -45,6 +45,11 @@ if errorlevel 1 (
     exit /b 1
 )
 
+pip install -r requirements-speedups.txt
+if errorlevel 1 (
+    echo NOTE: Optional speedups not installed; continuing without them
+)
+
 echo.
 echo [5/5] Checking configuration files...
 
@@ -36,6 +36,7 @@ source venv/bin/activate
 echo ""
 echo "[4/5] Installing dependencies..."
 pip install -r requirements-local.txt
+pip install -r requirements-speedups.txt || echo "NOTE: Optional speedups not installed; continuing without them"
 
 echo ""
 echo "[5/5] Checking configuration files..."
@@ -9,6 +9,34 @@ import os
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+from app.ai.claude import ClaudeProvider
+from app.ai.response_cache import response_cache
+
+
+class FakeClaudeProvider(ClaudeProvider):
+    """ClaudeProvider with the API call replaced by canned replies."""
+
+    def __init__(self, replies, model="test-model"):
+        self._model = model
+        self.replies = list(replies)
+        self.prompts = []
+
+    def _generate(self, prompt, max_tokens=1000, model=None):
+        self.prompts.append(prompt)
+        return self.replies.pop(0)
+
+
+@pytest.fixture
+def empty_response_cache():
+    """
+    Clear the shared AI response cache before and after a test.
+
+    Use with pytestmark = pytest.mark.usefixtures("empty_response_cache").
+    """
+    response_cache.clear()
+    yield
+    response_cache.clear()
+
 
 @pytest.fixture
 def temp_db():
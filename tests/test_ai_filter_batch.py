@@ -0,0 +1,176 @@
+"""
+Tests for batched AI job filtering.
+
+These tests verify that several jobs are scored with one AI call and that a
+reply which does not line up with the batch falls back to scoring each job.
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ai.prompts import build_filter_and_score_batch_prompt
+from tests.conftest import FakeClaudeProvider
+
+JOBS = [
+    {"title": "Backend Engineer", "company": "Acme", "location": "Remote", "raw_text": "Python"},
+    {"title": "Data Engineer", "company": "Globex", "location": "Austin, TX", "raw_text": "SQL"},
+]
+PREFERENCES = {
+    "location_filter": "Remote only",
+    "experience_level": {"min_years": 1, "max_years": 5, "current_level": "mid"},
+    "exclude_keywords": [],
+}
+
+pytestmark = pytest.mark.usefixtures("empty_response_cache")
+
+
+def test_batch_prompt_lists_every_job_once():
+    """Test the batch prompt numbers each job after a single copy of the resume."""
+    prompt = build_filter_and_score_batch_prompt(JOBS, "Python developer", PREFERENCES)
+
+    assert prompt.count("Python developer") == 1
+    assert "JOBS (2):\n1.\nTitle: Backend Engineer" in prompt
+    assert prompt.index("Acme") < prompt.index("2.\nTitle: Data Engineer")
+
+
+def test_batch_scores_all_jobs_with_one_call():
+    """Test an aligned JSON array is returned as-is from a single call."""
+    reply = [
+        {"index": 1, "keep": True, "baseline_score": 80, "filter_reason": "match"},
+        {"index": 2, "keep": False, "baseline_score": 20, "filter_reason": "location"},
+    ]
+    provider = FakeClaudeProvider([json.dumps(reply)])
+
+    results = provider.filter_and_score_batch(JOBS, "Python developer", PREFERENCES)
+
+    assert [result["baseline_score"] for result in results] == [80, 20]
+    assert len(provider.prompts) == 1
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [
+        [{"index": 1, "keep": True, "baseline_score": 80}],
+        [{"index": 2, "baseline_score": 20}, {"index": 1, "baseline_score": 80}],
+        {"keep": True, "baseline_score": 80},
+    ],
+)
+def test_misaligned_batch_reply_falls_back_per_job(reply):
+    """Test a short, reordered, or non-array reply rescores each job alone."""
+    provider = FakeClaudeProvider(
+        [
+            json.dumps(reply),
+            '{"keep": true, "baseline_score": 70}',
+            '{"keep": false, "baseline_score": 10}',
+        ]
+    )
+
+    results = provider.filter_and_score_batch(JOBS, "Python developer", PREFERENCES)
+
+    assert [result["baseline_score"] for result in results] == [70, 10]
+    assert len(provider.prompts) == 3
+
+
+def test_duplicate_postings_are_scored_once(monkeypatch):
+    """Test reposts differing only in case or spacing share one scored result."""
+    import app.ai.analyzer as analyzer
+
+    reply = [
+        {"index": 1, "keep": True, "baseline_score": 80, "filter_reason": "match"},
+        {"index": 2, "keep": False, "baseline_score": 20, "filter_reason": "location"},
+    ]
+    provider = FakeClaudeProvider([json.dumps(reply)])
+    monkeypatch.setattr(analyzer, "get_provider", lambda: provider)
+    monkeypatch.setattr(analyzer, "_filter_preferences", lambda: PREFERENCES)
+
+    repost = dict(JOBS[0], company=" ACME ", title="Backend  Engineer", raw_text="Python, AWS")
+    results = analyzer.ai_filter_and_score_batch([JOBS[0], JOBS[1], repost], "Python developer")
+
+    assert [score for _, score, _ in results] == [80, 20, 80]
+    assert len(provider.prompts) == 1
+    assert "Python, AWS" not in provider.prompts[0]
+
+
+def test_batches_group_jobs_by_tech_stack():
+    """Test batches are filled with the jobs sharing the most skills, in scan order."""
+    from app.ai.analyzer import _group_similar_jobs
+
+    jobs = [
+        {"title": "Backend Engineer", "raw_text": "python django postgresql"},
+        {"title": "Java Developer", "raw_text": "java spring kafka"},
+        {"title": "Office Manager", "raw_text": "scheduling"},
+        {"title": "Python Developer", "raw_text": "python django aws"},
+        {"title": "Platform Engineer", "raw_text": "java kafka kubernetes"},
+        {"title": "Data Engineer", "raw_text": "python postgresql airflow"},
+    ]
+
+    batches = _group_similar_jobs(jobs, list(range(len(jobs))), batch_size=3)
+
+    assert batches == [[0, 3, 5], [1, 2, 4]]
+
+
+def test_excluded_title_keywords_skip_the_ai(monkeypatch):
+    """Test titles with an exclude keyword are rejected without an AI call."""
+    import app.ai.analyzer as analyzer
+
+    preferences = dict(PREFERENCES, exclude_keywords=["Manager", " C++ ", ""])
+    provider = FakeClaudeProvider(['{"keep": true, "baseline_score": 80}'])
+    monkeypatch.setattr(analyzer, "get_provider", lambda: provider)
+    monkeypatch.setattr(analyzer, "_filter_preferences", lambda: preferences)
+
+    jobs = [
+        dict(JOBS[0], title="Engineering Manager"),
+        dict(JOBS[1], title="Senior C++ Developer"),
+        JOBS[0],
+    ]
+    results = analyzer.ai_filter_and_score_batch(jobs, "Python developer")
+
+    assert results[0] == (False, 10, "rejected: title contains excluded keyword 'manager'")
+    assert results[1] == (False, 10, "rejected: title contains excluded keyword 'c++'")
+    assert results[2][:2] == (True, 80)
+    assert len(provider.prompts) == 1
+
+
+def test_exclude_keywords_match_whole_words():
+    """Test an exclude keyword inside a longer word does not reject the title."""
+    from app.ai.analyzer import exclude_keyword_filter
+
+    keywords = ["VP", "Chief", "Head of", "Director", "intern"]
+
+    assert exclude_keyword_filter({"title": "VPN Network Engineer"}, keywords) is None
+    assert exclude_keyword_filter({"title": "Internal Tools Engineer"}, keywords) is None
+    assert exclude_keyword_filter({"title": "VP, Engineering"}, keywords) == (
+        False,
+        10,
+        "rejected: title contains excluded keyword 'vp'",
+    )
+    assert exclude_keyword_filter({"title": "HEAD OF Platform"}, keywords)[2].endswith("'head of'")
+
+
+def test_misaligned_batch_reply_is_not_cached():
+    """Test a rescan after a misaligned reply sends the batch request again."""
+    aligned = [
+        {"index": 1, "keep": True, "baseline_score": 80, "filter_reason": "match"},
+        {"index": 2, "keep": False, "baseline_score": 20, "filter_reason": "location"},
+    ]
+    provider = FakeClaudeProvider(
+        [
+            json.dumps(aligned[:1]),
+            '{"keep": true, "baseline_score": 70}',
+            '{"keep": false, "baseline_score": 10}',
+            json.dumps(aligned),
+        ]
+    )
+
+    first = provider.filter_and_score_batch(JOBS, "Python developer", PREFERENCES)
+    second = provider.filter_and_score_batch(JOBS, "Python developer", PREFERENCES)
+
+    assert [result["baseline_score"] for result in first] == [70, 10]
+    assert [result["baseline_score"] for result in second] == [80, 20]
+    assert len(provider.prompts) == 4
+    assert provider.prompts[3] == provider.prompts[0]
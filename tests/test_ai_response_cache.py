@@ -0,0 +1,72 @@
+"""
+Tests for the AI response cache.
+
+These tests verify that identical structured prompts reuse the model response,
+while different models, prompts, and unparseable replies do not.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests.conftest import FakeClaudeProvider
+from app.ai.response_cache import ResponseCache
+
+JOB = {"title": "Backend Engineer", "company": "Acme", "location": "Remote", "raw_text": "Python"}
+
+pytestmark = pytest.mark.usefixtures("empty_response_cache")
+
+
+def test_identical_prompt_reuses_response():
+    """Test a repeated analysis prompt is answered from the cache."""
+    provider = FakeClaudeProvider(['{"qualification_score": 80}'])
+
+    first = provider.analyze_job(JOB, "Python developer")
+    first["qualification_score"] = 0
+    second = provider.analyze_job(JOB, "Python developer")
+
+    assert second == {"qualification_score": 80}
+    assert len(provider.prompts) == 1
+
+
+def test_cache_key_includes_model_and_prompt():
+    """Test a different resume or model goes to the API."""
+    provider = FakeClaudeProvider(['{"qualification_score": 80}', '{"qualification_score": 40}'])
+    other_model = FakeClaudeProvider(['{"qualification_score": 60}'], model="other-model")
+
+    assert provider.analyze_job(JOB, "Python developer")["qualification_score"] == 80
+    assert provider.analyze_job(JOB, "Java developer")["qualification_score"] == 40
+    assert other_model.analyze_job(JOB, "Python developer")["qualification_score"] == 60
+
+
+def test_unparseable_response_is_not_cached():
+    """Test a reply without JSON falls back and is retried next time."""
+    provider = FakeClaudeProvider(["Sorry, I can't help", '{"qualification_score": 70}'])
+
+    assert provider.analyze_job(JOB, "Python developer")["qualification_score"] == 0
+    assert provider.analyze_job(JOB, "Python developer")["qualification_score"] == 70
+    assert len(provider.prompts) == 2
+
+
+def test_response_cache_evicts_and_expires(monkeypatch):
+    """Test the LRU bound and time-to-live."""
+    import app.ai.response_cache as cache_module
+
+    cache = ResponseCache(max_entries=2, ttl_seconds=10)
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+
+    now[0] += 10
+    assert cache.get("a") is None
+    assert len(cache) == 1
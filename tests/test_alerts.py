@@ -0,0 +1,138 @@
+"""
+Tests for error tracking and alert thresholds.
+"""
+
+import json
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app.alerts as alerts
+from app.alerts import ErrorTracker
+
+
+def make_tracker(tmp_path, monkeypatch, now):
+    """ErrorTracker writing to tmp_path with a controllable monotonic clock."""
+    monkeypatch.setattr(alerts.time, "monotonic", lambda: now[0])
+    tracker = ErrorTracker(max_history=10, alert_threshold=3, alert_window_seconds=60)
+    tracker._error_log_file = tmp_path / "errors.jsonl"
+    return tracker
+
+
+def test_alert_triggers_at_threshold_within_window(tmp_path, monkeypatch):
+    """Test an alert fires once enough errors land inside the window."""
+    now = [1000.0]
+    tracker = make_tracker(tmp_path, monkeypatch, now)
+    alerts_seen = []
+    tracker.register_alert_handler(lambda message, recent: alerts_seen.append(len(recent)))
+
+    tracker.record_error(ValueError("one"))
+    now[0] += 30
+    tracker.record_error(ValueError("two"))
+    assert alerts_seen == []
+
+    now[0] += 10
+    tracker.record_error(ValueError("three"))
+    assert alerts_seen == [3]
+
+
+def test_errors_outside_window_do_not_count(tmp_path, monkeypatch):
+    """Test errors older than the window are dropped from the count."""
+    now = [1000.0]
+    tracker = make_tracker(tmp_path, monkeypatch, now)
+    alerts_seen = []
+    tracker.register_alert_handler(lambda message, recent: alerts_seen.append(message))
+
+    tracker.record_error(ValueError("one"))
+    tracker.record_error(ValueError("two"))
+    now[0] += 60
+    tracker.record_error(ValueError("three"))
+
+    assert alerts_seen == []
+    assert len(tracker.get_recent_errors()) == 3
+
+
+def test_errors_are_written_to_log_file(tmp_path, monkeypatch):
+    """Test queued errors reach errors.jsonl in order after flush."""
+    tracker = make_tracker(tmp_path, monkeypatch, [1000.0])
+
+    for message in ("one", "two", "three"):
+        tracker.record_error(ValueError(message), operation="scan")
+    tracker.flush()
+
+    lines = (tmp_path / "errors.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["error_message"] for line in lines] == ["one", "two", "three"]
+
+
+def test_trackers_share_one_writer_thread(tmp_path, monkeypatch):
+    """Test trackers start no threads of their own and still write to their own files."""
+    import threading
+
+    writers_before = [t for t in threading.enumerate() if t.name == "error-log-writer"]
+    first = make_tracker(tmp_path, monkeypatch, [1000.0])
+    second = ErrorTracker()
+    second._error_log_file = tmp_path / "other.jsonl"
+
+    first.record_error(ValueError("first"))
+    second.record_error(ValueError("second"))
+    second.flush()
+
+    writers = [t for t in threading.enumerate() if t.name == "error-log-writer"]
+    assert len(writers) == 1 and len(writers_before) <= 1
+    assert json.loads((tmp_path / "errors.jsonl").read_text())["error_message"] == "first"
+    assert json.loads((tmp_path / "other.jsonl").read_text())["error_message"] == "second"
+
+
+def test_dumps_line_matches_json_module():
+    """Test error lines parse back to the same record, including json-only values."""
+    records = [
+        {"error_message": "café", "context": {"attempt": 2}},
+        {"error_message": "bad \ud800 surrogate", "context": {"id": 2**70}},
+    ]
+
+    for record in records:
+        line = alerts._dumps_line(record)
+        assert line.endswith(b"\n")
+        assert json.loads(line) == record
+
+
+def test_error_summary_tracks_evictions(tmp_path, monkeypatch):
+    """Test summary counts cover only errors still in the bounded history."""
+    tracker = make_tracker(tmp_path, monkeypatch, [1000.0])
+
+    tracker.record_error(KeyError("old"), severity="critical", operation="gmail")
+    for i in range(10):
+        tracker.record_error(ValueError(str(i)), severity="warning", operation="scan")
+
+    summary = tracker.get_error_summary()
+    assert summary == {
+        "total": 10,
+        "by_severity": {"warning": 10},
+        "by_type": {"ValueError": 10},
+        "by_operation": {"scan": 10},
+    }
+
+    tracker.clear_errors()
+    assert tracker.get_error_summary()["total"] == 0
+    assert tracker.get_error_summary()["by_type"] == {}
+
+
+def test_track_errors_abbreviates_large_arguments(tmp_path, monkeypatch):
+    """Test decorator context stays short for large positional and keyword arguments."""
+    tracker = make_tracker(tmp_path, monkeypatch, [1000.0])
+    monkeypatch.setattr(alerts, "_error_tracker", tracker)
+
+    @alerts.track_errors("upload")
+    def fail(payload, **kwargs):
+        raise ValueError("bad payload")
+
+    try:
+        fail(b"x" * 1_000_000, rows=list(range(1000)))
+    except ValueError:
+        pass
+
+    context = tracker.get_recent_errors(1)[0]["context"]
+    assert context["args"].startswith("(b'xxx") and len(context["args"]) <= 200
+    assert context["kwargs"] == "{'rows': [0, 1, 2, 3, 4, ...]}"
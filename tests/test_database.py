@@ -0,0 +1,179 @@
+"""
+Tests for database connection handling.
+"""
+
+import sys
+import os
+
+import pytest
+from flask import Flask
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app.database as database
+
+
+@pytest.fixture
+def flask_app(tmp_path, monkeypatch):
+    """Flask app using a fresh database in tmp_path."""
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "jobs.db")
+    database.init_db()
+
+    flask_app = Flask(__name__)
+    flask_app.teardown_appcontext(database.close_db)
+    return flask_app
+
+
+def test_get_db_shares_one_connection_per_app_context(flask_app):
+    """Test callers in one request share a connection that close() leaves open."""
+    with flask_app.app_context():
+        conn = database.get_db()
+        conn.execute("INSERT INTO watchlist (company) VALUES ('Acme')")
+        conn.close()
+
+        # A helper opening and closing "its own" connection
+        assert not database.is_email_processed("msg-1")
+
+        same = database.get_db()
+        assert same is conn
+        same.commit()
+        assert same.execute("SELECT company FROM watchlist").fetchone()["company"] == "Acme"
+
+    with pytest.raises(database.sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+
+def test_get_db_outside_app_context_returns_own_connection(flask_app):
+    """Test background code gets a separate connection it must close itself."""
+    first = database.get_db()
+    second = database.get_db()
+    try:
+        assert first is not second
+        assert first.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 0
+    finally:
+        first.close()
+        second.close()
+
+
+def test_get_db_restores_row_factory(flask_app):
+    """Test a route's custom row factory does not leak to the next caller."""
+    with flask_app.app_context():
+        conn = database.get_db()
+        conn.row_factory = lambda cursor, row: row
+
+        assert database.get_db().row_factory is database.sqlite3.Row
+
+
+def test_processed_email_helpers_use_pools(flask_app):
+    """Test writes through the writer pool are visible to pooled readers."""
+    assert not database.is_email_processed("msg-2")
+    database.mark_email_processed("msg-2", "job_alert", "test")
+    database.mark_email_processed("msg-2", "job_alert", "test")
+
+    assert database.is_email_processed("msg-2")
+    assert database.filter_unprocessed(["msg-2", "msg-5", "msg-5"]) == {"msg-5"}
+    assert database.filter_unprocessed([]) == set()
+
+
+def test_mark_emails_processed_batches_rows(flask_app):
+    """Test several emails are recorded in one call and repeats are ignored."""
+    database.mark_emails_processed([("msg-3", "job_alert", "a"), ("msg-4", "skipped", "b")])
+    database.mark_emails_processed([("msg-3", "interview", "c")])
+    database.mark_emails_processed([])
+
+    with database.reader_connection() as conn:
+        rows = conn.execute(
+            "SELECT gmail_message_id, email_type FROM processed_emails ORDER BY 1"
+        ).fetchall()
+    assert [tuple(row) for row in rows] == [("msg-3", "job_alert"), ("msg-4", "skipped")]
+
+
+def test_writer_connection_rolls_back_on_error(flask_app):
+    """Test a failing write block leaves nothing behind and readers cannot write."""
+    with pytest.raises(RuntimeError):
+        with database.writer_connection() as conn:
+            conn.execute("INSERT INTO watchlist (company) VALUES ('Acme')")
+            raise RuntimeError("boom")
+
+    with database.reader_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM watchlist").fetchone()[0] == 0
+        with pytest.raises(database.sqlite3.OperationalError):
+            conn.execute("DELETE FROM watchlist")
+
+
+def test_seed_builtin_sources_upserts_existing_rows(flask_app):
+    """Test reseeding refreshes built-in sources without duplicating them."""
+    name = database.BUILTIN_EMAIL_SOURCES[0]["name"]
+    with database.writer_connection() as conn:
+        conn.execute(
+            "UPDATE custom_email_sources SET enabled = 0, parser_class = 'old' WHERE name = ?",
+            (name,),
+        )
+
+    database.seed_builtin_sources()
+
+    with database.reader_connection() as conn:
+        count = conn.execute("SELECT COUNT(*) FROM custom_email_sources").fetchone()[0]
+        row = conn.execute(
+            "SELECT enabled, parser_class FROM custom_email_sources WHERE name = ?", (name,)
+        ).fetchone()
+    assert count == len(database.BUILTIN_EMAIL_SOURCES)
+    assert tuple(row) == (0, database.BUILTIN_EMAIL_SOURCES[0]["parser_class"])
+
+
+def test_migration_removes_duplicate_builtin_sources(flask_app):
+    """Test an older database with duplicate built-in rows upgrades cleanly."""
+    conn = database.sqlite3.connect(database.DB_PATH)
+    conn.execute("DROP INDEX uq_builtin_source_name")
+    conn.execute(
+        "INSERT INTO custom_email_sources (name, is_builtin) "
+        "SELECT name, 1 FROM custom_email_sources WHERE is_builtin = 1"
+    )
+    conn.execute("PRAGMA user_version = 1")
+    conn.commit()
+    conn.close()
+
+    database.init_db()
+
+    with database.reader_connection() as conn:
+        count = conn.execute("SELECT COUNT(*) FROM custom_email_sources").fetchone()[0]
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    assert count == len(database.BUILTIN_EMAIL_SOURCES)
+    assert version == database.SCHEMA_VERSION
+
+
+def test_close_db_returns_free_pages(flask_app, monkeypatch):
+    """Test new databases use incremental auto_vacuum and teardown reclaims space."""
+    monkeypatch.setattr(database, "_last_vacuum", float("-inf"))
+    with flask_app.app_context():
+        conn = database.get_db()
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        conn.executemany("INSERT INTO watchlist (company) VALUES (?)", [("x" * 4000,)] * 200)
+        conn.commit()
+        conn.execute("DELETE FROM watchlist")
+        conn.commit()
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] > 100
+
+    with database.reader_connection() as conn:
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+
+def test_failed_migration_is_rolled_back(flask_app, monkeypatch):
+    """Test a failing step leaves neither its changes nor its version behind."""
+
+    def broken_migration(conn):
+        conn.execute("ALTER TABLE jobs ADD COLUMN half_done TEXT")
+        raise RuntimeError("boom")
+
+    target = database.SCHEMA_VERSION + 1
+    monkeypatch.setitem(database.MIGRATIONS, target, broken_migration)
+    monkeypatch.setattr(database, "SCHEMA_VERSION", target)
+
+    conn = database.sqlite3.connect(database.DB_PATH)
+    with pytest.raises(RuntimeError):
+        database.run_migrations(conn)
+
+    assert "half_done" not in database._table_columns(conn, "jobs")
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == target - 1
+    conn.close()
@@ -0,0 +1,431 @@
+"""
+Tests for the email scan pipeline helpers.
+
+These tests verify that message bodies are extracted from Gmail payloads, that
+each message is fetched and decoded once per scan even when several phases
+look at it, and that follow-up emails are classified by type.
+"""
+
+import base64
+import time
+import pytest
+from unittest.mock import Mock
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.email.client import get_email_body
+from app.email.scanner import _ScanMessageCache
+
+
+def test_scan_message_cache_fetches_and_decodes_once():
+    """Test repeated lookups reuse the fetched message and decoded body."""
+    html = "<p>Thanks for applying</p>"
+    message = {
+        "id": "m1",
+        "payload": {"body": {"data": base64.urlsafe_b64encode(html.encode()).decode()}},
+    }
+    service = Mock()
+    get = service.users.return_value.messages.return_value.get
+    get.return_value.execute.return_value = message
+
+    cache = _ScanMessageCache(service)
+
+    assert cache.get("m1") is message
+    assert cache.body("m1") == html
+    assert cache.body("m1") == html
+    assert cache.get("m1") is message
+    get.assert_called_once_with(userId="me", id="m1", format="full")
+
+
+def _encode(text):
+    return base64.urlsafe_b64encode(text.encode()).decode()
+
+
+def test_get_email_body_returns_first_html_part_depth_first():
+    """Test nested multiparts are searched in order before later siblings."""
+    payload = {
+        "mimeType": "multipart/mixed",
+        "body": {"size": 0},
+        "parts": [
+            {"mimeType": "text/plain", "body": {"data": _encode("plain")}},
+            {
+                "mimeType": "multipart/alternative",
+                "body": {"size": 0},
+                "parts": [{"mimeType": "text/html", "body": {"data": _encode("<p>nested</p>")}}],
+            },
+            {"mimeType": "text/html", "body": {"data": _encode("<p>later</p>")}},
+        ],
+    }
+
+    assert get_email_body(payload) == "<p>nested</p>"
+    assert get_email_body({"mimeType": "multipart/mixed", "parts": []}) == ""
+
+
+def test_get_email_body_replaces_invalid_utf8():
+    """Test undecodable bytes do not abort the scan."""
+    data = base64.urlsafe_b64encode(b"caf\xe9").decode()
+
+    assert get_email_body({"mimeType": "text/html", "body": {"data": data}}) == "caf�"
+
+
+def test_gmail_service_is_built_once_across_threads(monkeypatch):
+    """Test concurrent first calls share one client and one authenticated service."""
+    import threading
+    import app.email.client as client_module
+
+    builds = []
+
+    def slow_build(*args, **kwargs):
+        time.sleep(0.05)
+        builds.append(args)
+        return object()
+
+    monkeypatch.setattr(client_module, "_client", None)
+    monkeypatch.setattr(client_module.GmailClient, "_authenticate", lambda self: None)
+    monkeypatch.setattr(client_module, "build", slow_build)
+
+    services = []
+    threads = [
+        threading.Thread(target=lambda: services.append(client_module.get_gmail_service()))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert len({id(service) for service in services}) == 1
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that answers each request immediately."""
+
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append(request_id)
+
+    def execute(self):
+        self.service.batches.append(self.requests)
+        for msg_id in self.requests:
+            if msg_id == "bad":
+                self.callback(msg_id, None, RuntimeError("not found"))
+            else:
+                self.callback(msg_id, {"id": msg_id}, None)
+
+
+def test_get_messages_batch_chunks_requests_and_skips_failures():
+    """Test messages are fetched in batches and failed requests are left out."""
+    from app.email.client import MAX_BATCH_REQUESTS, get_messages_batch
+
+    service = Mock()
+    service.batches = []
+    service.new_batch_http_request.side_effect = lambda callback: FakeBatch(service, callback)
+    msg_ids = [f"m{i}" for i in range(MAX_BATCH_REQUESTS + 1)] + ["bad", "m0"]
+
+    messages = get_messages_batch(service, msg_ids)
+
+    assert [len(batch) for batch in service.batches] == [MAX_BATCH_REQUESTS, 2]
+    assert len(messages) == MAX_BATCH_REQUESTS + 1
+    assert "bad" not in messages
+    assert messages["m0"] == {"id": "m0"}
+
+
+def test_scan_message_cache_prefetch_uses_batches():
+    """Test prefetched messages are served without individual requests."""
+    service = Mock()
+    service.batches = []
+    service.new_batch_http_request.side_effect = lambda callback: FakeBatch(service, callback)
+    get = service.users.return_value.messages.return_value.get
+    get.return_value.execute.return_value = {"id": "bad"}
+
+    cache = _ScanMessageCache(service)
+    cache.prefetch(["m1", "bad"])
+    cache.prefetch(["m1"])
+
+    assert cache.get("m1") == {"id": "m1"}
+    assert service.batches == [["m1", "bad"]]
+    get.return_value.execute.assert_not_called()
+    assert cache.get("bad") == {"id": "bad"}
+    get.return_value.execute.assert_called_once()
+
+
+def test_gmail_credentials_are_loaded_once(tmp_path, monkeypatch):
+    """Test a new client reuses valid credentials instead of re-reading token.json."""
+    import app.email.client as client_module
+
+    token_file = tmp_path / "token.json"
+    token_file.write_text("{}")
+    loads = []
+
+    def from_file(path, scopes):
+        loads.append(path)
+        return Mock(valid=True)
+
+    monkeypatch.setattr(client_module, "_creds_cache", {})
+    monkeypatch.setattr(client_module.Credentials, "from_authorized_user_file", from_file)
+
+    first = client_module.GmailClient(token_file=token_file)
+    first._authenticate()
+    second = client_module.GmailClient(token_file=token_file)
+    second._authenticate()
+
+    assert len(loads) == 1
+    assert second._creds is first._creds
+
+
+class FakeListRequest:
+    """Unexecuted request that records which HTTP object it was sent through."""
+
+    def __init__(self, name, credentials=None):
+        self.name = name
+        self.http = Mock(credentials=credentials) if credentials else None
+        self.sent_with = None
+
+    def execute(self, http=None):
+        self.sent_with = http
+        time.sleep(0.01)
+        if self.name == "bad":
+            raise RuntimeError("quota")
+        return {"messages": [{"id": self.name}]}
+
+
+def test_execute_concurrently_keeps_order_and_errors():
+    """Test responses line up with requests and a failure does not stop the others."""
+    from app.email.client import execute_concurrently
+
+    requests = [FakeListRequest(name) for name in ["a", "bad", "c", "d", "e", "f"]]
+
+    listed = execute_concurrently(requests)
+
+    assert listed[0] == ({"messages": [{"id": "a"}]}, None)
+    assert listed[1][0] is None and isinstance(listed[1][1], RuntimeError)
+    assert [response["messages"][0]["id"] for response, _ in listed[2:]] == ["c", "d", "e", "f"]
+
+
+def test_execute_concurrently_uses_a_connection_per_thread():
+    """Test authorized requests never share the service's HTTP connection."""
+    from app.email.client import execute_concurrently
+
+    credentials = Mock()
+    requests = [FakeListRequest(str(i), credentials) for i in range(4)]
+
+    execute_concurrently(requests)
+
+    for request in requests:
+        assert request.sent_with is not None and request.sent_with is not request.http
+        assert request.sent_with.credentials is credentials
+
+
+def test_execute_concurrently_reuses_worker_connections():
+    """Test later calls send through the HTTP connections the workers already built."""
+    from app.email.client import MAX_CONCURRENT_REQUESTS, execute_concurrently
+
+    credentials = Mock()
+    sent_with = []
+    for _ in range(3):
+        requests = [FakeListRequest(str(i), credentials) for i in range(MAX_CONCURRENT_REQUESTS)]
+        execute_concurrently(requests)
+        sent_with.extend(request.sent_with for request in requests)
+
+    assert len({id(http) for http in sent_with}) <= MAX_CONCURRENT_REQUESTS
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_classify_followup_email_priority(use_automaton, monkeypatch):
+    """Test the highest-priority email type wins, with and without pyahocorasick."""
+    import app.email.scanner as scanner
+
+    if use_automaton:
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(scanner, "_FOLLOWUP_AUTOMATON", None)
+
+    rejection = "Thanks for applying. Unfortunately we will not move on; next steps in your search"
+    assert scanner.classify_followup_email("Update", "", rejection) == "rejection"
+    assert scanner.classify_followup_email("Interview invite", "", "Please complete the quiz") == (
+        "assessment"
+    )
+    assert scanner.classify_followup_email("Thank you for applying", "", "") == "received"
+    assert scanner.classify_followup_email("Hello", "", "Nothing to see") == "update"
+
+
+def test_discovery_reuses_cached_metadata(tmp_path, monkeypatch):
+    """Test a rescan serves discovery candidates from email_metadata_cache."""
+    import app.database as database
+    import app.email.scanner as scanner
+
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "jobs.db")
+    database.init_db()
+
+    fetched = []
+
+    def fake_batch(service, msg_ids, format):
+        msg_ids = list(msg_ids)
+        fetched.extend(msg_ids)
+        headers = [
+            {"name": "Subject", "value": "Jobs for you"},
+            {"name": "From", "value": "Alerts <alerts@jobs.example.com>"},
+        ]
+        return {
+            msg_id: {
+                "internalDate": "1700000000000",
+                "snippet": "",
+                "payload": {"headers": headers},
+            }
+            for msg_id in msg_ids
+        }
+
+    monkeypatch.setattr(scanner, "get_messages_batch", fake_batch)
+    monkeypatch.setattr(
+        scanner,
+        "execute_concurrently",
+        lambda requests: [({"messages": [{"id": "m1"}]}, None) for _ in requests],
+    )
+
+    first = scanner._phase3_discover_sources(Mock(), "2024/01/01", [], set())
+    second = scanner._phase3_discover_sources(Mock(), "2024/01/01", [], set())
+
+    assert fetched == ["m1"]
+    assert first["discovered"]["alerts@jobs.example.com"]["sample_subjects"] == ["Jobs for you"]
+    assert second["discovered"] == first["discovered"]
+
+
+def test_applied_job_matcher_matches_like_fuzzy_match_company():
+    """Test exact, substring and alias matches, and jobs added mid-scan."""
+    import sqlite3
+    from app.email.scanner import _AppliedJobMatcher, fuzzy_match_company
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE jobs (job_id TEXT, company TEXT, status TEXT)")
+    conn.executemany(
+        "INSERT INTO jobs VALUES (?, ?, ?)",
+        [
+            ("j1", "Acme Robotics", "applied"),
+            ("j2", "Meta", "interviewing"),
+            ("j3", "Globex", "rejected"),
+            ("j4", None, "applied"),
+        ],
+    )
+
+    matcher = _AppliedJobMatcher(conn)
+
+    assert matcher.match("ACME ROBOTICS") == "j1"
+    assert matcher.match("Acme") == "j1"
+    assert matcher.match("Facebook Careers") == "j2"
+    assert matcher.match("Globex") is None
+    assert fuzzy_match_company("Facebook", conn) == "j2"
+
+    matcher.add("j5", "Globex")
+    assert matcher.match("Globex") == "j5"
+
+
+def test_followup_scan_checks_processed_ids_once(tmp_path, monkeypatch):
+    """Test overlapping follow-up searches share one processed_emails lookup."""
+    import app.database as database
+    import app.email.scanner as scanner
+
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "jobs.db")
+    database.init_db()
+    database.mark_email_processed("m1", "followup", "followup_scan")
+
+    lookups = []
+
+    def counting_filter(msg_ids):
+        msg_ids = list(msg_ids)
+        lookups.append(msg_ids)
+        return database.filter_unprocessed(msg_ids)
+
+    message = {
+        "internalDate": "1700000000000",
+        "snippet": "",
+        "payload": {"headers": [{"name": "Subject", "value": "Hello"}]},
+    }
+    message_cache = Mock(get=Mock(return_value=message), body=Mock(return_value=""))
+    monkeypatch.setattr(scanner, "filter_unprocessed", counting_filter)
+    monkeypatch.setattr(
+        scanner,
+        "execute_concurrently",
+        lambda requests: [({"messages": [{"id": "m1"}, {"id": "m2"}]}, None) for _ in requests],
+    )
+
+    result = scanner._phase2_followups(Mock(), "2024/01/01", [], set(), message_cache)
+
+    assert len(lookups) == 1
+    assert [followup["gmail_message_id"] for followup in result["followups"]] == ["m2"]
+
+
+def test_email_sources_reload_only_after_a_change(tmp_path, monkeypatch):
+    """Test sources and parsers are reused until custom_email_sources is written."""
+    import app.database as database
+    import app.email.scanner as scanner
+
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "jobs.db")
+    monkeypatch.setattr(scanner, "_sources_cache", None)
+    monkeypatch.setattr(scanner, "_source_parsers", {})
+    database.init_db()
+
+    resolved = []
+    monkeypatch.setattr(
+        scanner, "get_parser_for_source", lambda source: resolved.append(source["name"]) or Mock()
+    )
+
+    first = scanner._load_email_sources()
+    parser = scanner._get_source_parser(first[0])
+    second = scanner._load_email_sources()
+
+    assert second == first
+    assert scanner._get_source_parser(second[0]) is parser
+    assert len(resolved) == 1
+
+    with database.writer_connection() as conn:
+        conn.execute(
+            "UPDATE custom_email_sources SET enabled = 0, updated_at = ? WHERE id = ?",
+            ("2099-01-01T00:00:00", first[0]["id"]),
+        )
+
+    third = scanner._load_email_sources()
+
+    assert [source["id"] for source in third] == [source["id"] for source in first[1:]]
+    assert scanner._get_source_parser(third[0]) is not parser
+
+
+def test_email_sources_reload_after_an_older_timestamped_edit(tmp_path, monkeypatch):
+    """Test an edit stamped before the newest updated_at still invalidates the cache."""
+    import app.database as database
+    import app.email.scanner as scanner
+
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "jobs.db")
+    monkeypatch.setattr(scanner, "_sources_cache", None)
+    monkeypatch.setattr(scanner, "_source_parsers", {})
+    database.init_db()
+
+    first = scanner._load_email_sources()
+
+    # A local-time edit can sort below the UTC timestamps written at seeding
+    with database.writer_connection() as conn:
+        conn.execute(
+            "UPDATE custom_email_sources SET enabled = 0, updated_at = ? WHERE id = ?",
+            ("2000-01-01T00:00:00", first[0]["id"]),
+        )
+
+    second = scanner._load_email_sources()
+
+    assert [source["id"] for source in second] == [source["id"] for source in first[1:]]
+
+
+def test_looks_like_followup_prefers_job_alert_signals():
+    """Test follow-up signals only count when no job alert signal is present."""
+    from app.email.scanner import looks_like_followup
+
+    assert looks_like_followup("Interview invitation", "")
+    assert looks_like_followup("Hello", "We'd like to make you an OFFER")
+    assert not looks_like_followup("Job alert: interview coaching roles", "")
+    assert not looks_like_followup("Weekly digest", "Nothing new")
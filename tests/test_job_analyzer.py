@@ -0,0 +1,480 @@
+"""
+Tests for the rule-based job analyzer.
+
+These tests verify that job descriptions are turned into:
+- Experience requirements (skill + years)
+- Required / preferred skills
+- Tech stack overlap with a resume
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+SAMPLE_JOB_DESCRIPTION = """
+Senior Backend Engineer
+
+Required Qualifications:
+- 5+ years of Python experience, 3+ years of AWS.
+- 3-5 years of experience with Kubernetes, Docker.
+- Minimum 4 years of professional software development experience
+- Experience with PostgreSQL and Redis
+
+Preferred Qualifications:
+- Experience with GraphQL, React, TypeScript
+"""
+
+
+def test_extract_experience_requirements_basic():
+    """Test experience extraction finds skills with their year counts."""
+    from app.ai.job_analyzer import extract_experience_requirements
+
+    requirements = extract_experience_requirements(SAMPLE_JOB_DESCRIPTION)
+    by_skill = {r["skill"]: r for r in requirements}
+
+    assert by_skill["Python"]["years_min"] == 5
+    assert by_skill["AWS"]["years_min"] == 3
+
+
+def test_extract_experience_requirements_skill_first():
+    """Test 'skill (N years)' and 'skill: N years' phrasings."""
+    from app.ai.job_analyzer import extract_experience_requirements
+
+    requirements = extract_experience_requirements("Experience with Django (3+ years).")
+    assert [(r["skill"], r["years_min"]) for r in requirements] == [("Django", 3)]
+
+    requirements = extract_experience_requirements("Python: 4 years")
+    assert [(r["skill"], r["years_min"]) for r in requirements] == [("Python", 4)]
+
+
+def test_extract_experience_requirements_sorted_and_limited():
+    """Test requirements come back sorted by years (descending) and capped."""
+    from app.ai.job_analyzer import extract_experience_requirements
+
+    requirements = extract_experience_requirements(SAMPLE_JOB_DESCRIPTION)
+    years = [r["years_min"] for r in requirements]
+
+    assert years == sorted(years, reverse=True)
+    assert len(requirements) <= 15
+
+    assert extract_experience_requirements("") == []
+
+
+def test_skill_colon_years_scan_matches_regex():
+    """Test the anchor-first 'skill: N years' scanner finds exactly the regex's matches."""
+    from app.ai._job_analyzer_ext import SKILL_COLON_YEARS_PATTERN, _scan_skill_colon_years
+
+    texts = [
+        "python: 3 years, go - 2+ yrs and aws:4 years",
+        ":3 years: 4 years",
+        "2019: 3 years",
+        "x" * 80 + ": 5 years",
+        "skills - none; java: ten years; c++ -  7yr",
+        SAMPLE_JOB_DESCRIPTION.lower(),
+    ]
+    for text in texts:
+        expected = [(m.groups(), m.group(0)) for m in SKILL_COLON_YEARS_PATTERN.finditer(text)]
+        assert list(_scan_skill_colon_years(text)) == expected, text
+
+
+def test_extract_all_skills_from_text():
+    """Test skill extraction is case-insensitive and word-boundary aware for short skills."""
+    from app.ai.job_analyzer import extract_all_skills_from_text
+
+    skills = extract_all_skills_from_text("Python, GO and Kubernetes on AWS")
+    assert "python" in skills["languages"]
+    assert "go" in skills["languages"]
+    assert "kubernetes" in skills["devops"]
+    assert "aws" in skills["cloud"]
+
+    # "go" inside another word should not count as the Go language
+    assert "go" not in extract_all_skills_from_text("google docs").get("languages", [])
+
+    assert extract_all_skills_from_text("") == {}
+    assert extract_all_skills_from_text("x") == {}
+
+
+def test_extract_all_skills_flat_matches_categorized_scan(sample_resume_text):
+    """Test the flat skill iterator yields the categorized skills in the same order."""
+    from app.ai.job_analyzer import extract_all_skills_flat, extract_all_skills_from_text
+
+    categorized = extract_all_skills_from_text(sample_resume_text)
+
+    assert list(extract_all_skills_flat(sample_resume_text)) == [
+        skill for skills in categorized.values() for skill in skills
+    ]
+    assert list(extract_all_skills_flat("")) == []
+
+
+def test_analyze_job_text_matches_individual_functions(sample_resume_text):
+    """Test the single-pass analysis returns the same results as the separate functions."""
+    from app.ai.job_analyzer import (
+        analyze_job_text,
+        analyze_job_fit,
+        create_tech_stack_overlap,
+        extract_experience_requirements,
+        extract_required_skills,
+    )
+
+    result = analyze_job_text(SAMPLE_JOB_DESCRIPTION, sample_resume_text)
+    experience_requirements = extract_experience_requirements(SAMPLE_JOB_DESCRIPTION)
+
+    assert result["experience_requirements"] == experience_requirements
+    assert result["skills"] == extract_required_skills(SAMPLE_JOB_DESCRIPTION)
+    assert result["tech_stack_overlap"] == create_tech_stack_overlap(
+        SAMPLE_JOB_DESCRIPTION, sample_resume_text
+    )
+    assert result["fit"] == analyze_job_fit(
+        SAMPLE_JOB_DESCRIPTION, sample_resume_text, experience_requirements=experience_requirements
+    )
+
+
+def test_extract_all_skills_automaton_matches_fallback(monkeypatch, sample_resume_text):
+    """Test the Aho-Corasick skill scan agrees with the per-skill fallback scan."""
+    pytest.importorskip("ahocorasick")
+    import app.ai.job_analyzer as job_analyzer
+
+    texts = [
+        SAMPLE_JOB_DESCRIPTION,
+        sample_resume_text,
+        "C++, c#, .NET and Go; golang, gin_x, s3://bucket, ec2-instance, r&d, R",
+    ]
+    monkeypatch.setattr(job_analyzer, "_SKILL_DATABASE", None)
+    job_analyzer._scan_skills.cache_clear()
+    fast = [job_analyzer.extract_all_skills_from_text(text) for text in texts]
+
+    monkeypatch.setattr(job_analyzer, "_SKILL_AUTOMATON", None)
+    job_analyzer._scan_skills.cache_clear()
+    slow = [job_analyzer.extract_all_skills_from_text(text) for text in texts]
+    job_analyzer._scan_skills.cache_clear()
+
+    assert fast == slow
+
+
+def test_create_tech_stack_overlap():
+    """Test overlap splits skills into matched/missing/extra in a stable order."""
+    from app.ai.job_analyzer import create_tech_stack_overlap
+
+    overlap = create_tech_stack_overlap(
+        "Python, Go, AWS and Kubernetes", "Python and AWS with Docker and Kubernetes"
+    )
+
+    assert overlap["matched"] == {
+        "languages": ["python"],
+        "cloud": ["aws"],
+        "devops": ["kubernetes"],
+    }
+    assert overlap["missing"] == {"languages": ["go"]}
+    assert overlap["extra"] == {"devops": ["docker"]}
+    assert overlap["match_percentage"] == 75
+    assert overlap["summary"]["top_matched"] == ["python", "aws", "kubernetes"]
+
+
+def test_extract_all_skills_from_text_returns_fresh_lists():
+    """Test cached skill scans cannot be corrupted by callers mutating the result."""
+    from app.ai.job_analyzer import extract_all_skills_from_text
+
+    first = extract_all_skills_from_text("Python and React")
+    first["languages"].append("cobol")
+
+    second = extract_all_skills_from_text("Python and React")
+    assert second["languages"] == ["python"]
+
+
+def test_experience_extraction_handles_long_unpunctuated_text():
+    """Test a long run of text without punctuation doesn't blow up the experience regexes."""
+    from app.ai.job_analyzer import (
+        extract_experience_requirements,
+        extract_structured_requirements,
+    )
+
+    text = "5 years of " + "distributed systems " * 1000
+
+    assert isinstance(extract_experience_requirements(text), list)
+    assert isinstance(extract_structured_requirements(text)["experience"], list)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "years " * 3000,
+        "experience with" * 3000,
+        "required:" * 3000,
+        "responsibilities" * 3000,
+        "5 years " + "a-" * 8000,
+        "$100" * 3000,
+    ],
+)
+def test_analyzer_regexes_stay_linear_on_adversarial_text(text):
+    """Test repeated trigger words can't make the analyzer regexes backtrack catastrophically."""
+    import time
+    from app.ai.job_analyzer import analyze_job_comprehensive
+
+    start = time.perf_counter()
+    analyze_job_comprehensive(text, "Python developer", job_title="Engineer", company="Acme")
+
+    # Linear scans finish in milliseconds; quadratic backtracking here takes minutes
+    assert time.perf_counter() - start < 5
+
+
+def test_match_requirements_short_skills_need_whole_words():
+    """Test short required skills like 'R' or 'Go' aren't matched inside other words."""
+    from app.ai.job_analyzer import match_requirements_to_resume
+
+    requirements = {"skills_required": ["R", "GO", "Python", "Widgetry"]}
+    resume = "Python developer at Google working on widgetry for our reporting stack"
+
+    result = match_requirements_to_resume(requirements, resume)
+    matched = {m["description"] for m in result["matched"]}
+
+    assert matched == {"Python", "Widgetry"}
+
+
+def test_extract_all_skills_hyperscan_matches_fallback(monkeypatch, sample_resume_text):
+    """Test the Hyperscan skill scan agrees with the per-skill fallback scan."""
+    pytest.importorskip("hyperscan")
+    import app.ai.job_analyzer as job_analyzer
+
+    texts = [
+        SAMPLE_JOB_DESCRIPTION,
+        sample_resume_text,
+        "C++, c#, .NET and Go; golang, gin_x, s3://bucket, ec2-instance, r&d, R",
+        "Café go, ägo, goé, naïve R; résumé in go",
+    ]
+    job_analyzer._scan_skills.cache_clear()
+    fast = [job_analyzer.extract_all_skills_from_text(text) for text in texts]
+
+    monkeypatch.setattr(job_analyzer, "_SKILL_DATABASE", None)
+    monkeypatch.setattr(job_analyzer, "_SKILL_AUTOMATON", None)
+    job_analyzer._scan_skills.cache_clear()
+    slow = [job_analyzer.extract_all_skills_from_text(text) for text in texts]
+    job_analyzer._scan_skills.cache_clear()
+
+    assert fast == slow
+
+
+@pytest.mark.parametrize("backend", ["hyperscan", "ahocorasick", "regex"])
+def test_extract_all_skills_same_result_for_every_backend(monkeypatch, backend):
+    """Test each skill scan backend, including the regex fallback, finds the same skills."""
+    import app.ai.job_analyzer as job_analyzer
+
+    if backend == "hyperscan":
+        pytest.importorskip("hyperscan")
+    else:
+        monkeypatch.setattr(job_analyzer, "_SKILL_DATABASE", None)
+        if backend == "ahocorasick":
+            pytest.importorskip("ahocorasick")
+        else:
+            monkeypatch.setattr(job_analyzer, "_SKILL_AUTOMATON", None)
+
+    text = (
+        "Senior Backend Engineer: Python, Django, PostgreSQL and AWS (EC2, S3). "
+        "Go or R a plus; .NET, Kubernetes, Docker. golang gin_x r&d"
+    )
+    job_analyzer._scan_skills.cache_clear()
+    try:
+        skills = job_analyzer.extract_all_skills_from_text(text)
+    finally:
+        job_analyzer._scan_skills.cache_clear()
+
+    assert skills == {
+        "languages": ["python", "go", "golang", "r"],
+        "backend": ["django", ".net"],
+        "cloud": ["aws", "ec2", "s3"],
+        "devops": ["kubernetes", "docker"],
+        "databases": ["postgresql", "postgres"],
+    }
+
+
+def test_skills_in_span_matches_rescanning_the_span():
+    """Test locating skills in a section span agrees with scanning the section text."""
+    from app.ai.job_analyzer import _skills_in_span, extract_all_skills_from_text
+
+    text = "required: python, go and k8s; nice to have: rust, aws. sql\ngopython"
+    all_skills = extract_all_skills_from_text(text)
+    # "go" is only a whole word once the span edge cuts it off from "python"
+    edge = text.index("gopython")
+
+    for start, end in [(0, len(text)), (10, 28), (10, 40), (44, 53), (edge, edge + 2), (5, 5)]:
+        assert _skills_in_span(text, all_skills, start, end) == extract_all_skills_from_text(
+            text[start:end]
+        ), text[start:end]
+    assert _skills_in_span(text, all_skills, edge, edge + 2) == {"languages": ["go"]}
+
+
+def test_structured_requirements_cert_required_from_context():
+    """Test certifications are marked required only when nearby text says so."""
+    from app.ai.job_analyzer import extract_structured_requirements
+
+    text = "CISSP certification is required. " + "Filler text. " * 20 + "PMP is a plus."
+    certs = {
+        c["name"]: c["required"] for c in extract_structured_requirements(text)["certifications"]
+    }
+
+    assert certs == {"CISSP": True, "PMP": False}
+
+
+def test_analyze_job_fit_automaton_matches_fallback(monkeypatch, sample_resume_text):
+    """Test the Aho-Corasick fit skill scan agrees with per-skill substring checks."""
+    pytest.importorskip("ahocorasick")
+    import app.ai.job_analyzer as job_analyzer
+
+    fast = job_analyzer.analyze_job_fit(SAMPLE_JOB_DESCRIPTION, sample_resume_text)
+
+    monkeypatch.setattr(job_analyzer, "_FIT_SKILL_AUTOMATON", None)
+    slow = job_analyzer.analyze_job_fit(SAMPLE_JOB_DESCRIPTION, sample_resume_text)
+
+    assert fast == slow
+    assert fast["match_score"] > 0
+
+
+def test_fit_skill_counts_match_str_count():
+    """Test fit skill counts from the automaton pass agree with str.count."""
+    from app.ai.job_analyzer import _FIT_SKILLS, _fit_skill_counts
+
+    text = "typescriptypescript, php phphp and python; python 3 with go and golang"
+    expected = {skill: text.count(skill) for skill in _FIT_SKILLS if skill in text}
+
+    assert _fit_skill_counts(text) == expected
+    assert expected["typescript"] == 1
+
+
+def test_detect_red_flags_hyperscan_matches_fallback(monkeypatch):
+    """Test the single-scan red flag check agrees with the per-pattern searches."""
+    pytest.importorskip("hyperscan")
+    import app.ai.job_analyzer as job_analyzer
+
+    texts = [
+        SAMPLE_JOB_DESCRIPTION,
+        "Urgent hiring! Be your own boss with unlimited earning. Work from home $5k.",
+        "We're like a family in a fast-paced environment; expect 50-60 hours, rockstars.",
+        "Not a 9-to-5 role\x1cwear many hats",
+    ]
+    job_analyzer._red_flags_pickle.cache_clear()
+    fast = [job_analyzer.detect_red_flags(text, "Engineer", "Acme") for text in texts]
+
+    monkeypatch.setattr(job_analyzer, "_RED_FLAG_DATABASE", None)
+    job_analyzer._red_flags_pickle.cache_clear()
+    slow = [job_analyzer.detect_red_flags(text, "Engineer", "Acme") for text in texts]
+    job_analyzer._red_flags_pickle.cache_clear()
+
+    assert fast == slow
+    assert any(flag["flag"] == "Potential scam indicator" for flag in fast[1])
+
+
+def test_structured_requirements_cache_returns_fresh_results():
+    """Test cached requirement extraction cannot be corrupted by callers mutating the result."""
+    from app.ai.job_analyzer import detect_red_flags, extract_structured_requirements
+
+    first = extract_structured_requirements(SAMPLE_JOB_DESCRIPTION)
+    first["skills_required"].append("COBOL")
+    first["experience"].clear()
+
+    second = extract_structured_requirements(SAMPLE_JOB_DESCRIPTION)
+    assert "COBOL" not in second["skills_required"]
+    assert second["experience"]
+
+    flags = detect_red_flags("Urgent hiring now", "Engineer", "")
+    flags.append({"flag": "extra"})
+    assert {"flag": "extra"} not in detect_red_flags("Urgent hiring now", "Engineer", "")
+
+
+def test_analyze_job_comprehensive_matches_each_resume_once(monkeypatch, sample_resume_text):
+    """Test the resume recommendation reuses the match already computed for resume_text."""
+    import app.ai.job_analyzer as job_analyzer
+
+    matched_texts = []
+    original = job_analyzer._match_requirements_to_lowered_resume
+
+    def counting_match(requirements, resume_text, resume_lower):
+        matched_texts.append(resume_text)
+        return original(requirements, resume_text, resume_lower)
+
+    monkeypatch.setattr(job_analyzer, "_match_requirements_to_lowered_resume", counting_match)
+    other_resume = "Java and Spring developer"
+    result = job_analyzer.analyze_job_comprehensive(
+        SAMPLE_JOB_DESCRIPTION,
+        sample_resume_text,
+        all_resumes=[
+            {"resume_id": 1, "name": "Full-Stack", "content": sample_resume_text},
+            {"resume_id": 2, "name": "Backend", "content": other_resume},
+        ],
+    )
+
+    assert matched_texts == [sample_resume_text, other_resume]
+    assert result["resume_recommendation"]["resume_id"] == 1
+
+
+def test_loads_json_matches_stdlib(monkeypatch):
+    """Test AI response parsing gives json.loads results with or without orjson."""
+    import json
+    import math
+
+    import app.ai.job_analyzer as job_analyzer
+
+    text = '{"match_percentage": 72, "pros": [{"title": "Python"}], "score": NaN}'
+    parsed = job_analyzer._loads_json(text)
+    assert parsed["pros"] == json.loads(text)["pros"]
+    assert math.isnan(parsed["score"])
+
+    monkeypatch.setattr(job_analyzer, "orjson", None)
+    with pytest.raises(json.JSONDecodeError):
+        job_analyzer._loads_json('{"match_percentage": ')
+
+
+def test_match_resumes_matches_each_text_once(monkeypatch, sample_resume_text):
+    """Test duplicate and empty resume texts are not matched again."""
+    import app.ai.job_analyzer as job_analyzer
+
+    requirements = job_analyzer.extract_structured_requirements(SAMPLE_JOB_DESCRIPTION)
+    resumes = [sample_resume_text, "Java and Spring developer", "", sample_resume_text]
+
+    matched = []
+    real_match = job_analyzer.match_requirements_to_resume
+    monkeypatch.setattr(
+        job_analyzer,
+        "match_requirements_to_resume",
+        lambda reqs, text: matched.append(text) or real_match(reqs, text),
+    )
+
+    matches = {}
+    job_analyzer._match_resumes(requirements, resumes, matches)
+
+    assert matched == [sample_resume_text, "Java and Spring developer"]
+    assert matches[sample_resume_text] == real_match(requirements, sample_resume_text)
+
+
+def test_detect_red_flags_low_salary_for_senior_title():
+    """Test the salary check reads "$85,000" and "$90k" as full dollar amounts."""
+    from app.ai.job_analyzer import detect_red_flags
+
+    def salary_reasons(description, title):
+        return [
+            f["reason"]
+            for f in detect_red_flags(description, title, "Acme")
+            if f["flag"] == "Low salary for level"
+        ]
+
+    assert salary_reasons("Pay: $85,000 per year", "Senior Engineer") == [
+        "$85,000 seems low for a senior role"
+    ]
+    assert salary_reasons("Pay: $90k base", "Senior Engineer") == [
+        "$90,000 seems low for a senior role"
+    ]
+    assert salary_reasons("Pay: $150,000 per year", "Senior Engineer") == []
+    assert salary_reasons("Pay: $85,000 per year", "Engineer") == []
+
+
+def test_extract_json_blob_finds_first_balanced_object():
+    """Test JSON extraction skips braces inside strings and ignores trailing text."""
+    from app.ai.job_analyzer import _extract_json_blob
+
+    response = 'Here you go: {"pros": [{"title": "Go {lang}"}], "note": "\\"}"} Thanks {user}!'
+    assert _extract_json_blob(response) == ('{"pros": [{"title": "Go {lang}"}], "note": "\\"}"}')
+    assert _extract_json_blob("no json here") is None
+    assert _extract_json_blob('{"truncated": [1, 2') is None
+    assert _extract_json_blob("{" * 20000) is None